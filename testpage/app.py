@@ -5,8 +5,26 @@ import time
 from datetime import datetime
 
 from integrations import google_forms, reporting, storage
-from src.analytics import qualitative, quantitative
+from src.analytics import SnapshotMemo, build_benchmark_index, qualitative, quantitative
 from src.etl.survey import classify_questions
+from src.storage import ResponseFingerprintIndex, StorageRepository
+
+
+class StorageClientDriver:
+    """TabularDriver view of the app's storage client for the responses table."""
+
+    def __init__(self, client) -> None:
+        self.client = client
+
+    def read_table(self, table_name: str, columns) -> pd.DataFrame:
+        return self.client.load_responses().reindex(columns=list(columns))
+
+    def write_table(self, table_name: str, columns, data: pd.DataFrame) -> None:
+        self.client.save_responses(data.reindex(columns=list(columns)))
+
+    def append_rows(self, table_name: str, columns, data: pd.DataFrame) -> None:
+        self.client.append_responses(data.reindex(columns=list(columns)))
+
 
 # --- 1. 페이지 및 스타일 설정 ---
 st.set_page_config(
@@ -71,6 +89,14 @@ if "survey_info_df" not in st.session_state:
     st.session_state.survey_info_df = st.session_state.storage_client.load_survey_info()
 if "responses_df" not in st.session_state:
     st.session_state.responses_df = st.session_state.storage_client.load_responses()
+if "response_repository" not in st.session_state:
+    # Uploads go through fingerprint-based ingest, so re-uploading an export only adds new or changed rows.
+    st.session_state.response_repository = StorageRepository(
+        driver=StorageClientDriver(st.session_state.storage_client),
+        fingerprint_index=ResponseFingerprintIndex(".cache/response_fingerprints"),
+    )
+if "snapshot_memo" not in st.session_state:
+    st.session_state.snapshot_memo = SnapshotMemo()
 if 'gemini_result' not in st.session_state:
     st.session_state.gemini_result = None
 if "report_summary_lines" not in st.session_state:
@@ -89,6 +115,10 @@ def refresh_storage_cache() -> None:
     st.session_state.responses_df = st.session_state.storage_client.load_responses()
 
 
+def ingest_message(report) -> str:
+    return f"신규 {report.inserted}건 적재, 변경 {report.updated}건 갱신, 중복 {report.skipped}건 건너뜀"
+
+
 def question_bank_records() -> list[dict]:
     if st.session_state.question_bank_df.empty:
         return []
@@ -262,9 +292,9 @@ elif "2." in menu:
                     st.error(f"필수 컬럼 누락: {', '.join(sorted(missing))}")
                 else:
                     standardized = storage.standardize_responses(incoming)
-                    st.session_state.storage_client.append_responses(standardized)
+                    report = st.session_state.response_repository.ingest_responses(standardized)
                     refresh_storage_cache()
-                    st.success(f"{len(incoming)}건의 응답이 responses에 적재되었습니다.")
+                    st.success(f"responses 적재 완료: {ingest_message(report)}")
 
             st.markdown("**Sheets 연결 (시뮬레이션)**")
             sheets_url = st.text_input("Google Sheets URL", placeholder="https://docs.google.com/spreadsheets/...")
@@ -283,11 +313,11 @@ elif "2." in menu:
                         "answer_value": 4,
                     },
                 ])
-                st.session_state.storage_client.append_responses(
+                report = st.session_state.response_repository.ingest_responses(
                     storage.standardize_responses(simulated)
                 )
                 refresh_storage_cache()
-                st.success("Sheets 연결 완료: 2건의 샘플 응답이 적재되었습니다.")
+                st.success(f"Sheets 연결 완료: {ingest_message(report)}")
 
             if not st.session_state.responses_df.empty:
                 st.markdown("**현재 responses 데이터**")
@@ -447,19 +477,34 @@ elif "3." in menu:
             if "round" not in analysis_metadata.columns:
                 analysis_metadata["round"] = "1차"
 
-        quant_snapshot = quantitative.build_quantitative_snapshot(
-            filtered_responses,
-            question_bank=st.session_state.question_bank_df,
-            metadata=analysis_metadata,
-        )
+        if selected_survey_id:
+            # Reruns with unchanged data are served from the memo.
+            quant_snapshot = st.session_state.snapshot_memo.build_quantitative_snapshot(
+                st.session_state.responses_df,
+                survey_id=selected_survey_id,
+                question_bank=st.session_state.question_bank_df,
+                metadata=analysis_metadata,
+            )
+            nps_df = st.session_state.snapshot_memo.calculate_nps(
+                st.session_state.responses_df,
+                survey_id=selected_survey_id,
+                question_bank=st.session_state.question_bank_df,
+                group_cols=[],
+            )
+        else:
+            quant_snapshot = quantitative.build_quantitative_snapshot(
+                filtered_responses,
+                question_bank=st.session_state.question_bank_df,
+                metadata=analysis_metadata,
+            )
+            nps_df = quantitative.calculate_nps(
+                filtered_responses,
+                question_bank=st.session_state.question_bank_df,
+                group_cols=[],
+            )
         overall_df = quant_snapshot["overall"]
         overall_avg = float(overall_df["mean_score"].iloc[0]) if not overall_df.empty else 0.0
         respondent_count = filtered_responses["respondent_id"].nunique()
-        nps_df = quantitative.calculate_nps(
-            filtered_responses,
-            question_bank=st.session_state.question_bank_df,
-            group_cols=[],
-        )
         overall_nps = float(nps_df["nps"].iloc[0]) if not nps_df.empty else 0.0
 
         st.session_state.report_summary_lines = [
@@ -474,6 +519,33 @@ elif "3." in menu:
         m3.metric("NPS", f"{overall_nps:.0f}점")
         m4.metric("응답률", "94%")
 
+        if selected_survey_id:
+            # Rebuilt only when responses or metadata change; lookups are binary searches.
+            memo = st.session_state.snapshot_memo
+            benchmark = memo.get_or_compute(
+                memo.key("benchmark", st.session_state.responses_df, st.session_state.question_bank_df, analysis_metadata),
+                lambda: build_benchmark_index(
+                    st.session_state.responses_df,
+                    analysis_metadata,
+                    question_bank=st.session_state.question_bank_df,
+                ),
+            )
+            survey_row = analysis_metadata[analysis_metadata["survey_id"] == selected_survey_id].iloc[0]
+            badges = []
+            for dimension, label in (("course_name", "과정"), ("instructor_name", "강사")):
+                share = benchmark.top_share(dimension, survey_row[dimension])
+                if not pd.isna(share):
+                    # Clamped: the best of more than 200 entities would round to "상위 0%".
+                    badges.append(f'<span class="badge-sim">{label} 만족도 전체 상위 {max(share, 1):.0f}%</span>')
+            if "category" in analysis_metadata.columns and not pd.isna(survey_row["category"]):
+                share = benchmark.top_share("course_name", survey_row["course_name"], category=survey_row["category"])
+                if not pd.isna(share):
+                    badges.append(
+                        f'<span class="badge-exist">{survey_row["category"]} 과정 중 상위 {max(share, 1):.0f}%</span>'
+                    )
+            if badges:
+                st.markdown(" ".join(badges), unsafe_allow_html=True)
+
         st.markdown("##### 📌 과정별 만족도 비교")
         course_df = quant_snapshot["by_course"].rename(
             columns={"course_name": "과정명", "mean_score": "만족도"}
@@ -0,0 +1,23 @@
+"""Shared setup for the benchmark scripts."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+# Import the app's packages the way app.py does, plus the reference copies in tests/.
+sys.path[:0] = [str(ROOT), str(ROOT / "tests")]
+
+
+def best_of(function: Callable[[], object], repeat: int = 3) -> tuple[float, object]:
+    """Best wall-clock seconds over ``repeat`` calls and the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
@@ -0,0 +1,47 @@
+"""bootstrap_confidence_intervals with 1,000 resamples over 10k instructor groups."""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from _common import best_of
+
+from src.analytics import bootstrap_confidence_intervals, calculate_nps, calculate_satisfaction
+
+GROUPS = 10_000
+ROWS = 300_000
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    responses = pd.DataFrame(
+        {
+            "instructor_name": [f"I{i:05d}" for i in rng.integers(0, GROUPS, ROWS)],
+            "question_id": np.where(rng.random(ROWS) < 0.3, "QN", "Q1"),
+            "answer_value": rng.integers(0, 11, ROWS).astype(str),
+        }
+    )
+    group_cols = ["instructor_name"]
+    for statistic, options, expected in (
+        ("mean", {}, calculate_satisfaction(responses, group_cols=group_cols)["mean_score"]),
+        ("nps", {"nps_question_ids": ["QN"]}, calculate_nps(responses, group_cols=group_cols, nps_question_ids=["QN"])["nps"]),
+    ):
+        seconds, intervals = best_of(
+            lambda: bootstrap_confidence_intervals(responses, group_cols=group_cols, statistic=statistic, **options),
+            repeat=2,
+        )
+        np.testing.assert_allclose(intervals["estimate"], expected.to_numpy(float))
+        print(f"{statistic:<5} groups: {len(intervals):,}  rows: {ROWS:,}  1,000 resamples: {seconds:.2f} s")
+
+    seconds, _ = best_of(
+        lambda: bootstrap_confidence_intervals(responses, group_cols=group_cols, workers=-1),
+        repeat=2,
+    )
+    print(f"mean  with a process pool ({os.cpu_count()} CPUs): {seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""CsvExportCache against a local HTTP stand-in for the Sheets CSV export."""
+
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from _common import best_of
+
+from src.etl import CsvExportCache, load_raw_survey_data
+
+ROWS = 200_000
+ETAG = '"export-v1"'
+
+
+def make_body() -> bytes:
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(
+        {
+            "과정명": [f"C{i}" for i in rng.integers(0, 100, ROWS)],
+            "강사명": [f"I{i}" for i in rng.integers(0, 30, ROWS)],
+            "점수": rng.integers(1, 11, ROWS),
+        }
+    )
+    return frame.to_csv(index=False).encode("utf-8")
+
+
+def serve(body: bytes) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.headers.get("If-None-Match") == ETAG:
+                self.send_response(304)
+                self.send_header("ETag", ETAG)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/csv; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    body = make_body()
+    server = serve(body)
+    url = f"http://127.0.0.1:{server.server_port}/export.csv"
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            uncached, _ = best_of(lambda: load_raw_survey_data(url))
+            fresh = CsvExportCache(directory, ttl=300)
+            started = time.perf_counter()
+            fresh.fetch(url)
+            download = time.perf_counter() - started
+            hit, _ = best_of(lambda: fresh.fetch(url), repeat=20)
+            revalidate, _ = best_of(lambda: CsvExportCache(directory, ttl=0).fetch(url), repeat=20)
+            cached_load, _ = best_of(lambda: load_raw_survey_data(url, http_cache=fresh))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"export: {len(body) / 2**20:.1f} MiB, {ROWS:,} rows")
+    print(f"load without cache:   {uncached * 1000:8.1f} ms")
+    print(f"cold download:        {download * 1000:8.1f} ms")
+    print(f"fresh hit (TTL):      {hit * 1000:8.3f} ms")
+    print(f"revalidation (304):   {revalidate * 1000:8.3f} ms")
+    print(f"load through cache:   {cached_load * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
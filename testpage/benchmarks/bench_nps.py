@@ -0,0 +1,39 @@
+"""calculate_nps over 1M rows in 10k course x instructor x round groups."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from _common import best_of
+
+from reference import quantitative as reference
+from src.analytics import calculate_nps
+
+ROWS = 1_000_000
+GROUP_COLS = ["course_name", "instructor_name", "round"]
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    responses = pd.DataFrame(
+        {
+            "question_id": "Q3",
+            "answer_value": rng.integers(0, 11, ROWS).astype(str),
+            "course_name": [f"C{i}" for i in rng.integers(0, 100, ROWS)],
+            "instructor_name": [f"I{i}" for i in rng.integers(0, 20, ROWS)],
+            "round": rng.integers(1, 6, ROWS),
+        }
+    )
+    reference_seconds, expected = best_of(lambda: reference.calculate_nps(responses, group_cols=GROUP_COLS), repeat=1)
+    seconds, actual = best_of(lambda: calculate_nps(responses, group_cols=GROUP_COLS))
+
+    assert len(actual) == len(expected)
+    np.testing.assert_allclose(actual["nps"].to_numpy(float), expected["nps"].to_numpy(float))
+    print(f"groups: {len(actual):,}  rows: {ROWS:,}")
+    print(f"reference: {reference_seconds:.2f} s")
+    print(f"current:   {seconds:.2f} s  ({reference_seconds / seconds:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Peak RSS of build_quantitative_snapshot over 1M responses.
+
+Each implementation runs in its own process. The peak is the process's resident
+high-water mark (VmHWM), reset once the input is built, so it counts every
+allocation including NumPy and Arrow buffers that tracemalloc would miss.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from _common import ROOT
+
+ROWS = 1_000_000
+SURVEYS = 3_000
+MODES = ("reference", "current", "prepared")
+
+
+def make_input() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(1)
+    answers = rng.integers(0, 11, ROWS).astype(str).astype(object)
+    answers[rng.random(ROWS) < 0.05] = "좋아요"
+    responses = pd.DataFrame(
+        {
+            "survey_id": [f"S{i}" for i in rng.integers(0, SURVEYS, ROWS)],
+            "respondent_id": [f"R{i}" for i in rng.integers(0, 5000, ROWS)],
+            "question_id": [f"Q{i}" for i in rng.integers(0, 20, ROWS)],
+            "answer_value": answers,
+        }
+    )
+    metadata = pd.DataFrame(
+        {
+            "survey_id": [f"S{i}" for i in range(SURVEYS)],
+            "course_name": [f"C{i % 30}" for i in range(SURVEYS)],
+            "instructor_name": [f"I{i % 13}" for i in range(SURVEYS)],
+            "round": [f"{i % 4 + 1}차" for i in range(SURVEYS)],
+        }
+    )
+    bank = pd.DataFrame({"id": [f"Q{i}" for i in range(20)], "category": ["NPS" if i in (3, 7) else "만족도" for i in range(20)]})
+    return responses, metadata, bank
+
+
+def rss_kib(field: str) -> int:
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith(field + ":"):
+            return int(line.split()[1])
+    raise RuntimeError(f"{field} not found in /proc/self/status")
+
+
+def measure(mode: str) -> None:
+    from reference import quantitative as reference
+    from src.analytics import build_quantitative_snapshot, prepare_responses
+
+    responses, metadata, bank = make_input()
+    input_mib = responses.memory_usage(deep=True).sum() / 2**20
+    # Writing 5 to clear_refs resets VmHWM to the current RSS (Linux 4.0+).
+    Path("/proc/self/clear_refs").write_text("5")
+    before = rss_kib("VmRSS")
+    if mode == "reference":
+        reference.build_quantitative_snapshot(responses, question_bank=bank, metadata=metadata)
+    elif mode == "current":
+        build_quantitative_snapshot(responses, question_bank=bank, metadata=metadata)
+    else:
+        prepared = prepare_responses(responses, question_bank=bank, metadata=metadata)
+        build_quantitative_snapshot(prepared, question_bank=bank)
+    extra_mib = (rss_kib("VmHWM") - before) / 1024
+    print(f"{mode:<10} input {input_mib:7.1f} MiB  peak extra RSS {extra_mib:7.1f} MiB  ({extra_mib / input_mib:.2f}x)")
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        measure(sys.argv[1])
+        return
+    for mode in MODES:
+        subprocess.run([sys.executable, __file__, mode], check=True, cwd=ROOT)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,50 @@
 """Analytics helpers for quantitative/qualitative insights."""
 
-from .quantitative import build_quantitative_snapshot, calculate_nps, calculate_satisfaction
+from .aggregates import ResponseAggregateStore
+from .benchmark import BenchmarkIndex, build_benchmark_index
+from .drivers import DriverAnalysis, ResponseMatrix, build_response_matrix, key_driver_analysis
+from .memo import SnapshotMemo
+from .prepared import PreparedResponses, prepare_responses
+from .quantitative import (
+    ScoreDistribution,
+    bootstrap_confidence_intervals,
+    build_quantitative_snapshot,
+    calculate_distributions,
+    calculate_nps,
+    calculate_satisfaction,
+    calculate_satisfaction_from_chunks,
+)
 from .qualitative import summarize_comments
+from .rollup import ScoreCube, build_score_cube
+from .significance import GroupStatistics, adjust_p_values, group_statistics, pairwise_significance
+from .sketches import GroupedQuantileSketch, QuantileSketch, build_quantile_sketches
 
 __all__ = [
+    "BenchmarkIndex",
+    "DriverAnalysis",
+    "GroupStatistics",
+    "GroupedQuantileSketch",
+    "PreparedResponses",
+    "QuantileSketch",
+    "ResponseAggregateStore",
+    "ResponseMatrix",
+    "ScoreCube",
+    "ScoreDistribution",
+    "SnapshotMemo",
+    "adjust_p_values",
+    "bootstrap_confidence_intervals",
+    "build_benchmark_index",
+    "build_quantile_sketches",
+    "build_score_cube",
     "build_quantitative_snapshot",
+    "build_response_matrix",
+    "calculate_distributions",
     "calculate_nps",
     "calculate_satisfaction",
+    "calculate_satisfaction_from_chunks",
+    "group_statistics",
+    "key_driver_analysis",
+    "pairwise_significance",
+    "prepare_responses",
     "summarize_comments",
 ]
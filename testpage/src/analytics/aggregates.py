@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from .rollup import CUBE_MEASURES, ScoreCube, build_score_cube
+from .sketches import DEFAULT_QUANTILES, GroupedQuantileSketch, build_quantile_sketches
+
+AGGREGATE_KEYS = ("survey_id", "question_id")
+_NPS_MEASURES = ("nps_total", "promoters", "passives", "detractors")
+
+
+class ResponseAggregateStore:
+    """Materialized score/NPS partial sums per (survey_id, question_id).
+
+    Appends add their partial sums to the stored cells and replacements rebuild
+    them, so snapshots are answered in O(cells) instead of O(rows). Course,
+    instructor and round are functions of survey_id, so they are joined from the
+    survey metadata when a cube is requested; editing metadata therefore never
+    invalidates the aggregates. NPS counts are kept for every question and
+    narrowed to the NPS questions at query time for the same reason.
+
+    With a ``path`` the cells are persisted as CSV after every write.
+    ``version`` changes on every write so memoized results can key on it.
+    With ``sketch_k`` a KLL quantile sketch is kept per cell as well (persisted
+    as JSON next to the CSV), so medians and percentiles can be answered
+    without reloading the responses.
+    """
+
+    def __init__(self, path: str | Path | None = None, *, sketch_k: int | None = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self.sketch_k = sketch_k
+        self._lock = threading.Lock()
+        self._instance = uuid.uuid4().hex
+        self._writes = 0
+        self._cells = _empty_cells()
+        self._sketches = GroupedQuantileSketch(AGGREGATE_KEYS, sketch_k) if sketch_k else None
+        if self.path is not None and self.path.exists():
+            self._cells = _read_cells(self.path)
+        if self._sketches is not None and self.sketch_path is not None and self.sketch_path.exists():
+            self._sketches = GroupedQuantileSketch.from_json(self.sketch_path.read_text(encoding="utf-8"))
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    @property
+    def version(self) -> str:
+        return f"{self._instance}:{self._writes}"
+
+    @property
+    def cells(self) -> pd.DataFrame:
+        return self._cells
+
+    @property
+    def sketch_path(self) -> Path | None:
+        return self.path.with_suffix(".sketches.json") if self.path is not None else None
+
+    @property
+    def sketches(self) -> GroupedQuantileSketch | None:
+        return self._sketches
+
+    @property
+    def survey_ids(self) -> list[str]:
+        return self._cells.index.get_level_values("survey_id").unique().tolist()
+
+    def add(self, rows: pd.DataFrame) -> None:
+        """Fold newly written response rows into the aggregates."""
+        partial = _partial_cells(rows)
+        if partial.empty:
+            return
+        sketches = self._partial_sketches(rows)
+        with self._lock:
+            combined = pd.concat([self._cells, partial]) if len(self._cells) else partial
+            self._cells = combined.groupby(level=list(AGGREGATE_KEYS), sort=True).sum()
+            if sketches is not None:
+                self._sketches.merge(sketches)
+            self._writes += 1
+            self._persist()
+
+    def rebuild(self, rows: pd.DataFrame) -> None:
+        """Recompute every aggregate from the full responses table."""
+        cells = _partial_cells(rows)
+        sketches = self._partial_sketches(rows)
+        with self._lock:
+            self._cells = cells if not cells.empty else _empty_cells()
+            if sketches is not None:
+                self._sketches = sketches
+            self._writes += 1
+            self._persist()
+
+    def drop_surveys(self, survey_ids: Iterable[str]) -> None:
+        dropped = {str(survey_id) for survey_id in survey_ids}
+        with self._lock:
+            keep = ~self._cells.index.get_level_values("survey_id").isin(dropped)
+            self._cells = self._cells[keep]
+            if self._sketches is not None:
+                self._sketches = self._sketches.filter(lambda key: key[0] not in dropped)
+            self._writes += 1
+            self._persist()
+
+    def subset(self, survey_ids: Iterable[str]) -> ResponseAggregateStore:
+        """In-memory store restricted to ``survey_ids``."""
+        wanted = {str(survey_id) for survey_id in survey_ids}
+        view = ResponseAggregateStore(sketch_k=self.sketch_k)
+        view._cells = self._cells[self._cells.index.get_level_values("survey_id").isin(wanted)]
+        if self._sketches is not None:
+            view._sketches = self._sketches.filter(lambda key: key[0] in wanted)
+        return view
+
+    def cube(
+        self,
+        metadata: pd.DataFrame | None = None,
+        *,
+        dimension_cols: Iterable[str] = ("course_name", "instructor_name", "round"),
+        join_key: str = "survey_id",
+        fill_value: str = "미지정",
+        nps_question_ids: Iterable[str] | None = None,
+    ) -> ScoreCube:
+        """ScoreCube over the metadata dimensions, built from the stored cells only."""
+        dimension_cols = tuple(dimension_cols)
+        cells = self._cells
+        survey_ids = cells.index.get_level_values("survey_id")
+        measures = cells.reset_index(drop=True)
+        if nps_question_ids is not None:
+            is_nps = cells.index.get_level_values("question_id").isin([str(qid) for qid in nps_question_ids])
+            for column in _NPS_MEASURES:
+                measures[column] = np.where(is_nps, measures[column].to_numpy(), 0)
+
+        # Dimensions are joined per cell; the first metadata row wins when a
+        # survey_id repeats.
+        keys = {}
+        table = None
+        if metadata is not None and not metadata.empty and join_key in metadata.columns:
+            table = metadata.drop_duplicates(join_key)
+            table = table.set_index(table[join_key].astype(str))
+        for col in dimension_cols:
+            if table is not None and col in table.columns:
+                values = table[col].reindex(survey_ids)
+                keys[col] = values.where(values.notna(), fill_value).to_numpy(dtype=object)
+            else:
+                keys[col] = np.full(len(cells), fill_value, dtype=object)
+
+        if not dimension_cols:
+            return ScoreCube(dimensions=(), cells=measures.sum().to_frame().T)
+        grouped = measures.groupby([pd.Series(keys[col], name=col) for col in dimension_cols], sort=True).sum()
+        return ScoreCube(dimensions=dimension_cols, cells=grouped[list(CUBE_MEASURES)])
+
+    def quantiles(
+        self,
+        metadata: pd.DataFrame | None = None,
+        *,
+        dimension_cols: Iterable[str] = ("course_name", "instructor_name", "round"),
+        join_key: str = "survey_id",
+        fill_value: str = "미지정",
+        question_ids: Iterable[str] | None = None,
+        q: Iterable[float] = DEFAULT_QUANTILES,
+    ) -> pd.DataFrame:
+        """Approximate score quantiles per metadata dimension from the cell sketches.
+
+        Cells are merged into the dimensions the same way ``cube`` joins them;
+        ``question_ids`` narrows the merge to those questions.
+        """
+        if self._sketches is None:
+            raise ValueError("Quantile sketches are disabled; create the store with sketch_k.")
+        dimension_cols = tuple(dimension_cols)
+        lookup: dict[str, tuple] = {}
+        if metadata is not None and not metadata.empty and join_key in metadata.columns:
+            table = metadata.drop_duplicates(join_key)
+            columns = [
+                table[col].where(table[col].notna(), fill_value).tolist()
+                if col in table.columns
+                else [fill_value] * len(table)
+                for col in dimension_cols
+            ]
+            lookup = dict(zip(table[join_key].astype(str), zip(*columns)))
+        fallback = (fill_value,) * len(dimension_cols)
+        sketches = self._sketches
+        if question_ids is not None:
+            wanted = {str(question_id) for question_id in question_ids}
+            sketches = sketches.filter(lambda key: key[1] in wanted)
+        regrouped = sketches.regroup(dimension_cols, lambda key: lookup.get(key[0], fallback))
+        return regrouped.quantiles(list(q))
+
+    def _partial_sketches(self, rows: pd.DataFrame) -> GroupedQuantileSketch | None:
+        if self.sketch_k is None:
+            return None
+        if rows.empty or any(col not in rows.columns for col in AGGREGATE_KEYS):
+            return GroupedQuantileSketch(AGGREGATE_KEYS, self.sketch_k)
+        keyed = pd.DataFrame({col: rows[col].astype(str) for col in AGGREGATE_KEYS})
+        keyed["answer_value"] = rows["answer_value"]
+        return build_quantile_sketches(keyed, group_cols=AGGREGATE_KEYS, k=self.sketch_k)
+
+    def _persist(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self.path, self._cells.to_csv)
+        if self._sketches is not None:
+            _write_atomic(self.sketch_path, lambda stream: stream.write(self._sketches.to_json()))
+
+
+def _write_atomic(path: Path, write) -> None:
+    handle, temp_path = tempfile.mkstemp(dir=path.parent, suffix=path.suffix)
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8", newline="") as stream:
+            write(stream)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _partial_cells(rows: pd.DataFrame) -> pd.DataFrame:
+    if rows.empty or any(col not in rows.columns for col in AGGREGATE_KEYS):
+        return _empty_cells()
+    keyed = pd.DataFrame({col: rows[col].astype(str) for col in AGGREGATE_KEYS})
+    keyed["answer_value"] = rows["answer_value"]
+    cells = build_score_cube(keyed, dimensions=AGGREGATE_KEYS).cells
+    cells = cells[cells["response_count"] > 0]
+    cells.index = cells.index.set_levels([level.astype(object) for level in cells.index.levels])
+    return cells
+
+
+def _empty_cells() -> pd.DataFrame:
+    index = pd.MultiIndex.from_arrays([[], []], names=list(AGGREGATE_KEYS))
+    cells = pd.DataFrame({column: np.empty(0, dtype=np.int64) for column in CUBE_MEASURES}, index=index)
+    return cells.astype({"score_sum": np.float64})
+
+
+def _read_cells(path: Path) -> pd.DataFrame:
+    cells = pd.read_csv(path, dtype={col: object for col in AGGREGATE_KEYS})
+    if cells.empty:
+        return _empty_cells()
+    return cells.set_index(list(AGGREGATE_KEYS))[list(CUBE_MEASURES)]
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import math
+from typing import Hashable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .prepared import PreparedResponses
+from .quantitative import _nps_question_ids, _score_cube
+from .rollup import CUBE_MEASURES
+
+BENCHMARK_DIMENSIONS = ("course_name", "instructor_name")
+BENCHMARK_MEASURES = ("mean_score", "nps")
+_MEASURE_SLOTS = {name: slot for slot, name in enumerate(CUBE_MEASURES)}
+_REBUILD_FRACTION = 0.25
+
+
+class BenchmarkIndex:
+    """Percentile ranks of per-course and per-instructor scores across all surveys.
+
+    Score and NPS partial sums are kept per survey and rolled up to every
+    entity (course, instructor) overall and per survey category. Each
+    (dimension, measure, category) keeps a sorted array of entity values, so a
+    percentile is two binary searches. ``update`` folds in new responses:
+    only the entities of the affected surveys are recomputed and their values
+    moved within the sorted arrays, so history is never rescanned.
+    """
+
+    def __init__(
+        self,
+        dimensions: Iterable[str] = BENCHMARK_DIMENSIONS,
+        *,
+        category_col: str = "category",
+        join_key: str = "survey_id",
+        fill_value: str = "미지정",
+        min_responses: int = 1,
+    ) -> None:
+        self.dimensions = tuple(dimensions)
+        self.category_col = category_col
+        self.join_key = join_key
+        self.fill_value = fill_value
+        self.min_responses = min_responses
+        self._surveys: dict[Hashable, tuple[np.ndarray, tuple, Hashable]] = {}
+        self._totals: dict[tuple, np.ndarray] = {}
+        self._rankings: dict[tuple, _Ranking] = {}
+
+    def __len__(self) -> int:
+        return len(self._surveys)
+
+    @property
+    def categories(self) -> list:
+        return sorted({category for _, _, category in self._surveys.values()}, key=str)
+
+    def update(
+        self,
+        responses: pd.DataFrame | PreparedResponses,
+        metadata: pd.DataFrame | None = None,
+        *,
+        question_bank: pd.DataFrame | None = None,
+        nps_question_ids: Iterable[str] | None = None,
+        score_col: str = "answer_value",
+    ) -> None:
+        """Fold newly arrived responses (and their surveys' metadata) into the index."""
+        nps_ids = _nps_question_ids(question_bank, nps_question_ids)
+        cells = _score_cube(responses, [self.join_key], score_col, nps_ids).cells
+        self.update_cells(cells, metadata)
+
+    def update_cells(self, cells: pd.DataFrame, metadata: pd.DataFrame | None = None) -> None:
+        """Add per-survey cube measures (indexed by survey ID) to the index.
+
+        Surveys already indexed are re-mapped when ``metadata`` moves them to
+        another course, instructor or category.
+        """
+        lookup = self._metadata_lookup(metadata)
+        measures = cells[list(CUBE_MEASURES)].to_numpy(np.float64)
+        deltas = {survey_id: row for survey_id, row in zip(cells.index, measures) if pd.notna(survey_id)}
+        touched: set[tuple] = set()
+        for survey_id in set(deltas) | (set(lookup) & set(self._surveys)):
+            previous = self._surveys.get(survey_id)
+            if previous is None:
+                totals, (keys, category) = np.zeros(len(CUBE_MEASURES)), lookup.get(survey_id, self._unknown())
+            else:
+                totals, keys, category = previous
+                keys, category = lookup.get(survey_id, (keys, category))
+                if survey_id not in deltas and (keys, category) == previous[1:]:
+                    continue
+                touched |= self._fold(-totals, *previous[1:])
+            if survey_id in deltas:
+                totals = totals + deltas[survey_id]
+            self._surveys[survey_id] = (totals, keys, category)
+            touched |= self._fold(totals, keys, category)
+        self._refresh(touched)
+
+    def update_metadata(self, metadata: pd.DataFrame) -> None:
+        """Re-map indexed surveys after their survey_info rows changed."""
+        self.update_cells(pd.DataFrame(columns=list(CUBE_MEASURES)), metadata)
+
+    def values(self, dimension: str, measure: str = "mean_score", category: Hashable | None = None) -> pd.Series:
+        """Entity values of ``measure``, named by ``dimension`` and sorted ascending."""
+        ranking = self._ranking(dimension, measure, category)
+        keys = sorted(ranking.values, key=ranking.values.get)
+        return pd.Series([ranking.values[key] for key in keys], index=pd.Index(keys, name=dimension), name=measure)
+
+    def percentile(
+        self,
+        dimension: str,
+        key: Hashable,
+        measure: str = "mean_score",
+        category: Hashable | None = None,
+    ) -> float:
+        """Percentile rank (0-100) of entity ``key``; NaN when it is not ranked."""
+        ranking = self._ranking(dimension, measure, category)
+        value = ranking.values.get(key)
+        return math.nan if value is None else float(ranking.percentile(np.array([value]))[0])
+
+    def top_share(
+        self,
+        dimension: str,
+        key: Hashable,
+        measure: str = "mean_score",
+        category: Hashable | None = None,
+    ) -> float:
+        """Share (0-100] of ranked entities scoring at least as high as ``key``.
+
+        This is the "top X%" figure: the best entity of N gets 100/N and a sole
+        entity 100. NaN when ``key`` is not ranked.
+        """
+        ranking = self._ranking(dimension, measure, category)
+        value = ranking.values.get(key)
+        return math.nan if value is None else float(ranking.top_share(np.array([value]))[0])
+
+    def percentile_of(
+        self,
+        value: float,
+        dimension: str,
+        measure: str = "mean_score",
+        category: Hashable | None = None,
+    ) -> float:
+        """Percentile rank (0-100) ``value`` would have among the ranked entities."""
+        return float(self._ranking(dimension, measure, category).percentile(np.array([value], dtype=np.float64))[0])
+
+    def ranking(self, dimension: str, measure: str = "mean_score", category: Hashable | None = None) -> pd.DataFrame:
+        """Every ranked entity with its value and percentile, best first."""
+        values = self.values(dimension, measure, category)[::-1]
+        percentiles = self._ranking(dimension, measure, category).percentile(values.to_numpy())
+        return pd.DataFrame({dimension: values.index, measure: values.to_numpy(), "percentile": percentiles})
+
+    def _ranking(self, dimension: str, measure: str, category: Hashable | None) -> _Ranking:
+        if dimension not in self.dimensions:
+            raise KeyError(f"Not a benchmark dimension: {dimension}")
+        if measure not in BENCHMARK_MEASURES:
+            raise KeyError(f"Not a benchmark measure: {measure}")
+        return self._rankings.get((dimension, measure, category)) or _Ranking()
+
+    def _unknown(self) -> tuple[tuple, Hashable]:
+        return (self.fill_value,) * len(self.dimensions), self.fill_value
+
+    def _metadata_lookup(self, metadata: pd.DataFrame | None) -> dict[Hashable, tuple[tuple, Hashable]]:
+        if metadata is None or metadata.empty or self.join_key not in metadata.columns:
+            return {}
+        # The first metadata row wins when a survey ID repeats.
+        table = metadata.drop_duplicates(self.join_key)
+
+        def column(col: str) -> list:
+            if col not in table.columns:
+                return [self.fill_value] * len(table)
+            return table[col].where(table[col].notna(), self.fill_value).tolist()
+
+        keys = zip(*(column(col) for col in self.dimensions))
+        return dict(zip(table[self.join_key].tolist(), zip(keys, column(self.category_col))))
+
+    def _fold(self, measures: np.ndarray, keys: tuple, category: Hashable) -> set[tuple]:
+        touched = set()
+        for dimension, key in zip(self.dimensions, keys):
+            for scope in ((dimension, key, None), (dimension, key, category)):
+                total = self._totals.get(scope)
+                self._totals[scope] = measures.copy() if total is None else total + measures
+                touched.add(scope)
+        return touched
+
+    def _refresh(self, touched: set[tuple]) -> None:
+        changes: dict[tuple, dict[Hashable, float]] = {}
+        for dimension, key, category in touched:
+            total = self._totals[(dimension, key, category)]
+            for measure, value in zip(BENCHMARK_MEASURES, self._measure_values(total)):
+                changes.setdefault((dimension, measure, category), {})[key] = value
+        for ranking_key, values in changes.items():
+            self._rankings.setdefault(ranking_key, _Ranking()).update(values)
+
+    def _measure_values(self, total: np.ndarray) -> tuple[float, float]:
+        count = total[_MEASURE_SLOTS["response_count"]]
+        nps_total = total[_MEASURE_SLOTS["nps_total"]]
+        mean = total[_MEASURE_SLOTS["score_sum"]] / count if count >= self.min_responses and count > 0 else math.nan
+        # Same arithmetic as ScoreCube.nps, so equal shares tie exactly.
+        nps = (
+            total[_MEASURE_SLOTS["promoters"]] / nps_total * 100 - total[_MEASURE_SLOTS["detractors"]] / nps_total * 100
+            if nps_total >= self.min_responses and nps_total > 0
+            else math.nan
+        )
+        return mean, nps
+
+
+def build_benchmark_index(
+    responses: pd.DataFrame | PreparedResponses,
+    metadata: pd.DataFrame | None = None,
+    *,
+    question_bank: pd.DataFrame | None = None,
+    dimensions: Iterable[str] = BENCHMARK_DIMENSIONS,
+    category_col: str = "category",
+    min_responses: int = 1,
+) -> BenchmarkIndex:
+    """BenchmarkIndex over the full response history."""
+    index = BenchmarkIndex(dimensions, category_col=category_col, min_responses=min_responses)
+    index.update(responses, metadata, question_bank=question_bank)
+    return index
+
+
+class _Ranking:
+    """Entity values plus the same values as one sorted array."""
+
+    def __init__(self) -> None:
+        self.values: dict[Hashable, float] = {}
+        self.sorted = np.empty(0, dtype=np.float64)
+
+    def update(self, values: dict[Hashable, float]) -> None:
+        old = np.array([self.values[key] for key in values if key in self.values], dtype=np.float64)
+        for key, value in values.items():
+            if math.isnan(value):
+                self.values.pop(key, None)
+            else:
+                self.values[key] = value
+        new = np.array([value for value in values.values() if not math.isnan(value)], dtype=np.float64)
+        if len(old) + len(new) > _REBUILD_FRACTION * max(len(self.sorted), 1):
+            self.sorted = np.sort(np.fromiter(self.values.values(), dtype=np.float64, count=len(self.values)))
+            return
+        # Few changes: move the values within the sorted array (O(n) memmove)
+        # instead of re-sorting it.
+        if len(old):
+            old = np.sort(old)
+            # Repeated values are removed from consecutive slots of their run.
+            repeats = np.arange(len(old)) - np.searchsorted(old, old, side="left")
+            self.sorted = np.delete(self.sorted, np.searchsorted(self.sorted, old, side="left") + repeats)
+        if len(new):
+            # Sorted so values landing in the same slot are inserted in order.
+            new = np.sort(new)
+            self.sorted = np.insert(self.sorted, np.searchsorted(self.sorted, new), new)
+
+    def percentile(self, values: np.ndarray) -> np.ndarray:
+        # Mid-rank: entities below plus half of the ties, so equal values share
+        # a percentile and the median entity sits at 50.
+        if not len(self.sorted):
+            return np.full(len(values), np.nan)
+        below = np.searchsorted(self.sorted, values, side="left")
+        ties = np.searchsorted(self.sorted, values, side="right") - below
+        return (below + 0.5 * ties) / len(self.sorted) * 100
+
+    def top_share(self, values: np.ndarray) -> np.ndarray:
+        if not len(self.sorted):
+            return np.full(len(values), np.nan)
+        below = np.searchsorted(self.sorted, values, side="left")
+        return (len(self.sorted) - below) / len(self.sorted) * 100
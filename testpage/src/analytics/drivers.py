@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from .prepared import PreparedResponses
+from .quantitative import _group_index, _nps_question_ids
+from .rollup import score_array
+
+DEFAULT_RESPONDENT_COLS = ("survey_id", "respondent_id")
+DEFAULT_BLOCK_ROWS = 8192
+MIN_PAIRED_RESPONSES = 3
+
+
+@dataclass(frozen=True)
+class ResponseMatrix:
+    """Respondent x question scores with a mask for unanswered cells.
+
+    Integer answers are stored as int8 (float32 otherwise) and ``observed``
+    marks the answered cells, so 100k respondents x 100 questions take about
+    20 MB. Missing cells hold 0 in ``values`` and are never read without the
+    mask. Analyses stream it in row blocks instead of converting it whole.
+    """
+
+    respondents: pd.Index
+    questions: pd.Index
+    values: np.ndarray
+    observed: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.values.shape
+
+    def column(self, question_id: str) -> np.ma.MaskedArray:
+        position = self.questions.get_loc(question_id)
+        return np.ma.MaskedArray(self.values[:, position], mask=~self.observed[:, position])
+
+    def to_frame(self) -> pd.DataFrame:
+        """Dense float frame with NaN for missing answers (for small matrices)."""
+        dense = np.where(self.observed, self.values, np.nan)
+        return pd.DataFrame(dense, index=self.respondents, columns=self.questions)
+
+    def blocks(
+        self,
+        rows: np.ndarray | None = None,
+        block_rows: int = DEFAULT_BLOCK_ROWS,
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """float64 (values, mask) blocks of at most ``block_rows`` selected rows."""
+        positions = np.arange(len(self.values)) if rows is None else np.flatnonzero(rows)
+        for start in range(0, len(positions), block_rows):
+            selected = positions[start : start + block_rows]
+            mask = self.observed[selected].astype(np.float64)
+            yield self.values[selected].astype(np.float64) * mask, mask
+
+    def pairwise_correlations(self, rows: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Pairwise-complete Pearson correlations and pair counts between questions.
+
+        Each pair uses the respondents who answered both. The sums behind the
+        correlations are four question x question matrix products per block,
+        so only one block is ever held as float64.
+        """
+        size = len(self.questions)
+        counts = np.zeros((size, size))
+        sums = np.zeros((size, size))
+        squares = np.zeros((size, size))
+        products = np.zeros((size, size))
+        for values, mask in self.blocks(rows):
+            counts += mask.T @ mask
+            # sums[i, j]: sum of question i over respondents who also answered j.
+            sums += values.T @ mask
+            squares += (values * values).T @ mask
+            products += values.T @ values
+        with np.errstate(divide="ignore", invalid="ignore"):
+            covariance = products - sums * sums.T / counts
+            variance = squares - sums * sums / counts
+            # Rounding leaves constant answers with a tiny, not zero, variance.
+            variance[variance <= 1e-12 * squares] = np.nan
+            correlations = covariance / np.sqrt(variance * variance.T)
+        correlations[(counts < MIN_PAIRED_RESPONSES) | ~np.isfinite(correlations)] = np.nan
+        return np.clip(correlations, -1.0, 1.0), counts.astype(np.int64)
+
+
+@dataclass(frozen=True)
+class DriverAnalysis:
+    target: str
+    respondents: int
+    r_squared: float
+    drivers: pd.DataFrame
+
+
+def build_response_matrix(
+    responses: pd.DataFrame | PreparedResponses,
+    *,
+    respondent_cols: Iterable[str] = DEFAULT_RESPONDENT_COLS,
+    question_col: str = "question_id",
+    score_col: str = "answer_value",
+) -> ResponseMatrix:
+    """Pivot long responses into a ResponseMatrix.
+
+    Respondents are identified by ``respondent_cols`` (respondent IDs repeat
+    across surveys). Non-numeric answers are left unobserved and the last
+    answer wins when a respondent answered a question twice.
+    """
+    frame = responses.responses if isinstance(responses, PreparedResponses) else responses
+    respondent_cols = [col for col in respondent_cols if col in frame.columns]
+    if not respondent_cols:
+        raise KeyError("Responses have none of the respondent columns.")
+    scores = responses.scores if isinstance(responses, PreparedResponses) else score_array(frame[score_col])
+    rows = ~np.isnan(scores)
+    respondent_ids, respondents = _group_index(responses, respondent_cols, rows)
+    question_ids, questions = _group_index(responses, [question_col], rows)
+
+    scores = scores[rows]
+    is_integer = bool(np.all((scores == np.round(scores)) & (scores >= -128) & (scores <= 127)))
+    values = np.zeros((len(respondents), len(questions)), dtype=np.int8 if is_integer else np.float32)
+    observed = np.zeros(values.shape, dtype=bool)
+    values[respondent_ids, question_ids] = scores
+    observed[respondent_ids, question_ids] = True
+    return ResponseMatrix(
+        respondents=respondents,
+        questions=questions,
+        values=values,
+        observed=observed,
+    )
+
+
+def key_driver_analysis(
+    responses: pd.DataFrame | PreparedResponses | ResponseMatrix,
+    *,
+    target_question: str | None = None,
+    question_bank: pd.DataFrame | None = None,
+) -> DriverAnalysis:
+    """How strongly each question drives the NPS (or ``target_question``) score.
+
+    Uses the respondents who answered the target. ``correlation`` is the
+    pairwise-complete Pearson correlation with the target. ``beta`` is the
+    standardized multiple-regression coefficient and ``relative_weight`` is
+    Johnson's relative weight, each question's share (%) of the model R².
+    Both are solved from the pairwise correlation matrix. Relative weights
+    split the explained variance even when questions are collinear, which
+    betas do not. Questions with fewer than three paired answers or no
+    variance are reported with NaN and left out of the model, as are
+    questions that were rarely answered together with the others.
+    """
+    matrix = responses if isinstance(responses, ResponseMatrix) else build_response_matrix(responses)
+    target = target_question
+    if target is None:
+        nps_ids = [qid for qid in _nps_question_ids(question_bank) or [] if qid in matrix.questions]
+        if not nps_ids:
+            raise ValueError("No NPS question found; pass target_question or a question bank with an NPS category.")
+        target = nps_ids[0]
+    if target not in matrix.questions:
+        raise KeyError(f"Target question not in the response matrix: {target}")
+
+    target_position = matrix.questions.get_loc(target)
+    rows = matrix.observed[:, target_position]
+    correlations, counts = matrix.pairwise_correlations(rows)
+    predictors = np.flatnonzero(np.arange(len(matrix.questions)) != target_position)
+    with_target = correlations[predictors, target_position]
+
+    usable = _modelled_questions(correlations, predictors[np.isfinite(with_target)])
+    betas, weights, r_squared = _relative_weights(
+        correlations[np.ix_(usable, usable)],
+        correlations[usable, target_position],
+    )
+    beta_column = pd.Series(betas, index=usable).reindex(predictors)
+    weight_column = pd.Series(weights, index=usable).reindex(predictors)
+
+    drivers = pd.DataFrame(
+        {
+            "question_id": matrix.questions[predictors],
+            "response_count": counts[predictors, target_position],
+            "correlation": with_target,
+            "beta": beta_column.to_numpy(),
+            "relative_weight": weight_column.to_numpy() / r_squared * 100 if r_squared > 0 else np.nan,
+        }
+    )
+    drivers = drivers.sort_values("relative_weight", ascending=False, na_position="last", kind="stable")
+    return DriverAnalysis(
+        target=str(target),
+        respondents=int(rows.sum()),
+        r_squared=r_squared,
+        drivers=drivers.reset_index(drop=True),
+    )
+
+
+def _modelled_questions(correlations: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    # Drop the question with the most unpaired partners until the predictor
+    # correlation matrix is complete.
+    while len(candidates):
+        missing = (~np.isfinite(correlations[np.ix_(candidates, candidates)])).sum(axis=1)
+        if not missing.any():
+            break
+        candidates = np.delete(candidates, int(missing.argmax()))
+    return candidates
+
+
+def _relative_weights(
+    predictor_correlations: np.ndarray,
+    target_correlations: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, float]:
+    if not len(target_correlations):
+        return np.empty(0), np.empty(0), 0.0
+    # Pairwise correlation matrices need not be positive definite; clip the
+    # spectrum so the square root and inverse stay real and bounded.
+    eigenvalues, eigenvectors = np.linalg.eigh(predictor_correlations)
+    eigenvalues = np.clip(eigenvalues, 1e-10, None)
+    root = (eigenvectors * np.sqrt(eigenvalues)) @ eigenvectors.T
+    betas = (eigenvectors / eigenvalues) @ (eigenvectors.T @ target_correlations)
+    # Regress the target on the orthogonal counterparts Z = X R^-1/2, then
+    # apportion each component's explained variance back to the questions.
+    component_betas = (eigenvectors / np.sqrt(eigenvalues)) @ (eigenvectors.T @ target_correlations)
+    weights = (root**2) @ (component_betas**2)
+    return betas, weights, float(weights.sum())
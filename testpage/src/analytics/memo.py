@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import pandas as pd
+
+from .aggregates import ResponseAggregateStore
+from .prepared import PreparedResponses
+from .quantitative import build_quantitative_snapshot, calculate_nps
+
+DEFAULT_MEMO_ENTRIES = 64
+
+
+class SnapshotMemo:
+    """Bounded LRU memo for analytics results keyed by input content fingerprints.
+
+    Each input is reduced to a fingerprint: a content hash for dataframes
+    (computed once per frame object), the write version for a
+    ResponseAggregateStore, an identity token for an (immutable)
+    PreparedResponses, and the value itself for scalars. Any write produces
+    new content or a new version, so a cached result is never served for
+    changed inputs. Frames are treated as immutable once passed in: after an
+    in-place edit, call ``clear``.
+
+    Cached results are shared between callers and must not be modified in place.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MEMO_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self._tokens: dict[int, tuple[weakref.ref, Hashable]] = {}
+        self._serial = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens.clear()
+
+    def key(self, *parts: Any) -> tuple:
+        """Fingerprint tuple for ``parts`` usable with ``get_or_compute``."""
+        return tuple(self._fingerprint(part) for part in parts)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+        result = compute()
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def build_quantitative_snapshot(
+        self,
+        responses: pd.DataFrame | ResponseAggregateStore,
+        *,
+        survey_id: str | None = None,
+        question_bank: pd.DataFrame | None = None,
+        metadata: pd.DataFrame | None = None,
+        **kwargs: Any,
+    ) -> dict[str, pd.DataFrame]:
+        """Memoized build_quantitative_snapshot over the rows of ``survey_id``.
+
+        Pass the full responses table and let the memo filter it: a filtered
+        frame is a new object on every rerun, while the full table is not.
+        """
+        key = self.key("snapshot", responses, survey_id, question_bank, metadata, sorted(kwargs.items()))
+        return self.get_or_compute(
+            key,
+            lambda: build_quantitative_snapshot(
+                _select_survey(responses, survey_id),
+                question_bank=question_bank,
+                metadata=metadata,
+                **kwargs,
+            ),
+        )
+
+    def calculate_nps(
+        self,
+        responses: pd.DataFrame,
+        *,
+        survey_id: str | None = None,
+        question_bank: pd.DataFrame | None = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Memoized calculate_nps over the rows of ``survey_id``."""
+        key = self.key("nps", responses, survey_id, question_bank, sorted(kwargs.items()))
+        return self.get_or_compute(
+            key,
+            lambda: calculate_nps(_select_survey(responses, survey_id), question_bank=question_bank, **kwargs),
+        )
+
+    def _fingerprint(self, part: Any) -> Hashable:
+        if isinstance(part, pd.DataFrame):
+            return self._token(part, frame_fingerprint)
+        if isinstance(part, PreparedResponses):
+            return self._token(part, lambda _: ("prepared", next(self._serial)))
+        if isinstance(part, ResponseAggregateStore):
+            return ("aggregates", part.version)
+        if isinstance(part, (list, tuple)):
+            return tuple(self._fingerprint(item) for item in part)
+        if part is None or isinstance(part, Hashable):
+            return part
+        return repr(part)
+
+    def _token(self, obj: Any, make: Callable[[Any], Hashable]) -> Hashable:
+        # Tokens are computed once per object; later lookups cost a dict probe.
+        # The weakref guards against a new object reusing a collected one's id.
+        with self._lock:
+            cached = self._tokens.get(id(obj))
+            if cached is not None and cached[0]() is obj:
+                return cached[1]
+        token = make(obj)
+        with self._lock:
+            self._tokens[id(obj)] = (weakref.ref(obj, self._forget(id(obj))), token)
+        return token
+
+    def _forget(self, object_id: int) -> Callable[[weakref.ref], None]:
+        def forget(_ref: weakref.ref) -> None:
+            self._tokens.pop(object_id, None)
+
+        return forget
+
+
+def frame_fingerprint(frame: pd.DataFrame) -> str:
+    """Content hash of a dataframe's columns, dtypes and values."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((frame.shape, list(frame.columns), [str(dtype) for dtype in frame.dtypes])).encode("utf-8"))
+    if len(frame) and len(frame.columns):
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _select_survey(
+    responses: pd.DataFrame | ResponseAggregateStore,
+    survey_id: str | None,
+) -> pd.DataFrame | ResponseAggregateStore:
+    if survey_id is None:
+        return responses
+    if isinstance(responses, ResponseAggregateStore):
+        return responses.subset([survey_id])
+    return responses[responses["survey_id"] == survey_id]
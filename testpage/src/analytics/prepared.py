@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from .rollup import ScoreCube, cube_from_scores, group_index, score_array
+
+DEFAULT_DIMENSION_COLS = ("course_name", "instructor_name", "round")
+
+
+@dataclass(frozen=True)
+class PreparedResponses:
+    """Responses parsed once for analytics.
+
+    Holds the float64 score array, categorical codes for the dimension columns
+    and question IDs, and the question categories joined from the bank. The
+    original frame is referenced, never copied, and joins map the small
+    metadata tables onto codes instead of merging the response table.
+    """
+
+    responses: pd.DataFrame
+    scores: np.ndarray
+    questions: pd.Categorical
+    dimensions: dict[str, pd.Categorical] = field(default_factory=dict)
+    question_category: pd.Categorical | None = None
+    score_col: str = "answer_value"
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    @property
+    def empty(self) -> bool:
+        return len(self.scores) == 0
+
+    @property
+    def valid(self) -> np.ndarray:
+        return ~np.isnan(self.scores)
+
+    def column(self, name: str) -> pd.Categorical | pd.api.extensions.ExtensionArray | np.ndarray:
+        """Dimension codes for ``name`` if prepared, else the raw response column."""
+        if name in self.dimensions:
+            return self.dimensions[name]
+        if name == "category" and self.question_category is not None:
+            return self.question_category
+        if name == "question_id":
+            return self.questions
+        return self.responses[name].array
+
+    def question_mask(self, question_ids: Iterable[str] | None) -> np.ndarray | None:
+        """Row mask for ``question_ids`` computed on the distinct IDs only."""
+        if question_ids is None:
+            return None
+        wanted = pd.Index(self.questions.categories).isin(list(question_ids))
+        codes = self.questions.codes
+        return np.where(codes >= 0, wanted[codes], False)
+
+    def cube(self, dimensions: Iterable[str] = (), nps_question_ids: Iterable[str] | None = None) -> ScoreCube:
+        """ScoreCube over ``dimensions`` built from the parsed scores and codes."""
+        dimensions = tuple(dimensions)
+        cube = cube_from_scores(
+            {name: self.column(name) for name in dimensions},
+            self.scores,
+            nps_mask=self.question_mask(nps_question_ids),
+        )
+        if dimensions:
+            cube = replace(cube, cells=cube.cells.set_axis(self._plain_index(cube.cells.index)))
+        return cube
+
+    def group_index(self, group_cols: Iterable[str], rows: np.ndarray) -> tuple[np.ndarray, pd.Index | None]:
+        """rollup.group_index over prepared codes for the selected ``rows``."""
+        group_ids, index = group_index({name: self.column(name) for name in group_cols}, rows)
+        return group_ids, None if index is None else self._plain_index(index)
+
+    def _plain_index(self, index: pd.Index) -> pd.Index:
+        # Codes are an internal detail: dimensions that were not categorical in
+        # the input come back with their plain value dtype.
+        def plain(level: pd.Index) -> pd.Index:
+            if isinstance(level, pd.CategoricalIndex) and not self._is_input_categorical(level.name):
+                return level.astype(level.categories.dtype)
+            return level
+
+        if isinstance(index, pd.MultiIndex):
+            return index.set_levels([plain(level) for level in index.levels])
+        return plain(index)
+
+    def _is_input_categorical(self, name: str) -> bool:
+        return name in self.responses.columns and isinstance(self.responses[name].dtype, pd.CategoricalDtype)
+
+    def with_question_metadata(self, question_bank: pd.DataFrame | None) -> PreparedResponses:
+        bank = _normalize_bank(question_bank)
+        if bank is None:
+            return self
+        lookup = bank.drop_duplicates("question_id").set_index("question_id")["category"]
+        categories = lookup.reindex(pd.Index(self.questions.categories)).to_numpy(dtype=object)
+        return replace(self, question_category=_take_categorical(categories, self.questions.codes))
+
+    def with_dimension_metadata(
+        self,
+        metadata: pd.DataFrame | None,
+        *,
+        join_key: str = "survey_id",
+        dimension_cols: Iterable[str] = DEFAULT_DIMENSION_COLS,
+    ) -> PreparedResponses:
+        if metadata is None or metadata.empty or join_key not in metadata.columns:
+            return self
+        available_cols = [col for col in dimension_cols if col in metadata.columns]
+        if not available_cols:
+            return self
+        # Map every response to its metadata row once; the first row wins when
+        # a key repeats.
+        table = metadata.drop_duplicates(join_key)
+        keys = pd.Categorical(self.column(join_key))
+        rows = pd.Index(table[join_key]).get_indexer(keys.categories)
+        rows = np.append(rows, -1)[keys.codes]
+        dimensions = dict(self.dimensions)
+        for col in available_cols:
+            dimensions[col] = _take_categorical(table[col].to_numpy(dtype=object), rows)
+        return replace(self, dimensions=dimensions)
+
+    def with_filled_dimensions(self, dimension_cols: Iterable[str], fill_value: str) -> PreparedResponses:
+        """Fill missing dimension values (and absent dimensions) with ``fill_value``."""
+        dimensions = dict(self.dimensions)
+        for col in dimension_cols:
+            if col in dimensions:
+                values = dimensions[col]
+            elif col in self.responses.columns:
+                values = pd.Categorical(self.responses[col])
+            else:
+                values = pd.Categorical.from_codes(np.full(len(self), -1, dtype=np.int8), categories=[])
+            if (values.codes < 0).any():
+                if fill_value not in values.categories:
+                    values = _sorted_categories(values.add_categories([fill_value]))
+                values = values.fillna(fill_value)
+            dimensions[col] = values
+        return replace(self, dimensions=dimensions)
+
+
+def prepare_responses(
+    responses: pd.DataFrame | PreparedResponses,
+    *,
+    question_bank: pd.DataFrame | None = None,
+    metadata: pd.DataFrame | None = None,
+    join_key: str = "survey_id",
+    dimension_cols: Iterable[str] = DEFAULT_DIMENSION_COLS,
+    score_col: str = "answer_value",
+) -> PreparedResponses:
+    """Parse scores and join question/dimension metadata once for every analytic."""
+    if isinstance(responses, PreparedResponses):
+        prepared = responses
+    else:
+        questions = (
+            pd.Categorical(responses["question_id"])
+            if "question_id" in responses.columns
+            else pd.Categorical.from_codes(np.full(len(responses), -1, dtype=np.int8), categories=[])
+        )
+        prepared = PreparedResponses(
+            responses=responses,
+            scores=score_array(responses[score_col]),
+            questions=questions,
+            score_col=score_col,
+        )
+    prepared = prepared.with_question_metadata(question_bank)
+    return prepared.with_dimension_metadata(metadata, join_key=join_key, dimension_cols=dimension_cols)
+
+
+def _sorted_categories(values: pd.Categorical) -> pd.Categorical:
+    # Grouping follows category order, so keep it lexical like a plain groupby.
+    try:
+        return values.reorder_categories(values.categories.sort_values())
+    except TypeError:
+        return values
+
+
+def _normalize_bank(question_bank: pd.DataFrame | None) -> pd.DataFrame | None:
+    if question_bank is None or question_bank.empty:
+        return None
+    bank = question_bank
+    if "question_id" not in bank.columns and "id" in bank.columns:
+        bank = bank.rename(columns={"id": "question_id"})
+    if "question_id" not in bank.columns or "category" not in bank.columns:
+        return None
+    return bank
+
+
+def _take_categorical(values: np.ndarray, positions: np.ndarray) -> pd.Categorical:
+    # ``values`` is the small lookup side; factorize it and gather codes so the
+    # per-row result is a codes array rather than a column of objects.
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), sort=True, use_na_sentinel=True)
+    codes = np.append(codes, -1)
+    positions = np.where(positions >= 0, positions, len(values))
+    return pd.Categorical.from_codes(codes[positions], categories=pd.Index(uniques, dtype=object))
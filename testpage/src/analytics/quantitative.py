@@ -1,169 +1,227 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Mapping
 
+import numpy as np
 import pandas as pd
 
-
-@dataclass
-class NPSResult:
-    score: float
-    promoters: float
-    passives: float
-    detractors: float
-    total: int
+from .aggregates import ResponseAggregateStore
+from .prepared import PreparedResponses, prepare_responses
+from .rollup import ScoreCube, build_score_cube, group_index, nps_bins, score_array
 
 
 DEFAULT_NPS_CATEGORIES = {"nps", "추천", "추천의향", "net promoter score"}
+BOOTSTRAP_STATISTICS = ("mean", "nps")
+LIKERT_SCALE = (1, 5)
+NPS_SCALE = (0, 10)
+_BOOTSTRAP_BATCH_DRAWS = 4_000_000
+_BOOTSTRAP_DATA: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
 
 
-def _coerce_numeric(series: pd.Series) -> pd.Series:
-    return pd.to_numeric(series, errors="coerce")
+@dataclass(frozen=True)
+class ScoreDistribution:
+    """Per-(question, group) histograms of integer answers.
 
+    ``counts[i, j]`` is the number of answers equal to ``points[j]`` in the
+    group ``index[i]``; ``scales`` holds each row's (low, high) scale points.
+    Medians, quantiles and box scores are all read off the histograms.
+    """
 
-def _safe_group_mean(df: pd.DataFrame, group_cols: list[str], score_col: str) -> pd.DataFrame:
-    if df.empty:
-        return pd.DataFrame(columns=[*group_cols, "mean_score", "response_count"])
-    grouped = (
-        df.groupby(group_cols, dropna=False)[score_col]
-        .agg(mean_score="mean", response_count="count")
-        .reset_index()
-    )
-    return grouped
+    index: pd.Index
+    points: np.ndarray
+    counts: np.ndarray
+    scales: np.ndarray
+
+    @property
+    def totals(self) -> np.ndarray:
+        return self.counts.sum(axis=1)
+
+    def quantile(self, q: float) -> np.ndarray:
+        """Linearly interpolated quantile per row, matching ``np.quantile``."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1.")
+        cumulative = self.counts.cumsum(axis=1)
+        position = (self.totals - 1) * q
+        below = np.floor(position)
+        lower = self._value_at(cumulative, below)
+        upper = self._value_at(cumulative, np.ceil(position))
+        return lower + (position - below) * (upper - lower)
+
+    def box_scores(self, size: int = 2) -> tuple[np.ndarray, np.ndarray]:
+        """Top-``size`` and bottom-``size`` box shares (in percent) per row."""
+        cumulative = np.concatenate([np.zeros((len(self.counts), 1), dtype=np.int64), self.counts.cumsum(axis=1)], axis=1)
+        rows = np.arange(len(self.counts))
+        top_start = np.searchsorted(self.points, self.scales[:, 1] - size + 1)
+        bottom_end = np.searchsorted(self.points, self.scales[:, 0] + size)
+        totals = self.totals
+        with np.errstate(invalid="ignore", divide="ignore"):
+            top = (totals - cumulative[rows, top_start]) / totals * 100
+            bottom = cumulative[rows, bottom_end] / totals * 100
+        return top, bottom
+
+    def summary(self, box_size: int = 2) -> pd.DataFrame:
+        """Count, mean, median and top/bottom box percentages per row."""
+        totals = self.totals
+        top, bottom = self.box_scores(box_size)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = (self.counts * self.points).sum(axis=1) / totals
+        frame = pd.DataFrame(
+            {
+                "response_count": totals,
+                "mean_score": mean,
+                "median": self.quantile(0.5),
+                f"top{box_size}_box": top,
+                f"bottom{box_size}_box": bottom,
+            },
+            index=self.index,
+        )
+        return frame.reset_index()
+
+    def histogram(self) -> pd.DataFrame:
+        """Wide histogram with one count column per scale point."""
+        return pd.DataFrame(self.counts, index=self.index, columns=self.points.tolist()).reset_index()
+
+    def _value_at(self, cumulative: np.ndarray, rank: np.ndarray) -> np.ndarray:
+        # Value of the rank-th smallest answer: the first bin whose cumulative
+        # count exceeds the rank.
+        bins = (cumulative <= rank[:, None]).sum(axis=1)
+        return self.points[np.minimum(bins, len(self.points) - 1)].astype(np.float64)
+
+
+def _coerce_numeric(series: pd.Series) -> pd.Series:
+    return pd.to_numeric(series, errors="coerce")
 
 
 def attach_question_metadata(
-    responses: pd.DataFrame,
+    responses: pd.DataFrame | PreparedResponses,
     question_bank: pd.DataFrame | None,
     *,
     question_id_col: str = "question_id",
-) -> pd.DataFrame:
+) -> pd.DataFrame | PreparedResponses:
+    if isinstance(responses, PreparedResponses):
+        return responses.with_question_metadata(question_bank)
     if question_bank is None or question_bank.empty:
-        return responses.copy()
-    bank = question_bank.copy()
+        return responses.copy(deep=False)
+    bank = question_bank
     if "question_id" not in bank.columns and "id" in bank.columns:
         bank = bank.rename(columns={"id": "question_id"})
     if "category" not in bank.columns:
-        return responses.copy()
+        return responses.copy(deep=False)
     return responses.merge(bank[["question_id", "category"]], on=question_id_col, how="left")
 
 
 def attach_dimension_metadata(
-    responses: pd.DataFrame,
+    responses: pd.DataFrame | PreparedResponses,
     metadata: pd.DataFrame | None,
     *,
     join_key: str = "survey_id",
     dimension_cols: Iterable[str] = ("course_name", "instructor_name", "round"),
-) -> pd.DataFrame:
+) -> pd.DataFrame | PreparedResponses:
+    if isinstance(responses, PreparedResponses):
+        return responses.with_dimension_metadata(metadata, join_key=join_key, dimension_cols=dimension_cols)
     if metadata is None or metadata.empty:
-        return responses.copy()
+        return responses.copy(deep=False)
     available_cols = [col for col in dimension_cols if col in metadata.columns]
     if join_key not in metadata.columns or not available_cols:
-        return responses.copy()
+        return responses.copy(deep=False)
     return responses.merge(metadata[[join_key, *available_cols]], on=join_key, how="left")
 
 
 def calculate_satisfaction(
-    responses: pd.DataFrame,
+    responses: pd.DataFrame | PreparedResponses,
+    *,
+    group_cols: Iterable[str],
+    score_col: str = "answer_value",
+) -> pd.DataFrame:
+    group_cols_list = list(group_cols)
+    return _score_cube(responses, group_cols_list, score_col).satisfaction(group_cols_list)
+
+
+def calculate_satisfaction_from_chunks(
+    chunks: Iterable[pd.DataFrame],
     *,
     group_cols: Iterable[str],
     score_col: str = "answer_value",
 ) -> pd.DataFrame:
-    df = responses.copy()
-    df[score_col] = _coerce_numeric(df[score_col])
-    df = df.dropna(subset=[score_col])
     group_cols_list = list(group_cols)
+    partials = []
+    for chunk in chunks:
+        scores = _coerce_numeric(chunk[score_col])
+        valid = scores.notna()
+        if not valid.any():
+            continue
+        if not group_cols_list:
+            partials.append(pd.DataFrame({"score_sum": [scores[valid].sum()], "response_count": [int(valid.sum())]}))
+            continue
+        partial = (
+            chunk.loc[valid, group_cols_list]
+            .assign(**{score_col: scores[valid]})
+            .groupby(group_cols_list, dropna=False, observed=True)[score_col]
+            .agg(score_sum="sum", response_count="count")
+        )
+        partials.append(partial)
+
     if not group_cols_list:
-        avg_score = df[score_col].mean() if not df.empty else 0.0
-        return pd.DataFrame({"mean_score": [avg_score], "response_count": [len(df)]})
-    return _safe_group_mean(df, group_cols_list, score_col)
+        score_sum = sum(float(partial["score_sum"].sum()) for partial in partials)
+        count = sum(int(partial["response_count"].sum()) for partial in partials)
+        return pd.DataFrame({"mean_score": [score_sum / count if count else 0.0], "response_count": [count]})
+    if not partials:
+        return pd.DataFrame(columns=[*group_cols_list, "mean_score", "response_count"])
+    combined = pd.concat(partials).groupby(level=list(range(len(group_cols_list))), dropna=False, observed=True).sum()
+    combined["mean_score"] = combined["score_sum"] / combined["response_count"]
+    return combined.reset_index()[[*group_cols_list, "mean_score", "response_count"]]
 
 
 def calculate_nps(
-    responses: pd.DataFrame,
+    responses: pd.DataFrame | PreparedResponses,
     *,
     score_col: str = "answer_value",
     question_bank: pd.DataFrame | None = None,
     nps_question_ids: Iterable[str] | None = None,
     group_cols: Iterable[str] | None = None,
 ) -> pd.DataFrame:
-    df = responses.copy()
-    df[score_col] = _coerce_numeric(df[score_col])
-    df = df.dropna(subset=[score_col])
+    # Scores are binned once into promoter/passive/detractor codes and the codes
+    # are counted per group in a single groupby, instead of one pass per group.
+    nps_ids = _nps_question_ids(question_bank, nps_question_ids)
+    group_cols_list = list(group_cols) if group_cols else []
+    return _score_cube(responses, group_cols_list, score_col, nps_ids).nps(group_cols_list)
 
-    if nps_question_ids is not None:
-        df = df[df["question_id"].isin(nps_question_ids)]
-    elif question_bank is not None and not question_bank.empty:
-        bank = question_bank.copy()
-        if "question_id" not in bank.columns and "id" in bank.columns:
-            bank = bank.rename(columns={"id": "question_id"})
-        if "category" in bank.columns:
-            nps_ids = bank[
-                bank["category"].astype(str).str.lower().isin(DEFAULT_NPS_CATEGORIES)
-            ]["question_id"].tolist()
-            if nps_ids:
-                df = df[df["question_id"].isin(nps_ids)]
-
-    if df.empty:
-        empty_cols = list(group_cols) if group_cols else []
-        return pd.DataFrame(columns=[*empty_cols, "nps", "promoters", "passives", "detractors", "total"])
-
-    def _compute_nps(series: pd.Series) -> NPSResult:
-        total = series.count()
-        promoters = (series >= 9).sum()
-        passives = ((series >= 7) & (series <= 8)).sum()
-        detractors = (series <= 6).sum()
-        if total == 0:
-            return NPSResult(score=0.0, promoters=0.0, passives=0.0, detractors=0.0, total=0)
-        promoters_pct = promoters / total * 100
-        detractors_pct = detractors / total * 100
-        passives_pct = passives / total * 100
-        score = promoters_pct - detractors_pct
-        return NPSResult(
-            score=score,
-            promoters=promoters_pct,
-            passives=passives_pct,
-            detractors=detractors_pct,
-            total=total,
-        )
 
-    group_cols_list = list(group_cols) if group_cols else []
-    if group_cols_list:
-        records = []
-        for keys, group in df.groupby(group_cols_list, dropna=False):
-            if not isinstance(keys, tuple):
-                keys = (keys,)
-            result = _compute_nps(group[score_col])
-            record = dict(zip(group_cols_list, keys))
-            record.update(
-                {
-                    "nps": result.score,
-                    "promoters": result.promoters,
-                    "passives": result.passives,
-                    "detractors": result.detractors,
-                    "total": result.total,
-                }
-            )
-            records.append(record)
-        return pd.DataFrame.from_records(records)
-
-    result = _compute_nps(df[score_col])
-    return pd.DataFrame(
-        [
-            {
-                "nps": result.score,
-                "promoters": result.promoters,
-                "passives": result.passives,
-                "detractors": result.detractors,
-                "total": result.total,
-            }
-        ]
-    )
+def _score_cube(
+    responses: pd.DataFrame | PreparedResponses,
+    group_cols: list[str],
+    score_col: str,
+    nps_ids: list[str] | None = None,
+) -> ScoreCube:
+    if isinstance(responses, PreparedResponses):
+        return responses.cube(group_cols, nps_ids)
+    nps_mask = None if nps_ids is None else responses["question_id"].isin(nps_ids).to_numpy()
+    return build_score_cube(responses, dimensions=group_cols, score_col=score_col, nps_mask=nps_mask)
+
+
+def _nps_question_ids(
+    question_bank: pd.DataFrame | None,
+    nps_question_ids: Iterable[str] | None = None,
+) -> list[str] | None:
+    """Question IDs that count toward NPS, or None when every question does."""
+    if nps_question_ids is not None:
+        return list(nps_question_ids)
+    if question_bank is None or question_bank.empty:
+        return None
+    bank = question_bank
+    if "question_id" not in bank.columns and "id" in bank.columns:
+        bank = bank.rename(columns={"id": "question_id"})
+    if "category" not in bank.columns:
+        return None
+    nps_ids = bank[bank["category"].astype(str).str.lower().isin(DEFAULT_NPS_CATEGORIES)]["question_id"].tolist()
+    return nps_ids or None
 
 
 def build_quantitative_snapshot(
-    responses: pd.DataFrame,
+    responses: pd.DataFrame | PreparedResponses | ResponseAggregateStore,
     *,
     question_bank: pd.DataFrame | None = None,
     metadata: pd.DataFrame | None = None,
@@ -171,32 +229,252 @@ def build_quantitative_snapshot(
     instructor_col: str = "instructor_name",
     round_col: str = "round",
 ) -> dict[str, pd.DataFrame]:
-    enriched = attach_question_metadata(responses, question_bank)
-    enriched = attach_dimension_metadata(
-        enriched,
-        metadata,
-        dimension_cols=(course_col, instructor_col, round_col),
+    dimension_cols = (course_col, instructor_col, round_col)
+    nps_ids = _nps_question_ids(question_bank)
+    if isinstance(responses, ResponseAggregateStore):
+        # Materialized aggregates: the cube comes from stored cells, not rows.
+        cube = responses.cube(metadata, dimension_cols=dimension_cols, nps_question_ids=nps_ids)
+    else:
+        prepared = prepare_responses(
+            responses,
+            question_bank=question_bank,
+            metadata=metadata,
+            dimension_cols=dimension_cols,
+        ).with_filled_dimensions(dimension_cols, "미지정")
+        # One scan builds the course x instructor x round cube; every breakdown
+        # below is a grouping set re-aggregated from its partial sums.
+        cube = prepared.cube(dimension_cols, nps_ids)
+
+    return {
+        "overall": cube.satisfaction(),
+        "by_course": cube.satisfaction([course_col]),
+        "by_instructor": cube.satisfaction([instructor_col]),
+        "by_round": cube.satisfaction([round_col]),
+        "nps": cube.nps(list(dimension_cols)),
+    }
+
+
+def bootstrap_confidence_intervals(
+    responses: pd.DataFrame | PreparedResponses,
+    *,
+    group_cols: Iterable[str] = (),
+    statistic: str = "mean",
+    score_col: str = "answer_value",
+    question_bank: pd.DataFrame | None = None,
+    nps_question_ids: Iterable[str] | None = None,
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: int = 0,
+    workers: int | None = None,
+) -> pd.DataFrame:
+    """Percentile bootstrap intervals for mean satisfaction or NPS per group.
+
+    Every group is resampled at once: rows are sorted by group, each draw picks
+    a random row inside its group's span, and group sums come from one
+    ``np.add.reduceat`` per batch of resamples. NPS is the mean of +100/0/-100
+    promoter/passive/detractor values, so both statistics share the engine.
+    Resamples are split into fixed batches with seeds spawned from ``seed``, so
+    results are identical with or without a process pool (``workers > 1``,
+    ``-1`` for every CPU).
+    """
+    if statistic not in BOOTSTRAP_STATISTICS:
+        raise ValueError(f"Unknown statistic: {statistic}. Expected one of {BOOTSTRAP_STATISTICS}.")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1.")
+    if n_resamples < 1:
+        raise ValueError("n_resamples must be a positive integer.")
+    group_cols_list = list(group_cols)
+    columns = [*group_cols_list, "estimate", "ci_lower", "ci_upper", "response_count"]
+
+    scores = responses.scores if isinstance(responses, PreparedResponses) else score_array(responses[score_col])
+    rows = ~np.isnan(scores)
+    if statistic == "nps":
+        nps_ids = _nps_question_ids(question_bank, nps_question_ids)
+        nps_mask = _question_mask(responses, nps_ids)
+        if nps_mask is not None:
+            rows &= nps_mask
+        values = np.select([nps_bins(scores) == 0, nps_bins(scores) == 2], [100.0, -100.0], 0.0)[rows]
+    else:
+        values = scores[rows]
+    if not len(values):
+        return pd.DataFrame(columns=columns)
+
+    group_ids, index = _group_index(responses, group_cols_list, rows)
+    order = np.argsort(group_ids, kind="stable")
+    counts = np.bincount(group_ids)
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    sorted_values = values[order]
+    estimate = np.add.reduceat(sorted_values, offsets) / counts
+
+    means = _bootstrap_means(sorted_values, offsets, counts, n_resamples, seed, workers)
+    tail = (1 - confidence) / 2
+    lower, upper = np.quantile(means, [tail, 1 - tail], axis=0)
+    result = pd.DataFrame(
+        {
+            "estimate": estimate,
+            "ci_lower": lower,
+            "ci_upper": upper,
+            "response_count": counts.astype(np.int64),
+        },
+        index=index,
     )
+    if not group_cols_list:
+        return result.reset_index(drop=True)
+    return result.reset_index()[columns]
+
+
+def _question_mask(
+    responses: pd.DataFrame | PreparedResponses,
+    question_ids: list[str] | None,
+) -> np.ndarray | None:
+    if isinstance(responses, PreparedResponses):
+        return responses.question_mask(question_ids)
+    if question_ids is None:
+        return None
+    return responses["question_id"].isin(question_ids).to_numpy()
+
+
+def _group_index(
+    responses: pd.DataFrame | PreparedResponses,
+    group_cols: list[str],
+    rows: np.ndarray,
+) -> tuple[np.ndarray, pd.Index | None]:
+    if isinstance(responses, PreparedResponses):
+        return responses.group_index(group_cols, rows)
+    return group_index({col: responses[col].array for col in group_cols}, rows)
+
 
-    for col in (course_col, instructor_col, round_col):
-        if col not in enriched.columns:
-            enriched[col] = "미지정"
-        enriched[col] = enriched[col].fillna("미지정")
-
-    overall = calculate_satisfaction(enriched, group_cols=[])
-    by_course = calculate_satisfaction(enriched, group_cols=[course_col])
-    by_instructor = calculate_satisfaction(enriched, group_cols=[instructor_col])
-    by_round = calculate_satisfaction(enriched, group_cols=[round_col])
-    nps = calculate_nps(
-        enriched,
-        question_bank=question_bank,
-        group_cols=[course_col, instructor_col, round_col],
+def _bootstrap_means(
+    values: np.ndarray,
+    offsets: np.ndarray,
+    counts: np.ndarray,
+    n_resamples: int,
+    seed: int,
+    workers: int | None,
+) -> np.ndarray:
+    batch = max(1, _BOOTSTRAP_BATCH_DRAWS // len(values))
+    sizes = [min(batch, n_resamples - start) for start in range(0, n_resamples, batch)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers is not None and workers < 0:
+        workers = os.cpu_count() or 1
+    if not workers or workers <= 1 or len(sizes) == 1:
+        return np.vstack([_bootstrap_batch(values, offsets, counts, size, child) for size, child in zip(sizes, seeds)])
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_bootstrap_worker,
+        initargs=(values, offsets, counts),
+    ) as pool:
+        return np.vstack(list(pool.map(_bootstrap_worker_batch, sizes, seeds)))
+
+
+def _bootstrap_batch(
+    values: np.ndarray,
+    offsets: np.ndarray,
+    counts: np.ndarray,
+    size: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    starts = np.repeat(offsets, counts)
+    spans = np.repeat(counts, counts)
+    uniforms = rng.random((size, len(values)))
+    uniforms *= spans
+    picks = uniforms.astype(np.int64)
+    picks += starts
+    return np.add.reduceat(values[picks], offsets, axis=1) / counts
+
+
+def _init_bootstrap_worker(values: np.ndarray, offsets: np.ndarray, counts: np.ndarray) -> None:
+    global _BOOTSTRAP_DATA
+    _BOOTSTRAP_DATA = (values, offsets, counts)
+
+
+def _bootstrap_worker_batch(size: int, seed: np.random.SeedSequence) -> np.ndarray:
+    if _BOOTSTRAP_DATA is None:
+        raise RuntimeError("Bootstrap worker was not initialized.")
+    return _bootstrap_batch(*_BOOTSTRAP_DATA, size, seed)
+
+
+def calculate_distributions(
+    responses: pd.DataFrame | PreparedResponses,
+    *,
+    group_cols: Iterable[str] = (),
+    score_col: str = "answer_value",
+    question_col: str = "question_id",
+    scales: Mapping[str, tuple[int, int]] | None = None,
+    question_bank: pd.DataFrame | None = None,
+    nps_question_ids: Iterable[str] | None = None,
+    default_scale: tuple[int, int] = LIKERT_SCALE,
+) -> ScoreDistribution:
+    """Histograms of integer answers for every question in every group.
+
+    Answers are stored as int8 scale points and all (question, group)
+    histograms come from one ``np.bincount`` over combined group and point
+    codes. Non-integer scores are left out. Each question's (low, high) scale
+    comes from ``scales``, else NPS_SCALE for NPS questions (from
+    ``nps_question_ids`` or the bank's NPS category), else ``default_scale``.
+    Scales are never guessed from the answers, since a 0-10 question whose
+    answers stop at 5 would get the wrong box scores; a question answered
+    outside its scale raises ValueError and needs an entry in ``scales``.
+    """
+    key_cols = [question_col, *group_cols]
+    scores = responses.scores if isinstance(responses, PreparedResponses) else score_array(responses[score_col])
+    with np.errstate(invalid="ignore"):
+        rows = (scores == np.round(scores)) & (scores >= -128) & (scores <= 127)
+    points = scores[rows].astype(np.int8)
+    if not len(points):
+        return ScoreDistribution(
+            index=pd.MultiIndex.from_arrays([[] for _ in key_cols], names=key_cols) if len(key_cols) > 1 else pd.Index([], name=question_col),
+            points=np.empty(0, dtype=np.int8),
+            counts=np.empty((0, 0), dtype=np.int64),
+            scales=np.empty((0, 2), dtype=np.int64),
+        )
+
+    group_ids, index = _group_index(responses, key_cols, rows)
+    low = int(points.min())
+    width = int(points.max()) - low + 1
+    codes = group_ids * width + (points.astype(np.int64) - low)
+    counts = np.bincount(codes, minlength=len(index) * width).reshape(len(index), width)
+    point_values = np.arange(low, low + width, dtype=np.int8)
+
+    questions = index.get_level_values(question_col) if isinstance(index, pd.MultiIndex) else index
+    nps_ids = _nps_question_ids(question_bank, nps_question_ids)
+    row_scales = _question_scales(questions, counts, point_values, scales or {}, nps_ids or (), default_scale)
+    # Widen the point axis so every row's full scale is addressable.
+    scale_low = min(low, int(row_scales[:, 0].min()))
+    scale_high = max(low + width - 1, int(row_scales[:, 1].max()))
+    padded = np.zeros((len(index), scale_high - scale_low + 1), dtype=np.int64)
+    padded[:, low - scale_low : low - scale_low + width] = counts
+    return ScoreDistribution(
+        index=index,
+        points=np.arange(scale_low, scale_high + 1, dtype=np.int8),
+        counts=padded,
+        scales=row_scales,
     )
 
-    return {
-        "overall": overall,
-        "by_course": by_course,
-        "by_instructor": by_instructor,
-        "by_round": by_round,
-        "nps": nps,
-    }
+
+def _question_scales(
+    questions: pd.Index,
+    counts: np.ndarray,
+    points: np.ndarray,
+    scales: Mapping[str, tuple[int, int]],
+    nps_ids: Iterable[str],
+    default_scale: tuple[int, int],
+) -> np.ndarray:
+    codes, uniques = pd.factorize(questions)
+    per_question = np.zeros((len(uniques), counts.shape[1]), dtype=np.int64)
+    np.add.at(per_question, codes, counts)
+    answered = per_question > 0
+    observed_low = points[answered.argmax(axis=1)]
+    observed_high = points[counts.shape[1] - 1 - answered[:, ::-1].argmax(axis=1)]
+
+    nps_ids = set(nps_ids)
+    question_scales = np.array(
+        [scales.get(question, NPS_SCALE if question in nps_ids else default_scale) for question in uniques],
+        dtype=np.int64,
+    ).reshape(len(uniques), 2)
+    outside = (observed_low < question_scales[:, 0]) | (observed_high > question_scales[:, 1])
+    if outside.any():
+        names = ", ".join(str(question) for question in uniques[outside][:5])
+        raise ValueError(f"Answers fall outside the question scale for {names}; pass their (low, high) in scales.")
+    return question_scales[codes]
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+NPS_PROMOTER_MIN = 9
+NPS_PASSIVE_MIN = 7
+NPS_DETRACTOR_MAX = 6
+CUBE_MEASURES = ("score_sum", "response_count", "nps_total", "promoters", "passives", "detractors")
+NPS_COLUMNS = ("nps", "promoters", "passives", "detractors", "total")
+_MAX_DENSE_CELLS = 1 << 24
+
+
+@dataclass(frozen=True)
+class ScoreCube:
+    """Additive score and NPS counts per cell of a set of dimensions.
+
+    Every rollup (GROUPING SETS over any subset of ``dimensions``) is a
+    re-aggregation of the cells, so the responses are scanned once no matter how
+    many breakdowns are requested.
+    """
+
+    dimensions: tuple[str, ...]
+    cells: pd.DataFrame
+
+    def rollup(self, group_cols: Iterable[str] = ()) -> pd.DataFrame:
+        """Sum the cells up to ``group_cols``; returns the measures indexed by them."""
+        group_cols_list = list(group_cols)
+        missing = [col for col in group_cols_list if col not in self.dimensions]
+        if missing:
+            raise KeyError(f"Columns are not cube dimensions: {missing}")
+        if not group_cols_list:
+            return self.cells.sum().to_frame().T
+        if group_cols_list == list(self.dimensions):
+            return self.cells
+        return self.cells.groupby(level=group_cols_list, dropna=False, observed=True).sum()
+
+    def satisfaction(self, group_cols: Iterable[str] = ()) -> pd.DataFrame:
+        """Mean score and response count in calculate_satisfaction's layout."""
+        group_cols_list = list(group_cols)
+        totals = self.rollup(group_cols_list)
+        if not group_cols_list:
+            count = int(totals["response_count"].iloc[0]) if len(totals) else 0
+            mean = float(totals["score_sum"].iloc[0]) / count if count else 0.0
+            return pd.DataFrame({"mean_score": [mean], "response_count": [count]})
+        totals = totals[totals["response_count"] > 0]
+        if totals.empty:
+            return pd.DataFrame(columns=[*group_cols_list, "mean_score", "response_count"])
+        result = pd.DataFrame(
+            {
+                "mean_score": totals["score_sum"] / totals["response_count"],
+                "response_count": totals["response_count"].astype("int64"),
+            }
+        )
+        return result.reset_index()
+
+    def nps(self, group_cols: Iterable[str] = ()) -> pd.DataFrame:
+        """NPS percentages and totals in calculate_nps's layout."""
+        group_cols_list = list(group_cols)
+        totals = self.rollup(group_cols_list)
+        totals = totals[totals["nps_total"] > 0]
+        if totals.empty:
+            return pd.DataFrame(columns=[*group_cols_list, *NPS_COLUMNS])
+        total = totals["nps_total"].astype("int64")
+        promoters = totals["promoters"] / total * 100
+        passives = totals["passives"] / total * 100
+        detractors = totals["detractors"] / total * 100
+        result = pd.DataFrame(
+            {
+                "nps": promoters - detractors,
+                "promoters": promoters,
+                "passives": passives,
+                "detractors": detractors,
+                "total": total,
+            }
+        )
+        if not group_cols_list:
+            return result.reset_index(drop=True)
+        return result.reset_index()
+
+
+def build_score_cube(
+    responses: pd.DataFrame,
+    *,
+    dimensions: Sequence[str] = (),
+    score_col: str = "answer_value",
+    nps_mask: np.ndarray | pd.Series | None = None,
+) -> ScoreCube:
+    """Scan ``responses`` once into a ScoreCube over ``dimensions``.
+
+    Rows with a non-numeric score are ignored. ``nps_mask`` marks the rows that
+    count toward NPS; without it every scored row does.
+    """
+    keys = {col: responses[col].array for col in dimensions}
+    return cube_from_scores(keys, score_array(responses[score_col]), nps_mask=nps_mask)
+
+
+def cube_from_scores(
+    keys: Mapping[str, Sequence],
+    scores: np.ndarray,
+    *,
+    nps_mask: np.ndarray | None = None,
+) -> ScoreCube:
+    """Build a ScoreCube from parsed scores and one key array per dimension.
+
+    Keys are reduced to integer codes and combined into one cell id per row;
+    every measure is then a single ``np.bincount`` over the cell ids, so no
+    per-row measure frame is materialized.
+    """
+    valid = ~np.isnan(scores)
+    is_nps = valid if nps_mask is None else valid & np.asarray(nps_mask, dtype=bool)
+    cell_ids, index = group_index(keys, valid)
+    size = 1 if index is None else len(index)
+
+    bins = nps_bins(scores[valid])
+    nps_rows = is_nps[valid]
+    data = {
+        "score_sum": np.bincount(cell_ids, weights=scores[valid], minlength=size).astype(np.float64),
+        "response_count": np.bincount(cell_ids, minlength=size),
+        "nps_total": np.bincount(cell_ids[nps_rows], minlength=size),
+        "promoters": np.bincount(cell_ids[nps_rows & (bins == 0)], minlength=size),
+        "passives": np.bincount(cell_ids[nps_rows & (bins == 1)], minlength=size),
+        "detractors": np.bincount(cell_ids[nps_rows & (bins == 2)], minlength=size),
+    }
+    return ScoreCube(dimensions=tuple(keys), cells=pd.DataFrame(data, index=index))
+
+
+def group_index(keys: Mapping[str, Sequence], rows: np.ndarray) -> tuple[np.ndarray, pd.Index | None]:
+    """Dense group ids (in sorted key order) for the selected ``rows``.
+
+    Returns the id of every selected row plus the index of observed groups;
+    with no keys every row is group 0 and the index is None. Missing keys form
+    their own group, sorted last, like ``groupby(dropna=False)``.
+    """
+    row_count = int(rows.sum())
+    if not keys:
+        return np.zeros(row_count, dtype=np.int64), None
+    key_codes = [_key_codes(values) for values in keys.values()]
+
+    cell_ids = np.zeros(row_count, dtype=np.int64)
+    cardinality = 1
+    for codes, level in key_codes:
+        slots = np.where(codes < 0, len(level), codes)[rows]
+        radix = len(level) + 1
+        if cardinality * radix > _MAX_DENSE_CELLS:
+            # Re-number the observed combinations before the ids could overflow.
+            _, cell_ids = np.unique(cell_ids, return_inverse=True)
+            cardinality = int(cell_ids.max()) + 1 if len(cell_ids) else 1
+        cell_ids = cell_ids * radix + slots
+        cardinality *= radix
+
+    if cardinality > _MAX_DENSE_CELLS:
+        observed, cell_ids = np.unique(cell_ids, return_inverse=True)
+        cardinality = len(observed)
+    present = np.bincount(cell_ids, minlength=cardinality) > 0
+    dense = np.cumsum(present) - 1
+    group_ids = dense[cell_ids]
+
+    # One representative row per group recovers each dimension's code.
+    representative = np.empty(int(present.sum()), dtype=np.int64)
+    representative[group_ids[::-1]] = np.arange(len(group_ids) - 1, -1, -1)
+    level_codes = [codes[rows][representative] for codes, _ in key_codes]
+    levels = [level for _, level in key_codes]
+    names = list(keys)
+    if len(names) == 1:
+        return group_ids, _level_take(levels[0], level_codes[0], names[0])
+    return group_ids, pd.MultiIndex(levels=levels, codes=level_codes, names=names, verify_integrity=False)
+
+
+def score_array(series: pd.Series) -> np.ndarray:
+    """float64 scores with NaN for blank or non-numeric answers."""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    # Answers come from a small set of scale values, so parse each distinct one once.
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    parsed = pd.to_numeric(pd.Series(np.asarray(uniques, dtype=object), dtype=object), errors="coerce")
+    unique_scores = np.append(parsed.to_numpy(dtype=np.float64, na_value=np.nan), np.nan)
+    return unique_scores[codes]
+
+
+def nps_bins(scores: np.ndarray) -> np.ndarray:
+    """int8 codes per score: 0 promoter, 1 passive, 2 detractor, 3 unscored."""
+    codes = np.full(len(scores), 3, dtype=np.int8)
+    codes[scores <= NPS_DETRACTOR_MAX] = 2
+    codes[(scores >= NPS_PASSIVE_MIN) & (scores <= NPS_PROMOTER_MIN - 1)] = 1
+    codes[scores >= NPS_PROMOTER_MIN] = 0
+    return codes
+
+
+def _key_codes(values: Sequence) -> tuple[np.ndarray, pd.Index]:
+    """Integer codes (-1 for missing) plus the sorted level they index into."""
+    if isinstance(getattr(values, "dtype", None), pd.CategoricalDtype):
+        categorical = pd.Categorical(values)
+        return categorical.codes, pd.CategoricalIndex(categorical.categories, dtype=categorical.dtype)
+    if isinstance(values, pd.arrays.NumpyExtensionArray):
+        # factorize(sort=True) rejects the numpy-backed wrapper returned by
+        # Series.array, so sort on the underlying ndarray.
+        values = values.to_numpy()
+    try:
+        codes, uniques = pd.factorize(values, sort=True, use_na_sentinel=True)
+    except TypeError:
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    return codes, pd.Index(uniques)
+
+
+def _level_take(level: pd.Index, codes: np.ndarray, name: str) -> pd.Index:
+    if isinstance(level, pd.CategoricalIndex):
+        index = pd.CategoricalIndex(pd.Categorical.from_codes(codes, dtype=level.dtype))
+    else:
+        index = pd.MultiIndex(levels=[level], codes=[codes], verify_integrity=False).get_level_values(0)
+    return index.rename(name)
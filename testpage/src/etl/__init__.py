@@ -1,17 +1,63 @@
 """ETL helpers for survey ingestion and normalization."""
 
+from .http_cache import CsvExportCache
+from .masking import ProperNounMasker
+from .match_cache import QuestionMatchCache
+from .matching import QuestionBankIndex, TfidfQuestionScorer
+from .reshape import WideReshapeResult, reshape_wide_responses
+from .responses import (
+    RESPONSE_COLUMNS,
+    RESPONSE_ID_COLUMNS,
+    compact_responses,
+    load_typed_responses,
+    response_read_dtypes,
+)
+from .schema import SurveySchema, infer_survey_schema, match_standard_column
 from .survey import (
     COLUMN_STANDARDIZATION_MAP,
+    SCORER_THRESHOLDS,
+    SHEET_ORIGIN_COLUMN,
+    build_question_bank_index,
     classify_questions,
+    column_alias_index,
+    iter_raw_survey_data,
+    iter_survey_workbook,
     load_raw_survey_data,
+    load_survey_workbook,
     mask_proper_nouns,
+    match_question_table,
+    normalize_series,
     standardize_columns,
 )
 
 __all__ = [
     "COLUMN_STANDARDIZATION_MAP",
+    "CsvExportCache",
+    "ProperNounMasker",
+    "QuestionBankIndex",
+    "QuestionMatchCache",
+    "RESPONSE_COLUMNS",
+    "RESPONSE_ID_COLUMNS",
+    "SCORER_THRESHOLDS",
+    "SHEET_ORIGIN_COLUMN",
+    "SurveySchema",
+    "TfidfQuestionScorer",
+    "WideReshapeResult",
+    "build_question_bank_index",
     "classify_questions",
+    "column_alias_index",
+    "compact_responses",
+    "infer_survey_schema",
+    "iter_raw_survey_data",
+    "iter_survey_workbook",
     "load_raw_survey_data",
+    "load_survey_workbook",
+    "load_typed_responses",
     "mask_proper_nouns",
+    "match_question_table",
+    "match_standard_column",
+    "normalize_series",
+    "reshape_wide_responses",
+    "response_read_dtypes",
     "standardize_columns",
 ]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib import error, request
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+
+class CsvExportCache:
+    """On-disk cache for CSV exports fetched over HTTP, keyed by export URL.
+
+    Each URL keeps its response body plus the ETag/Last-Modified validators.
+    Within ``ttl`` seconds of the last check the body is served from disk
+    without touching the network. After that the request is sent with
+    If-None-Match/If-Modified-Since, and a 304 reply also serves from disk.
+    With ``stale_on_error`` a cached body is served when the server cannot be
+    reached.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        stale_on_error: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.timeout = timeout
+        self.stale_on_error = stale_on_error
+        self.hits = 0
+        self.revalidations = 0
+        self.downloads = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, url: str) -> Path:
+        """Return the path of a fresh local copy of ``url``'s body.
+
+        The lock covers only the meta and body files, so fetches of different
+        URLs (and slow servers) do not wait on each other's network round trips.
+        """
+        body_path, meta_path = self._paths(url)
+        with self._lock:
+            meta = self._read_meta(meta_path) if body_path.exists() else None
+            if meta is not None and time.time() - meta.get("checked_at", 0.0) < self.ttl:
+                self.hits += 1
+                return body_path
+
+        headers = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        downloaded: str | None = None
+        try:
+            with request.urlopen(request.Request(url, headers=headers), timeout=self.timeout) as response:
+                downloaded = self._download(response)
+                meta = {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+        except error.HTTPError as exc:
+            if exc.code != 304 or meta is None:
+                raise
+            # A 304 may carry updated validators; keep the stored ones otherwise.
+            meta["etag"] = exc.headers.get("ETag") or meta.get("etag")
+            meta["last_modified"] = exc.headers.get("Last-Modified") or meta.get("last_modified")
+        except (error.URLError, OSError):
+            if meta is None or not self.stale_on_error:
+                raise
+            with self._lock:
+                self.hits += 1
+            return body_path
+
+        meta["checked_at"] = time.time()
+        with self._lock:
+            if downloaded is None:
+                self.revalidations += 1
+            else:
+                os.replace(downloaded, body_path)
+                self.downloads += 1
+            self._write_meta(meta_path, meta)
+        return body_path
+
+    def invalidate(self, url: str) -> None:
+        for path in self._paths(url):
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for pattern in ("*.csv", "*.json"):
+            for path in self.directory.glob(pattern):
+                path.unlink(missing_ok=True)
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return self.directory / f"{digest}.csv", self.directory / f"{digest}.json"
+
+    def _download(self, response) -> str:
+        # Streams into a temp file next to the cache; the caller moves it into place.
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        try:
+            with os.fdopen(handle, "wb") as stream:
+                shutil.copyfileobj(response, stream, length=1 << 20)
+            return temp_path
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def _read_meta(meta_path: Path) -> dict | None:
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, meta_path: Path, meta: dict) -> None:
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        with os.fdopen(handle, "w", encoding="utf-8") as stream:
+            json.dump(meta, stream)
+        os.replace(temp_path, meta_path)
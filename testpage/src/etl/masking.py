@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+COURSE_PLACEHOLDER = "{{COURSE}}"
+INSTRUCTOR_PLACEHOLDER = "{{INSTRUCTOR}}"
+CLIENT_PLACEHOLDER = "{{CLIENT}}"
+
+_TERMINAL = ""
+# Question text is normalized by replacing these runs with a space (see normalize_series).
+_NON_WORD_RUN = re.compile(r"[\W\d_]+")
+
+
+class ProperNounMasker:
+    """One-pass proper noun masker compiled from a replacement mapping.
+
+    All keys are merged into a single character trie, so a text is scanned once
+    regardless of roster size. Matches are leftmost-longest and non-overlapping:
+    with both "김철" and "김철수" in the roster, "김철수" wins.
+    """
+
+    def __init__(self, replacements: Mapping[str, str]) -> None:
+        self.replacements = {original: placeholder for original, placeholder in replacements.items() if original}
+        self._trie: dict[str, dict] = {}
+        for original, placeholder in self.replacements.items():
+            node = self._trie
+            for char in original:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = (len(original), placeholder)
+
+    @classmethod
+    def from_roster(
+        cls,
+        *,
+        courses: Iterable[str] = (),
+        instructors: Iterable[str] = (),
+        clients: Iterable[str] = (),
+    ) -> ProperNounMasker:
+        """Build a masker from roster lists; later lists win on duplicate names.
+
+        Names are normalized with the question text rules, since masking runs
+        on normalized questions: "김철수(PM)" is matched as "김철수 PM".
+        """
+        replacements: dict[str, str] = {}
+        for names, placeholder in (
+            (courses, COURSE_PLACEHOLDER),
+            (instructors, INSTRUCTOR_PLACEHOLDER),
+            (clients, CLIENT_PLACEHOLDER),
+        ):
+            for name in names:
+                key = _normalize_name(name) if isinstance(name, str) else ""
+                if key:
+                    replacements[key] = placeholder
+        return cls(replacements)
+
+    def __len__(self) -> int:
+        return len(self.replacements)
+
+    def mask(self, text: str) -> str:
+        if not self._trie or not text:
+            return text
+        root = self._trie
+        pieces: list[str] = []
+        copied = 0
+        position = 0
+        length = len(text)
+        while position < length:
+            node = root.get(text[position])
+            if node is None:
+                position += 1
+                continue
+            found = node.get(_TERMINAL)
+            cursor = position + 1
+            while cursor < length:
+                node = node.get(text[cursor])
+                if node is None:
+                    break
+                cursor += 1
+                found = node.get(_TERMINAL, found)
+            if found is None:
+                position += 1
+                continue
+            match_length, placeholder = found
+            pieces.append(text[copied:position])
+            pieces.append(placeholder)
+            position += match_length
+            copied = position
+        if not pieces:
+            return text
+        pieces.append(text[copied:])
+        return "".join(pieces)
+
+    def mask_series(self, series: pd.Series) -> pd.Series:
+        """Mask every string in ``series``; non-string values are left untouched.
+
+        Each distinct value is masked once, so repeated question texts cost one scan.
+        """
+        if not self._trie:
+            return series.copy()
+        codes, uniques = pd.factorize(series, use_na_sentinel=False)
+        masked = np.empty(len(uniques), dtype=object)
+        masked[:] = [self.mask(value) if isinstance(value, str) else value for value in uniques]
+        return pd.Series(masked[codes], index=series.index, name=series.name).astype(series.dtype)
+
+
+def _normalize_name(name: str) -> str:
+    return _NON_WORD_RUN.sub(" ", name).strip()
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Mapping, Sequence
+
+CachedMatch = tuple[str, str, str | int | None, float]
+
+_LOOKUP_BATCH = 500
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS question_matches (
+    cleaned TEXT NOT NULL,
+    scorer TEXT NOT NULL,
+    existing_threshold REAL NOT NULL,
+    similar_threshold REAL NOT NULL,
+    status TEXT NOT NULL,
+    note TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    score REAL NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (cleaned, scorer, existing_threshold, similar_threshold)
+);
+CREATE INDEX IF NOT EXISTS question_matches_last_used ON question_matches (last_used);
+"""
+
+
+class QuestionMatchCache:
+    """SQLite-backed LRU cache of classify_questions results.
+
+    Entries are keyed by the cleaned (normalized and masked) question text, the
+    scorer and both thresholds. The cache is tied to one question bank version at
+    a time; binding it to a different version drops every stored entry.
+    """
+
+    def __init__(self, path: str | Path = ":memory:", *, max_entries: int = 50_000) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+        self.path = str(path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM question_matches").fetchone()[0]
+
+    @property
+    def bank_version(self) -> str | None:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache_meta WHERE key = 'bank_version'").fetchone()
+        return row[0] if row else None
+
+    def bind_bank_version(self, bank_version: str) -> None:
+        """Invalidate all entries if they were computed against another bank version."""
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value FROM cache_meta WHERE key = 'bank_version'").fetchone()
+            if row and row[0] == bank_version:
+                return
+            self._conn.execute("DELETE FROM question_matches")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_meta (key, value) VALUES ('bank_version', ?)",
+                (bank_version,),
+            )
+
+    def get_many(
+        self,
+        cleaned: Iterable[str],
+        *,
+        scorer: str,
+        existing_threshold: float,
+        similar_threshold: float,
+    ) -> dict[str, CachedMatch]:
+        """Return cached ``(status, note, match_id, score)`` for every hit."""
+        keys = list(dict.fromkeys(cleaned))
+        hits: dict[str, CachedMatch] = {}
+        with self._lock, self._conn:
+            for start in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[start : start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    "SELECT cleaned, status, note, match_id, score FROM question_matches "
+                    "WHERE scorer = ? AND existing_threshold = ? AND similar_threshold = ? "
+                    f"AND cleaned IN ({placeholders})",
+                    (scorer, existing_threshold, similar_threshold, *batch),
+                ).fetchall()
+                for text, status, note, match_id, score in rows:
+                    hits[text] = (status, note, json.loads(match_id), score)
+            if hits:
+                now = time.time_ns()
+                self._conn.executemany(
+                    "UPDATE question_matches SET last_used = ? WHERE cleaned = ? AND scorer = ? "
+                    "AND existing_threshold = ? AND similar_threshold = ?",
+                    [(now, text, scorer, existing_threshold, similar_threshold) for text in hits],
+                )
+        return hits
+
+    def put_many(
+        self,
+        matches: Mapping[str, CachedMatch] | Sequence[tuple[str, CachedMatch]],
+        *,
+        scorer: str,
+        existing_threshold: float,
+        similar_threshold: float,
+    ) -> None:
+        """Store results and evict the least recently used entries beyond max_entries."""
+        items = matches.items() if isinstance(matches, Mapping) else matches
+        now = time.time_ns()
+        rows = [
+            (
+                text,
+                scorer,
+                existing_threshold,
+                similar_threshold,
+                status,
+                note,
+                json.dumps(match_id, default=_json_scalar),
+                score,
+                now,
+            )
+            for text, (status, note, match_id, score) in items
+        ]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO question_matches "
+                "(cleaned, scorer, existing_threshold, similar_threshold, status, note, match_id, score, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM question_matches").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM question_matches WHERE rowid IN ("
+                    "SELECT rowid FROM question_matches ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+
+def _json_scalar(value: object) -> object:
+    # Bank IDs taken from a DataFrame arrive as numpy scalars; store them as the
+    # matching Python int/str so cached IDs round-trip with the same type.
+    item = getattr(value, "item", None)
+    if callable(item):
+        return item()
+    return str(value)
@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Sequence
+
+import numpy as np
+
+BankRecord = tuple[str | int | None, str]
+
+_PAD = "\x00"
+_EPSILON = 1e-9
+_TFIDF_BATCH_CELLS = 4_000_000
+PARALLEL_MIN_QUESTIONS = 1000
+
+_WORKER_INDEX: QuestionBankIndex | None = None
+
+
+class QuestionBankIndex:
+    """Q-gram inverted index over a normalized question bank.
+
+    Candidates are pruned with a length filter and a q-gram count filter before
+    the exact Levenshtein similarity is verified, so the scores returned are the
+    same as an exhaustive scan for every candidate that can reach ``min_score``.
+    """
+
+    def __init__(self, records: Sequence[BankRecord], normalized: Sequence[str], *, q: int = 2) -> None:
+        if q < 1:
+            raise ValueError("q must be a positive integer.")
+        if len(records) != len(normalized):
+            raise ValueError("records and normalized texts must have the same length.")
+        self.q = q
+        self.records = list(records)
+        self.normalized = list(normalized)
+        self._lengths = [len(text) for text in self.normalized]
+
+        by_length: dict[int, list[int]] = defaultdict(list)
+        postings: dict[str, list[tuple[int, int, int]]] = defaultdict(list)
+        for position, text in enumerate(self.normalized):
+            by_length[len(text)].append(position)
+            for gram, count in _qgrams(text, q).items():
+                postings[gram].append((len(text), position, count))
+
+        self._tfidf: TfidfQuestionScorer | None = None
+        self._version: str | None = None
+        self._by_length = dict(by_length)
+        self._sorted_lengths = sorted(by_length)
+        self._postings: dict[str, tuple[list[int], list[int], list[int]]] = {}
+        for gram, entries in postings.items():
+            entries.sort()
+            self._postings[gram] = (
+                [length for length, _, _ in entries],
+                [position for _, position, _ in entries],
+                [count for _, _, count in entries],
+            )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def version(self) -> str:
+        """Content hash of the bank records, used to invalidate derived caches."""
+        if self._version is None:
+            self._version = bank_version(self.records)
+        return self._version
+
+    @property
+    def tfidf(self) -> TfidfQuestionScorer:
+        """TF-IDF scorer over the same normalized bank, built on first use."""
+        if self._tfidf is None:
+            self._tfidf = TfidfQuestionScorer(self.normalized)
+        return self._tfidf
+
+    def best_match(self, text: str, min_score: float = 0.0) -> tuple[int | None, float]:
+        """Return the bank position and score of the best match reaching ``min_score``."""
+        if min_score <= 0:
+            candidates: Sequence[int] = range(len(self.records))
+        else:
+            candidates = self._candidates(text, min_score)
+
+        best_position: int | None = None
+        best_score = 0.0
+        for position in candidates:
+            floor_score = best_score if best_position is not None else min_score
+            score = _similarity_ratio(text, self.normalized[position], floor_score)
+            if score > best_score or (
+                score == best_score and best_position is not None and position < best_position
+            ):
+                best_score = score
+                best_position = position
+
+        if best_position is None or best_score < min_score:
+            return None, 0.0
+        return best_position, best_score
+
+    def best_matches(
+        self,
+        texts: Sequence[str],
+        min_score: float = 0.0,
+        *,
+        scorer: str = "levenshtein",
+        workers: int | None = None,
+    ) -> list[tuple[int | None, float]]:
+        """Best match for every text, in input order.
+
+        With ``workers > 1`` and at least PARALLEL_MIN_QUESTIONS texts, the texts
+        are sharded across a process pool that receives the index once per worker.
+        """
+        if workers is not None and workers < 0:
+            workers = os.cpu_count() or 1
+        if not workers or workers <= 1 or len(texts) < PARALLEL_MIN_QUESTIONS:
+            return self._match_texts(texts, min_score, scorer)
+
+        shard_size = math.ceil(len(texts) / (workers * 4))
+        shards = [texts[start : start + shard_size] for start in range(0, len(texts), shard_size)]
+        results: list[tuple[int | None, float]] = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_match_worker,
+            initargs=(self,),
+        ) as pool:
+            for shard_result in pool.map(_match_shard, shards, repeat(min_score), repeat(scorer)):
+                results.extend(shard_result)
+        return results
+
+    def _match_texts(self, texts: Sequence[str], min_score: float, scorer: str) -> list[tuple[int | None, float]]:
+        if scorer == "tfidf":
+            positions, scores = self.tfidf.top_k(texts, k=1)
+            return [
+                (int(position), float(score)) if position >= 0 else (None, 0.0)
+                for position, score in zip(positions[:, 0], scores[:, 0])
+            ]
+        if scorer != "levenshtein":
+            raise ValueError(f"Unknown scorer: {scorer}")
+        return [self.best_match(text, min_score) for text in texts]
+
+    def _candidates(self, text: str, min_score: float) -> list[int]:
+        q = self.q
+        text_length = len(text)
+        lower = math.ceil(min_score * text_length - _EPSILON)
+        upper = math.floor(text_length / min_score + _EPSILON)
+
+        candidates: list[int] = []
+        required_by_length: dict[int, int] = {}
+        start = bisect_left(self._sorted_lengths, lower)
+        end = bisect_right(self._sorted_lengths, upper)
+        for length in self._sorted_lengths[start:end]:
+            longest = max(text_length, length)
+            max_distance = math.floor((1 - min_score) * longest + _EPSILON)
+            required = longest + q - 1 - q * max_distance
+            if required <= 0:
+                candidates.extend(self._by_length[length])
+            else:
+                required_by_length[length] = required
+
+        if not required_by_length:
+            return candidates
+
+        shared: dict[int, int] = defaultdict(int)
+        for gram, count in _qgrams(text, q).items():
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            lengths, positions, counts = posting
+            lo = bisect_left(lengths, lower)
+            hi = bisect_right(lengths, upper)
+            for offset in range(lo, hi):
+                shared[positions[offset]] += min(count, counts[offset])
+
+        ranked = sorted(shared.items(), key=lambda item: (-item[1], item[0]))
+        for position, count in ranked:
+            required = required_by_length.get(self._lengths[position])
+            if required is not None and count >= required:
+                candidates.append(position)
+        return candidates
+
+
+class TfidfQuestionScorer:
+    """Character n-gram TF-IDF vectors with cosine scoring via sparse products."""
+
+    def __init__(self, normalized: Sequence[str], *, ngram_range: tuple[int, int] = (2, 3)) -> None:
+        low, high = ngram_range
+        if low < 1 or high < low:
+            raise ValueError("ngram_range must satisfy 1 <= low <= high.")
+        self.ngram_range = ngram_range
+        self.size = len(normalized)
+
+        vocabulary: dict[str, int] = {}
+        document_counts: list[Counter[str]] = []
+        document_frequency: Counter[int] = Counter()
+        for text in normalized:
+            counts = _char_ngrams(text, ngram_range)
+            document_counts.append(counts)
+            for gram in counts:
+                column = vocabulary.setdefault(gram, len(vocabulary))
+                document_frequency[column] += 1
+        self.vocabulary = vocabulary
+
+        frequency = np.zeros(len(vocabulary), dtype=np.float64)
+        for column, count in document_frequency.items():
+            frequency[column] = count
+        self.idf = np.log((1 + self.size) / (1 + frequency)) + 1
+        self._unseen_idf = float(np.log(1 + self.size) + 1)
+        self._matrix = self._vectorize(document_counts).T.tocsr()
+
+    def transform(self, texts: Sequence[str]):
+        """L2-normalized sparse TF-IDF rows for ``texts`` in the bank vocabulary."""
+        return self._vectorize([_char_ngrams(text, self.ngram_range) for text in texts])
+
+    def top_k(self, texts: Sequence[str], k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(positions, scores)`` arrays of shape ``(len(texts), k)``.
+
+        Missing matches are reported with position ``-1`` and score ``0.0``; ties
+        are broken in favour of the earlier bank entry.
+        """
+        if k < 1:
+            raise ValueError("k must be a positive integer.")
+        rows = len(texts)
+        positions = np.full((rows, k), -1, dtype=np.int64)
+        scores = np.zeros((rows, k), dtype=np.float64)
+        if not rows or not self.size:
+            return positions, scores
+
+        width = min(k, self.size)
+        queries = self.transform(texts)
+        batch = max(1, _TFIDF_BATCH_CELLS // self.size)
+        for start in range(0, rows, batch):
+            block = (queries[start : start + batch] @ self._matrix).toarray()
+            if width == 1:
+                best = block.argmax(axis=1)[:, None]
+            else:
+                best = np.argpartition(-block, width - 1, axis=1)[:, :width]
+                best_scores = np.take_along_axis(block, best, axis=1)
+                order = np.lexsort((best, -best_scores), axis=1)
+                best = np.take_along_axis(best, order, axis=1)
+            best_scores = np.take_along_axis(block, best, axis=1)
+            found = best_scores > 0
+            positions[start : start + batch, :width] = np.where(found, best, -1)
+            scores[start : start + batch, :width] = np.where(found, np.minimum(best_scores, 1.0), 0.0)
+        return positions, scores
+
+    def _vectorize(self, documents: Sequence[Counter[str]]):
+        from scipy import sparse
+
+        indptr = [0]
+        indices: list[int] = []
+        data: list[float] = []
+        for counts in documents:
+            squared_unseen = 0.0
+            for gram, count in counts.items():
+                column = self.vocabulary.get(gram)
+                if column is None:
+                    squared_unseen += (count * self._unseen_idf) ** 2
+                    continue
+                indices.append(column)
+                data.append(count * self.idf[column])
+            row = np.asarray(data[indptr[-1] :])
+            norm = np.sqrt(np.dot(row, row) + squared_unseen)
+            if norm:
+                data[indptr[-1] :] = (row / norm).tolist()
+            indptr.append(len(indices))
+        return sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int64), np.asarray(indptr)),
+            shape=(len(documents), len(self.vocabulary)),
+        )
+
+
+def bank_version(records: Sequence[BankRecord]) -> str:
+    """Stable content hash of ``(id, text)`` bank records."""
+    digest = hashlib.sha256()
+    for question_id, text in records:
+        digest.update(json.dumps([question_id, text], ensure_ascii=False, default=str).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _init_match_worker(index: QuestionBankIndex) -> None:
+    global _WORKER_INDEX
+    _WORKER_INDEX = index
+
+
+def _match_shard(texts: Sequence[str], min_score: float, scorer: str) -> list[tuple[int | None, float]]:
+    if _WORKER_INDEX is None:
+        raise RuntimeError("Match worker was not initialized with a question bank index.")
+    return _WORKER_INDEX._match_texts(texts, min_score, scorer)
+
+
+def _char_ngrams(text: str, ngram_range: tuple[int, int]) -> Counter[str]:
+    padded = f" {text} "
+    low, high = ngram_range
+    return Counter(
+        padded[i : i + n] for n in range(low, high + 1) for i in range(len(padded) - n + 1)
+    )
+
+
+def _qgrams(text: str, q: int) -> Counter[str]:
+    padded = f"{_PAD * (q - 1)}{text}{_PAD * (q - 1)}"
+    return Counter(padded[i : i + q] for i in range(len(padded) - q + 1))
+
+
+def _levenshtein_distance(a: str, b: str, max_distance: int | None = None) -> int:
+    """Levenshtein distance via Myers' bit-parallel algorithm.
+
+    When ``max_distance`` is given the computation stops as soon as the distance
+    is known to exceed it and ``max_distance + 1`` is returned instead.
+    """
+    if a == b:
+        return 0
+    if max_distance is not None and abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    prefix = 0
+    limit = min(len(a), len(b))
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    a = a[prefix : len(a) - suffix]
+    b = b[prefix : len(b) - suffix]
+
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        distance = len(b)
+        return distance if max_distance is None or distance <= max_distance else max_distance + 1
+
+    peq: dict[str, int] = {}
+    for i, char in enumerate(a):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    full = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    vp = full
+    vn = 0
+    distance = len(a)
+    remaining = len(b)
+    for char in b:
+        eq = peq.get(char, 0)
+        xv = eq | vn
+        xh = ((((eq & vp) + vp) & full) ^ vp) | eq
+        hp = vn | (~(xh | vp) & full)
+        hn = vp & xh
+        if hp & last:
+            distance += 1
+        elif hn & last:
+            distance -= 1
+        remaining -= 1
+        if max_distance is not None and distance - remaining > max_distance:
+            return max_distance + 1
+        hp = ((hp << 1) | 1) & full
+        hn = (hn << 1) & full
+        vp = hn | (~(xv | hp) & full)
+        vn = hp & xv
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
+
+
+def _similarity_ratio(a: str, b: str, min_score: float = 0.0) -> float:
+    """Normalized similarity; returns 0.0 once the score cannot reach ``min_score``."""
+    if not a and not b:
+        return 1.0
+    max_len = max(len(a), len(b))
+    if not max_len:
+        return 0.0
+    max_distance = math.floor((1 - min_score) * max_len + _EPSILON) if min_score > 0 else None
+    distance = _levenshtein_distance(a, b, max_distance)
+    if max_distance is not None and distance > max_distance:
+        return 0.0
+    return 1 - (distance / max_len)
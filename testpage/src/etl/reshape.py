@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .masking import ProperNounMasker
+from .match_cache import QuestionMatchCache
+from .matching import QuestionBankIndex
+from .responses import RESPONSE_COLUMNS, compact_responses
+from .survey import COLUMN_STANDARDIZATION_MAP, QuestionMatch, classify_questions, standardize_columns
+
+
+@dataclass(frozen=True)
+class WideReshapeResult:
+    """Long responses plus the header classification that produced them."""
+
+    responses: pd.DataFrame
+    matches: list[QuestionMatch]
+    question_columns: dict[str, str | int] = field(default_factory=dict)
+    unmatched_columns: list[str] = field(default_factory=list)
+
+
+def reshape_wide_responses(
+    wide: pd.DataFrame,
+    question_bank: Sequence[Mapping[str, str]] | Sequence[str] | QuestionBankIndex,
+    *,
+    survey_id: str,
+    respondent_col: str | None = None,
+    metadata_cols: Iterable[str] = (),
+    course_name: str | None = None,
+    instructor_name: str | None = None,
+    accept_similar: bool = False,
+    respondent_prefix: str = "R-",
+    scorer: str = "levenshtein",
+    masker: ProperNounMasker | None = None,
+    cache: QuestionMatchCache | None = None,
+    compact: bool = False,
+) -> WideReshapeResult:
+    """Melt a one-column-per-question export into ResponseRecord rows.
+
+    Every question header is classified against the bank in one batched
+    classify_questions call. Headers classified as existing (and similar, with
+    ``accept_similar``) become question_ids; the rest are reported as unmatched.
+    When several headers match one question, only the best-scoring one is
+    melted and the others are reported as unmatched.
+    Respondent IDs come from ``respondent_col`` when given, otherwise they are
+    numbered by row. Blank answers are dropped.
+    """
+    standardized = standardize_columns(wide)
+    skipped = set(COLUMN_STANDARDIZATION_MAP) | set(metadata_cols)
+    if respondent_col is not None:
+        if respondent_col not in standardized.columns:
+            raise KeyError(f"Respondent column not found: {respondent_col}")
+        skipped.add(respondent_col)
+    headers = [col for col in standardized.columns if col not in skipped]
+
+    matches = classify_questions(
+        [str(header) for header in headers],
+        question_bank,
+        course_name=course_name,
+        instructor_name=instructor_name,
+        scorer=scorer,
+        masker=masker,
+        cache=cache,
+    )
+    accepted = {"existing", "similar"} if accept_similar else {"existing"}
+    # Two headers for one question would melt into duplicate rows; keep the
+    # better-scoring header (the first on ties) and report the other.
+    best: dict[str | int, tuple[str, float]] = {}
+    for header, match in zip(headers, matches):
+        if match.status in accepted and match.match_id is not None:
+            current = best.get(match.match_id)
+            if current is None or match.score > current[1]:
+                best[match.match_id] = (header, match.score)
+    kept = {header for header, _ in best.values()}
+    question_columns: dict[str, str | int] = {}
+    unmatched: list[str] = []
+    for header, match in zip(headers, matches):
+        if header in kept:
+            question_columns[header] = match.match_id
+        else:
+            unmatched.append(header)
+
+    if respondent_col is not None:
+        respondent_ids = standardized[respondent_col].astype(str).to_numpy(dtype=object)
+    else:
+        width = max(len(str(len(standardized))), 6)
+        respondent_ids = np.array(
+            [f"{respondent_prefix}{number:0{width}d}" for number in range(1, len(standardized) + 1)],
+            dtype=object,
+        )
+
+    columns = list(question_columns)
+    if columns:
+        answers = np.column_stack([_answer_strings(standardized[col]) for col in columns]).ravel()
+    else:
+        answers = np.empty(0, dtype=object)
+    respondents = np.repeat(respondent_ids, len(columns))
+    question_ids = np.tile(np.array([question_columns[col] for col in columns], dtype=object), len(standardized))
+    keep = pd.notna(answers)
+
+    long = pd.DataFrame(
+        {
+            "survey_id": np.full(int(keep.sum()), survey_id, dtype=object),
+            "respondent_id": respondents[keep],
+            "question_id": question_ids[keep],
+            "answer_value": answers[keep],
+        },
+        columns=list(RESPONSE_COLUMNS),
+        dtype=object,
+    )
+    if compact:
+        long = compact_responses(long)
+    return WideReshapeResult(
+        responses=long,
+        matches=matches,
+        question_columns=question_columns,
+        unmatched_columns=unmatched,
+    )
+
+
+def _answer_strings(column: pd.Series) -> np.ndarray:
+    # Factorize first: answer columns hold a handful of distinct values, so each
+    # one is formatted once and broadcast back through the codes.
+    codes, uniques = pd.factorize(column, use_na_sentinel=True)
+    values = pd.Series(np.asarray(uniques, dtype=object), dtype=object)
+    if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+        numeric = values.astype("float64")
+        if (numeric == np.floor(numeric)).all():
+            values = pd.Series([str(int(value)) for value in numeric], dtype=object)
+        else:
+            values = numeric.astype(str).astype(object)
+    else:
+        blank = values.astype(str).str.strip().eq("").to_numpy()
+        values = values.where(~blank, None)
+    formatted = np.append(values.to_numpy(dtype=object), None)
+    return formatted[codes]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+from dataclasses import fields
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ..storage.models import ResponseRecord
+
+ANSWER_VALUE_COLUMN = "answer_value"
+ANSWER_TEXT_COLUMN = "answer_text"
+RESPONSE_COLUMNS: tuple[str, ...] = tuple(field.name for field in fields(ResponseRecord))
+RESPONSE_ID_COLUMNS: tuple[str, ...] = tuple(
+    column for column in RESPONSE_COLUMNS if column != ANSWER_VALUE_COLUMN
+)
+
+
+def response_read_dtypes() -> dict[str, str]:
+    """read_csv dtypes for the responses table: categorical IDs, raw string answers."""
+    dtypes = {column: "category" for column in RESPONSE_ID_COLUMNS}
+    dtypes[ANSWER_VALUE_COLUMN] = "string"
+    return dtypes
+
+
+def load_typed_responses(
+    source: str | Path | bytes | io.BytesIO,
+    *,
+    engine: str | None = None,
+) -> pd.DataFrame:
+    """Read a responses CSV directly into the compact typed layout.
+
+    The pyarrow CSV engine is used when pyarrow is installed unless ``engine``
+    says otherwise.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    if engine is None:
+        engine = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+    df = pd.read_csv(source, dtype=response_read_dtypes(), engine=engine)
+    return compact_responses(df)
+
+
+def compact_responses(responses: pd.DataFrame) -> pd.DataFrame:
+    """Convert a responses frame to categorical IDs plus numeric/text answer columns.
+
+    ``answer_value`` becomes a numeric score (NaN for non-numeric answers) and
+    the non-numeric answers move to a categorical ``answer_text`` column, so the
+    result can be passed unchanged to the quantitative analytics. Scores are
+    float32 when every score is a whole number float32 holds exactly, and
+    float64 otherwise, since float32 would round answers like 4.3.
+    """
+    compact = {}
+    for column in responses.columns:
+        series = responses[column]
+        if column in RESPONSE_ID_COLUMNS and not isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype("category")
+        compact[column] = series
+
+    if ANSWER_VALUE_COLUMN in responses.columns:
+        scores, text = _split_answers(responses[ANSWER_VALUE_COLUMN])
+        compact[ANSWER_VALUE_COLUMN] = pd.Series(scores, index=responses.index)
+        compact[ANSWER_TEXT_COLUMN] = pd.Series(text, index=responses.index)
+    return pd.DataFrame(compact, index=responses.index)
+
+
+def _split_answers(answers: pd.Series) -> tuple[np.ndarray, pd.Categorical]:
+    # Answers are low-cardinality (Likert/NPS scales plus repeated comments), so
+    # parse each distinct value once and broadcast back through the codes.
+    codes, uniques = pd.factorize(answers, use_na_sentinel=True)
+    unique_values = pd.Series(np.asarray(uniques, dtype=object), dtype=object)
+    unique_scores = pd.to_numeric(unique_values, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    scored = unique_scores[~np.isnan(unique_scores)]
+    if np.all((scored == np.round(scored)) & (np.abs(scored) <= 2**24)):
+        unique_scores = unique_scores.astype(np.float32)
+    is_text = np.isnan(unique_scores) & (unique_values.astype(str).str.strip() != "").to_numpy()
+
+    text_codes = np.full(len(uniques), -1, dtype=np.int64)
+    text_codes[is_text] = np.arange(int(is_text.sum()))
+    valid = codes >= 0
+    scores = np.full(len(codes), np.nan, dtype=unique_scores.dtype)
+    scores[valid] = unique_scores[codes[valid]]
+    row_text_codes = np.full(len(codes), -1, dtype=np.int64)
+    row_text_codes[valid] = text_codes[codes[valid]]
+    categories = unique_values[is_text].astype(str).tolist()
+    return scores, pd.Categorical.from_codes(row_text_codes, categories=pd.Index(categories, dtype=object))
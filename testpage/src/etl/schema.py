@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import csv
+import io
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
+from urllib import request
+
+import pandas as pd
+
+from .matching import _similarity_ratio
+from .survey import _fetch_export, _google_sheets_to_csv, _normalize_column_name, column_alias_index
+
+if TYPE_CHECKING:
+    from .http_cache import CsvExportCache
+
+DEFAULT_SAMPLE_ROWS = 200
+DEFAULT_HEADER_SEARCH_ROWS = 20
+FUZZY_HEADER_THRESHOLD = 0.8
+_CATEGORY_MAX_UNIQUE_RATIO = 0.5
+_CATEGORY_MIN_VALUES = 10
+
+
+@dataclass(frozen=True)
+class SurveySchema:
+    """Header position, column mapping and dtypes inferred from a file sample."""
+
+    header_row: int
+    columns: list[str]
+    renames: dict[str, str] = field(default_factory=dict)
+    match_scores: dict[str, float] = field(default_factory=dict)
+    dtypes: dict[str, str] = field(default_factory=dict)
+    datetime_columns: list[str] = field(default_factory=list)
+    sheet_name: str | int | None = None
+
+    def read_dtypes(self) -> dict[str, str]:
+        """Dtypes that are safe to force on the full load.
+
+        Numeric columns are left to the parser: a sample cannot prove that every
+        later row is numeric, and the parser already infers them in one pass.
+        """
+        return {
+            column: dtype
+            for column, dtype in self.dtypes.items()
+            if dtype in {"category", "object"} and column not in self.datetime_columns
+        }
+
+
+def infer_survey_schema(
+    source: str | bytes | io.BytesIO,
+    sheet_name: str | int = 0,
+    *,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    header_search_rows: int = DEFAULT_HEADER_SEARCH_ROWS,
+    http_cache: CsvExportCache | None = None,
+) -> SurveySchema:
+    """Infer the survey schema from the first rows of a file without reading it all.
+
+    The header row is the row among the first ``header_search_rows`` that matches
+    the most standard column aliases (then has the most text cells), which skips
+    title rows above the real header. Headers are matched to standard columns
+    exactly, by containment, or by edit-distance similarity. URL exports are
+    fetched through ``http_cache`` when given, so the load that follows reuses
+    the same download.
+    """
+    rows = _sample_rows(source, sheet_name, header_search_rows + sample_rows, http_cache)
+    if not rows:
+        return SurveySchema(header_row=0, columns=[], sheet_name=sheet_name)
+
+    header_row = _detect_header_row(rows[:header_search_rows])
+    header = rows[header_row]
+    # Keep headers exactly as the parsers will name them: maps keyed by a
+    # stripped " 이메일 " would never match the loaded column.
+    columns = [
+        f"Unnamed: {position}" if value is None or value == "" else str(value)
+        for position, value in enumerate(header)
+    ]
+    data_rows = rows[header_row + 1 :]
+
+    renames: dict[str, str] = {}
+    match_scores: dict[str, float] = {}
+    claimed: set[str] = set()
+    for column in columns:
+        standard, score = match_standard_column(column)
+        if standard is None or standard in claimed:
+            continue
+        claimed.add(standard)
+        match_scores[column] = score
+        if standard != column:
+            renames[column] = standard
+
+    dtypes: dict[str, str] = {}
+    datetime_columns: list[str] = []
+    for position, column in enumerate(columns):
+        values = [row[position] for row in data_rows if position < len(row) and not _is_blank(row[position])]
+        dtype = _infer_dtype(values, renames.get(column, column))
+        if dtype == "datetime64[ns]":
+            datetime_columns.append(column)
+        dtypes[column] = dtype
+
+    return SurveySchema(
+        header_row=header_row,
+        columns=columns,
+        renames=renames,
+        match_scores=match_scores,
+        dtypes=dtypes,
+        datetime_columns=datetime_columns,
+        sheet_name=sheet_name,
+    )
+
+
+def match_standard_column(name: str, threshold: float = FUZZY_HEADER_THRESHOLD) -> tuple[str | None, float]:
+    """Match a raw header to a standard column name; returns ``(standard, score)``."""
+    aliases = column_alias_index()
+    normalized = _normalize_column_name(name)
+    if not normalized:
+        return None, 0.0
+    if normalized in aliases:
+        return aliases[normalized], 1.0
+
+    best: str | None = None
+    best_score = 0.0
+    for alias, standard in aliases.items():
+        # Containment only counts for short headers such as "강사명(필수)";
+        # long question headers that merely mention "강사" must not match.
+        if len(alias) >= 2 and alias in normalized and len(normalized) <= 2 * len(alias) + 2:
+            score = threshold + (1 - threshold) * len(alias) / len(normalized)
+        else:
+            score = _similarity_ratio(normalized, alias, threshold)
+        if score > best_score:
+            best, best_score = standard, score
+    if best_score < threshold:
+        return None, 0.0
+    return best, best_score
+
+
+def _detect_header_row(rows: Sequence[Sequence[Any]]) -> int:
+    width = max((len(row) for row in rows), default=0)
+    best_row = 0
+    best_key = (-1, -1)
+    for position, row in enumerate(rows):
+        text_cells = [value for value in row if isinstance(value, str) and value.strip() and not _is_number(value)]
+        if len(text_cells) < max(1, width // 2):
+            continue
+        matches = sum(1 for value in text_cells if match_standard_column(value)[0] is not None)
+        key = (matches, len(text_cells))
+        if key > best_key:
+            best_row, best_key = position, key
+    return best_row
+
+
+def _infer_dtype(values: list[Any], standard_name: str) -> str:
+    if not values:
+        return "object"
+    series = pd.Series(values, dtype=object)
+    if pd.to_numeric(series, errors="coerce").notna().all():
+        return "float64"
+    if standard_name == "submitted_at" or all(hasattr(value, "year") for value in values):
+        parsed = pd.to_datetime(series, errors="coerce", format="mixed")
+        if parsed.notna().mean() >= 0.9:
+            return "datetime64[ns]"
+    unique_ratio = series.astype(str).nunique() / len(series)
+    if len(series) >= _CATEGORY_MIN_VALUES and unique_ratio <= _CATEGORY_MAX_UNIQUE_RATIO:
+        return "category"
+    return "object"
+
+
+def _sample_rows(
+    source: str | bytes | io.BytesIO,
+    sheet_name: str | int,
+    limit: int,
+    http_cache: CsvExportCache | None = None,
+) -> list[list[Any]]:
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    if hasattr(source, "read"):
+        position = source.tell() if hasattr(source, "tell") else None
+        try:
+            return _sample_excel_rows(source, sheet_name, limit)
+        finally:
+            if position is not None:
+                source.seek(position)
+
+    if isinstance(source, str):
+        source = source.strip()
+        if source.startswith("http") and http_cache is not None:
+            source = _fetch_export(source, http_cache)
+        elif source.startswith("http"):
+            with request.urlopen(_google_sheets_to_csv(source), timeout=30) as response:
+                lines = (line.decode("utf-8-sig") for line in response)
+                return [list(row) for row in islice(csv.reader(lines), limit)]
+        lower = source.lower()
+        if lower.endswith(".xlsx"):
+            return _sample_excel_rows(source, sheet_name, limit)
+        if lower.endswith(".xls"):
+            frame = pd.read_excel(source, sheet_name=sheet_name, header=None, nrows=limit)
+            return frame.astype(object).where(frame.notna(), None).values.tolist()
+        with open(source, encoding="utf-8-sig", newline="") as handle:
+            return [list(row) for row in islice(csv.reader(handle), limit)]
+
+    raise TypeError("Unsupported source type for schema inference.")
+
+
+def _sample_excel_rows(source: str | io.BytesIO, sheet_name: str | int, limit: int) -> list[list[Any]]:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        worksheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        rows: Iterator[tuple] = worksheet.iter_rows(max_row=limit, values_only=True)
+        return [list(row) for row in rows]
+    finally:
+        workbook.close()
+
+
+def _is_blank(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def _is_number(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
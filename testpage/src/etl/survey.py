@@ -1,13 +1,26 @@
 from __future__ import annotations
 
 import io
+import os
 import re
-from dataclasses import dataclass
-from typing import Iterable, Mapping, Sequence
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Sequence
 from urllib.parse import parse_qs, urlparse
 
 import pandas as pd
 
+from .match_cache import QuestionMatchCache
+from .masking import _NON_WORD_RUN, ProperNounMasker
+from .matching import QuestionBankIndex, bank_version
+
+if TYPE_CHECKING:
+    from .http_cache import CsvExportCache
+    from .schema import SurveySchema
+
 COLUMN_STANDARDIZATION_MAP: dict[str, list[str]] = {
     "user_name": ["성명", "이름", "Name", "name", "응답자", "응답자명"],
     "user_email": ["이메일", "Email", "E-mail", "메일"],
@@ -19,6 +32,19 @@ COLUMN_STANDARDIZATION_MAP: dict[str, list[str]] = {
     "score": ["점수", "평점", "Score", "Rating", "응답"],
 }
 
+_WHITESPACE = re.compile(r"\s+")
+DEFAULT_CHUNK_SIZE = 50_000
+SHEET_ORIGIN_COLUMN = "source_sheet"
+_BANK_INDEX_CACHE_SIZE = 8
+_BANK_INDEX_CACHE: OrderedDict[str, QuestionBankIndex] = OrderedDict()
+_BANK_INDEX_LOCK = threading.Lock()
+_WORKBOOK_SOURCE: str | bytes | None = None
+
+SCORER_THRESHOLDS: dict[str, tuple[float, float]] = {
+    "levenshtein": (0.95, 0.8),
+    "tfidf": (0.9, 0.7),
+}
+
 
 @dataclass(frozen=True)
 class QuestionMatch:
@@ -30,73 +56,213 @@ class QuestionMatch:
     score: float
 
 
-def load_raw_survey_data(source: str | bytes | io.BytesIO | pd.DataFrame, sheet_name: str | int = 0) -> pd.DataFrame:
-    """Load Excel or Google Sheets data into a dataframe."""
+def load_raw_survey_data(
+    source: str | bytes | io.BytesIO | pd.DataFrame,
+    sheet_name: str | int | Sequence[str | int] | None = 0,
+    schema: SurveySchema | None = None,
+    http_cache: CsvExportCache | None = None,
+) -> pd.DataFrame:
+    """Load Excel or Google Sheets data into a dataframe.
+
+    With a ``schema`` from infer_survey_schema, the file is parsed once from the
+    detected header row with the inferred dtypes and its column renames applied.
+    ``sheet_name=None`` or a list reads those workbook tabs via
+    load_survey_workbook into one standardized frame. Sheets URLs are read
+    through ``http_cache`` when given, so unchanged exports load from disk.
+    """
     if isinstance(source, pd.DataFrame):
         return source.copy()
+    if _is_multi_sheet(sheet_name) and _is_workbook(source):
+        return load_survey_workbook(source, sheet_name, schema=schema)
 
     if isinstance(source, (bytes, bytearray)):
         source = io.BytesIO(source)
 
+    df: pd.DataFrame
     if hasattr(source, "read"):
-        return pd.read_excel(source, sheet_name=sheet_name)
-
-    if isinstance(source, str):
+        df = pd.read_excel(source, sheet_name=sheet_name, **_excel_read_options(schema))
+    elif isinstance(source, str):
         source = source.strip()
-        if source.startswith("http"):
-            url = _google_sheets_to_csv(source)
-            return pd.read_csv(url)
         lower = source.lower()
-        if lower.endswith((".xlsx", ".xls")):
-            return pd.read_excel(source, sheet_name=sheet_name)
-        return pd.read_csv(source)
-
-    raise TypeError("Unsupported source type for survey data loading.")
+        if source.startswith("http"):
+            df = pd.read_csv(_fetch_export(source, http_cache), **_csv_read_options(schema))
+        elif lower.endswith((".xlsx", ".xls")):
+            df = pd.read_excel(source, sheet_name=sheet_name, **_excel_read_options(schema))
+        else:
+            df = pd.read_csv(source, **_csv_read_options(schema))
+    else:
+        raise TypeError("Unsupported source type for survey data loading.")
+    return df.rename(columns=schema.renames) if schema is not None else df
+
+
+def iter_raw_survey_data(
+    source: str | bytes | io.BytesIO | pd.DataFrame,
+    sheet_name: str | int | Sequence[str | int] | None = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    standardize: bool = True,
+    schema: SurveySchema | None = None,
+    http_cache: CsvExportCache | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Stream survey data as dataframe chunks of at most ``chunk_size`` rows.
+
+    Column standardization is resolved once from the header and applied to each
+    chunk, so peak memory is bounded by the chunk size rather than the file size.
+    A ``schema`` supplies the header row, dtypes and fuzzy column renames.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    if _is_multi_sheet(sheet_name) and _is_workbook(source):
+        yield from iter_survey_workbook(
+            source, sheet_name, chunk_size=chunk_size, schema=schema, standardize=standardize
+        )
+        return
+    chunks = _iter_source_chunks(source, sheet_name, chunk_size, schema, http_cache)
+    if not standardize:
+        yield from chunks
+        return
+    renamed: dict | None = None
+    for chunk in chunks:
+        if renamed is None:
+            renamed = _standard_column_renames(chunk.columns)
+            if schema is not None:
+                renamed.update(schema.renames)
+        yield chunk.rename(columns=renamed)
+
+
+def load_survey_workbook(
+    source: str | bytes | io.BytesIO,
+    sheet_names: Sequence[str | int] | None = None,
+    *,
+    workers: int | None = None,
+    schema: SurveySchema | None = None,
+    standardize: bool = True,
+) -> pd.DataFrame:
+    """Read workbook tabs concurrently into one standardized frame.
+
+    Each tab is parsed with openpyxl's read-only reader in its own process,
+    standardized on its own header (unless ``standardize`` is False), and
+    tagged with SHEET_ORIGIN_COLUMN. A ``schema`` is applied only to the tab it
+    was inferred from; the other tabs get their own infer_survey_schema.
+    """
+    frames = list(_read_workbook_sheets(source, sheet_names, workers, schema, standardize))
+    if not frames:
+        return pd.DataFrame(columns=[SHEET_ORIGIN_COLUMN])
+    return pd.concat(frames, ignore_index=True)
+
+
+def iter_survey_workbook(
+    source: str | bytes | io.BytesIO,
+    sheet_names: Sequence[str | int] | None = None,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+    schema: SurveySchema | None = None,
+    standardize: bool = True,
+) -> Iterator[pd.DataFrame]:
+    """Stream standardized per-sheet chunks tagged with SHEET_ORIGIN_COLUMN.
+
+    With one worker each tab is streamed row-chunk by row-chunk; with more,
+    tabs are parsed concurrently and each finished tab is split into chunks.
+    ``schema`` and ``standardize`` are applied as in load_survey_workbook.
+    """
+    source = _workbook_payload(source)
+    sheets = _resolve_sheet_names(source, sheet_names)
+    schema = _resolve_schema_sheet(source, schema)
+    if _workbook_workers(workers, len(sheets)) > 1:
+        for frame in _read_workbook_sheets(source, sheets, workers, schema, standardize):
+            for start in range(0, len(frame), chunk_size):
+                yield frame.iloc[start : start + chunk_size]
+        return
+    for sheet in sheets:
+        yield from _iter_sheet_chunks(source, sheet, chunk_size, schema, standardize)
 
 
 def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Standardize column names using COLUMN_STANDARDIZATION_MAP."""
-    normalized_map = _normalize_column_map(COLUMN_STANDARDIZATION_MAP)
-    renamed = {}
-    for col in df.columns:
-        normalized = _normalize_column_name(str(col))
-        if normalized in normalized_map:
-            renamed[col] = normalized_map[normalized]
-    return df.rename(columns=renamed)
+    return df.rename(columns=_standard_column_renames(df.columns))
 
 
-def mask_proper_nouns(text: str, replacements: Mapping[str, str]) -> str:
-    """Mask proper nouns based on replacement mapping."""
-    masked = text
-    for original, placeholder in replacements.items():
-        if not original:
-            continue
-        masked = re.sub(re.escape(original), placeholder, masked)
-    return masked
+def column_alias_index() -> dict[str, str]:
+    """Normalized alias -> standard column lookup, rebuilt only when the map changes."""
+    snapshot = tuple((standard, tuple(aliases)) for standard, aliases in COLUMN_STANDARDIZATION_MAP.items())
+    return _cached_column_alias_index(snapshot)
+
+
+def mask_proper_nouns(text: str, replacements: Mapping[str, str] | ProperNounMasker) -> str:
+    """Mask proper nouns based on replacement mapping (longest match wins)."""
+    masker = replacements if isinstance(replacements, ProperNounMasker) else ProperNounMasker(replacements)
+    return masker.mask(text)
+
+
+def build_question_bank_index(question_bank: Sequence[Mapping[str, str]] | Sequence[str]) -> QuestionBankIndex:
+    """Normalize and index the question bank, reusing the index per bank version."""
+    records = _normalize_question_bank(question_bank)
+    version = bank_version(records)
+    with _BANK_INDEX_LOCK:
+        cached = _BANK_INDEX_CACHE.get(version)
+        if cached is not None:
+            _BANK_INDEX_CACHE.move_to_end(version)
+            return cached
+
+    texts = pd.Series([text for _, text in records], dtype=object)
+    index = QuestionBankIndex(records, normalize_series(texts).tolist())
+    with _BANK_INDEX_LOCK:
+        _BANK_INDEX_CACHE[version] = index
+        while len(_BANK_INDEX_CACHE) > _BANK_INDEX_CACHE_SIZE:
+            _BANK_INDEX_CACHE.popitem(last=False)
+    return index
+
+
+def normalize_series(series: pd.Series) -> pd.Series:
+    """Vectorized question text normalization; missing values become empty strings."""
+    text = series.fillna("").astype(str).astype(object)
+    return text.str.replace(_NON_WORD_RUN, " ", regex=True).str.strip()
 
 
 def classify_questions(
     questions: Iterable[str],
-    question_bank: Sequence[Mapping[str, str]] | Sequence[str],
+    question_bank: Sequence[Mapping[str, str]] | Sequence[str] | QuestionBankIndex,
     course_name: str | None = None,
     instructor_name: str | None = None,
-    existing_threshold: float = 0.95,
-    similar_threshold: float = 0.8,
+    existing_threshold: float | None = None,
+    similar_threshold: float | None = None,
+    scorer: str = "levenshtein",
+    workers: int | None = None,
+    cache: QuestionMatchCache | None = None,
+    masker: ProperNounMasker | None = None,
 ) -> list[QuestionMatch]:
-    """Classify uploaded questions into existing/similar/new buckets."""
-    replacements = {}
-    if course_name:
-        replacements[course_name] = "{{COURSE}}"
-    if instructor_name:
-        replacements[instructor_name] = "{{INSTRUCTOR}}"
-
-    bank_records = _normalize_question_bank(question_bank)
-    results: list[QuestionMatch] = []
-    for question in questions:
-        normalized = _normalize_text(question)
-        masked = mask_proper_nouns(normalized, replacements) if replacements else normalized
-        match_id, match_text, score = _find_best_match(masked, bank_records)
-
+    """Classify uploaded questions into existing/similar/new buckets.
+
+    Thresholds default to SCORER_THRESHOLDS for the selected scorer. ``workers``
+    opts into process-pool matching for large uploads (``-1`` uses every core),
+    and ``cache`` reuses results for cleaned questions seen with the same bank.
+    ``masker`` applies a prebuilt roster after the course/instructor names.
+    """
+    if scorer not in SCORER_THRESHOLDS:
+        raise ValueError(f"Unknown scorer: {scorer}")
+    default_existing, default_similar = SCORER_THRESHOLDS[scorer]
+    existing_threshold = default_existing if existing_threshold is None else existing_threshold
+    similar_threshold = default_similar if similar_threshold is None else similar_threshold
+
+    originals = list(questions)
+    cleaned = _clean_questions(originals, course_name, instructor_name, masker)
+    bank_index = _as_question_bank_index(question_bank)
+
+    cache_key = {
+        "scorer": scorer,
+        "existing_threshold": existing_threshold,
+        "similar_threshold": similar_threshold,
+    }
+    resolved: dict[str, tuple[str, str, str | int | None, float]] = {}
+    if cache is not None:
+        cache.bind_bank_version(bank_index.version)
+        resolved = cache.get_many(cleaned, **cache_key)
+
+    pending = [text for text in dict.fromkeys(cleaned) if text not in resolved]
+    computed: dict[str, tuple[str, str, str | int | None, float]] = {}
+    best_matches = bank_index.best_matches(pending, similar_threshold, scorer=scorer, workers=workers)
+    for text, (position, score) in zip(pending, best_matches):
+        match_id, match_text, score = _bank_match(bank_index, position, score)
         if match_text and score >= existing_threshold:
             status = "existing"
             note = "기존 문항 일치 (자동 병합)"
@@ -106,7 +272,14 @@ def classify_questions(
         else:
             status = "new"
             note = "DB에 없는 신규 문항 (등록 필요)"
+        computed[text] = (status, note, match_id, score)
+    if cache is not None and computed:
+        cache.put_many(computed, **cache_key)
+    resolved.update(computed)
 
+    results: list[QuestionMatch] = []
+    for question, masked in zip(originals, cleaned):
+        status, note, match_id, score = resolved[masked]
         results.append(
             QuestionMatch(
                 status=status,
@@ -120,6 +293,320 @@ def classify_questions(
     return results
 
 
+def match_question_table(
+    questions: Iterable[str],
+    question_bank: Sequence[Mapping[str, str]] | Sequence[str] | QuestionBankIndex,
+    course_name: str | None = None,
+    instructor_name: str | None = None,
+    top_k: int = 3,
+    masker: ProperNounMasker | None = None,
+) -> pd.DataFrame:
+    """Return the TF-IDF top-k bank matches for every question in one batched call."""
+    originals = list(questions)
+    cleaned = _clean_questions(originals, course_name, instructor_name, masker)
+    bank_index = _as_question_bank_index(question_bank)
+    positions, scores = bank_index.tfidf.top_k(cleaned, k=top_k)
+
+    rows = []
+    for question_index, (question, masked) in enumerate(zip(originals, cleaned)):
+        for rank in range(top_k):
+            match_id, match_text, score = _bank_match(
+                bank_index,
+                int(positions[question_index, rank]),
+                float(scores[question_index, rank]),
+            )
+            if match_text is None:
+                break
+            rows.append(
+                {
+                    "question_index": question_index,
+                    "original": question,
+                    "cleaned": masked,
+                    "rank": rank + 1,
+                    "match_id": match_id,
+                    "match_text": match_text,
+                    "score": score,
+                }
+            )
+    return pd.DataFrame(
+        rows,
+        columns=["question_index", "original", "cleaned", "rank", "match_id", "match_text", "score"],
+    )
+
+
+def _clean_questions(
+    questions: Sequence[str],
+    course_name: str | None,
+    instructor_name: str | None,
+    masker: ProperNounMasker | None = None,
+) -> list[str]:
+    name_masker = ProperNounMasker.from_roster(
+        courses=[course_name] if course_name else (),
+        instructors=[instructor_name] if instructor_name else (),
+    )
+
+    cleaned = name_masker.mask_series(normalize_series(pd.Series(questions, dtype=object)))
+    if masker is not None:
+        cleaned = masker.mask_series(cleaned)
+    return cleaned.tolist()
+
+
+def _as_question_bank_index(
+    question_bank: Sequence[Mapping[str, str]] | Sequence[str] | QuestionBankIndex,
+) -> QuestionBankIndex:
+    if isinstance(question_bank, QuestionBankIndex):
+        return question_bank
+    return build_question_bank_index(question_bank)
+
+
+def _iter_source_chunks(
+    source: str | bytes | io.BytesIO | pd.DataFrame,
+    sheet_name: str | int,
+    chunk_size: int,
+    schema: SurveySchema | None = None,
+    http_cache: CsvExportCache | None = None,
+) -> Iterator[pd.DataFrame]:
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunk_size):
+            yield source.iloc[start : start + chunk_size]
+        return
+
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    if hasattr(source, "read"):
+        yield from _iter_excel_chunks(source, sheet_name, chunk_size, schema)
+        return
+
+    if isinstance(source, str):
+        source = source.strip()
+        if source.startswith("http"):
+            yield from pd.read_csv(
+                _fetch_export(source, http_cache),
+                chunksize=chunk_size,
+                **_csv_read_options(schema),
+            )
+            return
+        lower = source.lower()
+        if lower.endswith(".xlsx"):
+            yield from _iter_excel_chunks(source, sheet_name, chunk_size, schema)
+            return
+        if lower.endswith(".xls"):
+            frame = pd.read_excel(source, sheet_name=sheet_name, **_excel_read_options(schema))
+            yield from _iter_source_chunks(frame, sheet_name, chunk_size)
+            return
+        yield from pd.read_csv(source, chunksize=chunk_size, **_csv_read_options(schema))
+        return
+
+    raise TypeError("Unsupported source type for survey data loading.")
+
+
+def _iter_excel_chunks(
+    source: str | io.BytesIO,
+    sheet_name: str | int,
+    chunk_size: int,
+    schema: SurveySchema | None = None,
+) -> Iterator[pd.DataFrame]:
+    from openpyxl import load_workbook
+
+    header_row = schema.header_row if schema is not None else 0
+    dtypes = schema.read_dtypes() if schema is not None else {}
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        worksheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        rows = worksheet.iter_rows(min_row=header_row + 1, values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [
+            value if value is not None else f"Unnamed: {position}"
+            for position, value in enumerate(header)
+        ]
+        offset = 0
+        buffer: list[tuple] = []
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            buffer.append(row)
+            if len(buffer) >= chunk_size:
+                yield _excel_chunk(buffer, columns, offset, dtypes)
+                offset += len(buffer)
+                buffer = []
+        if buffer:
+            yield _excel_chunk(buffer, columns, offset, dtypes)
+    finally:
+        workbook.close()
+
+
+def _is_multi_sheet(sheet_name: object) -> bool:
+    return sheet_name is None or isinstance(sheet_name, (list, tuple))
+
+
+def _is_workbook(source: object) -> bool:
+    if isinstance(source, (bytes, bytearray)) or hasattr(source, "read"):
+        return True
+    return isinstance(source, str) and source.strip().lower().endswith((".xlsx", ".xls"))
+
+
+def _workbook_payload(source: str | bytes | io.BytesIO) -> str | bytes:
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if hasattr(source, "getvalue"):
+        return source.getvalue()
+    if hasattr(source, "read"):
+        return source.read()
+    return source.strip()
+
+
+def _open_workbook_source(source: str | bytes) -> str | io.BytesIO:
+    return io.BytesIO(source) if isinstance(source, bytes) else source
+
+
+def _resolve_sheet_names(source: str | bytes, sheet_names: Sequence[str | int] | None) -> list[str | int]:
+    if isinstance(source, str) and source.lower().endswith(".xls"):
+        names = list(pd.ExcelFile(source).sheet_names)
+    else:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(_open_workbook_source(source), read_only=True)
+        try:
+            names = list(workbook.sheetnames)
+        finally:
+            workbook.close()
+    if sheet_names is None:
+        return names
+    return [names[sheet] if isinstance(sheet, int) else sheet for sheet in sheet_names]
+
+
+def _workbook_workers(workers: int | None, sheet_count: int) -> int:
+    if workers is None or workers < 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, sheet_count))
+
+
+def _read_workbook_sheets(
+    source: str | bytes | io.BytesIO,
+    sheet_names: Sequence[str | int] | None,
+    workers: int | None,
+    schema: SurveySchema | None,
+    standardize: bool = True,
+) -> Iterator[pd.DataFrame]:
+    source = _workbook_payload(source)
+    sheets = _resolve_sheet_names(source, sheet_names)
+    schema = _resolve_schema_sheet(source, schema)
+    pool_size = _workbook_workers(workers, len(sheets))
+    if pool_size <= 1:
+        for sheet in sheets:
+            yield _read_sheet(source, sheet, schema, standardize)
+        return
+    with ProcessPoolExecutor(
+        max_workers=pool_size,
+        initializer=_init_workbook_worker,
+        initargs=(source,),
+    ) as pool:
+        yield from pool.map(_read_worker_sheet, sheets, [schema] * len(sheets), [standardize] * len(sheets))
+
+
+def _init_workbook_worker(source: str | bytes) -> None:
+    global _WORKBOOK_SOURCE
+    _WORKBOOK_SOURCE = source
+
+
+def _read_worker_sheet(sheet: str, schema: SurveySchema | None, standardize: bool = True) -> pd.DataFrame:
+    if _WORKBOOK_SOURCE is None:
+        raise RuntimeError("Workbook worker was not initialized with a source.")
+    return _read_sheet(_WORKBOOK_SOURCE, sheet, schema, standardize)
+
+
+def _read_sheet(source: str | bytes, sheet: str, schema: SurveySchema | None, standardize: bool = True) -> pd.DataFrame:
+    chunks = list(_iter_sheet_chunks(source, sheet, DEFAULT_CHUNK_SIZE, schema, standardize))
+    if not chunks:
+        return pd.DataFrame(columns=[SHEET_ORIGIN_COLUMN])
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _resolve_schema_sheet(source: str | bytes, schema: SurveySchema | None) -> SurveySchema | None:
+    # Name the tab a schema was inferred from, so workers can match it by name.
+    if schema is None or schema.sheet_name is None or isinstance(schema.sheet_name, str):
+        return schema
+    return replace(schema, sheet_name=_resolve_sheet_names(source, [schema.sheet_name])[0])
+
+
+def _sheet_schema(source: str | bytes, sheet: str, schema: SurveySchema | None) -> SurveySchema | None:
+    # Tabs rarely share a layout: an inferred schema's header row and dtypes
+    # belong to its own tab, and every other tab is sampled for its own. A
+    # schema built without a sheet_name applies to every tab.
+    if schema is None or schema.sheet_name in (None, sheet):
+        return schema
+    from .schema import infer_survey_schema
+
+    return infer_survey_schema(_open_workbook_source(source), sheet)
+
+
+def _iter_sheet_chunks(
+    source: str | bytes,
+    sheet: str,
+    chunk_size: int,
+    schema: SurveySchema | None,
+    standardize: bool = True,
+) -> Iterator[pd.DataFrame]:
+    schema = _sheet_schema(source, sheet, schema)
+    if isinstance(source, str) and source.lower().endswith(".xls"):
+        frame = pd.read_excel(source, sheet_name=sheet, **_excel_read_options(schema))
+        chunks = _iter_source_chunks(frame, sheet, chunk_size)
+    else:
+        chunks = _iter_excel_chunks(_open_workbook_source(source), sheet, chunk_size, schema)
+    renamed: dict | None = None
+    for chunk in chunks:
+        if renamed is None:
+            renamed = {}
+            if standardize:
+                renamed = _standard_column_renames(chunk.columns)
+                if schema is not None:
+                    renamed.update(schema.renames)
+        yield chunk.rename(columns=renamed).assign(**{SHEET_ORIGIN_COLUMN: sheet})
+
+
+def _excel_chunk(rows: list[tuple], columns: list, offset: int, dtypes: Mapping[str, str] | None = None) -> pd.DataFrame:
+    width = len(columns)
+    padded = [tuple(row[:width]) + (None,) * (width - len(row)) for row in rows]
+    chunk = pd.DataFrame(padded, columns=columns, index=pd.RangeIndex(offset, offset + len(rows)))
+    if dtypes:
+        chunk = chunk.astype({column: dtype for column, dtype in dtypes.items() if column in chunk.columns})
+    return chunk
+
+
+def _csv_read_options(schema: SurveySchema | None) -> dict:
+    if schema is None:
+        return {}
+    return {
+        "skiprows": schema.header_row,
+        "dtype": schema.read_dtypes(),
+        "parse_dates": list(schema.datetime_columns) or None,
+    }
+
+
+def _excel_read_options(schema: SurveySchema | None) -> dict:
+    if schema is None:
+        return {}
+    return {"header": schema.header_row, "dtype": schema.read_dtypes()}
+
+
+def _standard_column_renames(columns: Iterable) -> dict:
+    normalized_map = column_alias_index()
+    renamed = {}
+    for col in columns:
+        normalized = _normalize_column_name(str(col))
+        if normalized in normalized_map:
+            renamed[col] = normalized_map[normalized]
+    return renamed
+
+
+@lru_cache(maxsize=4)
+def _cached_column_alias_index(snapshot: tuple[tuple[str, tuple[str, ...]], ...]) -> dict[str, str]:
+    return _normalize_column_map(dict(snapshot))
+
+
 def _normalize_column_map(mapping: Mapping[str, Sequence[str]]) -> dict[str, str]:
     normalized: dict[str, str] = {}
     for standard, aliases in mapping.items():
@@ -130,14 +617,7 @@ def _normalize_column_map(mapping: Mapping[str, Sequence[str]]) -> dict[str, str
 
 
 def _normalize_column_name(name: str) -> str:
-    return re.sub(r"\s+", "", name.strip().lower())
-
-
-def _normalize_text(text: str) -> str:
-    cleaned = re.sub(r"\d+", " ", text)
-    cleaned = re.sub(r"[^\w\s가-힣]", " ", cleaned)
-    cleaned = cleaned.replace("_", " ")
-    return re.sub(r"\s+", " ", cleaned).strip()
+    return _WHITESPACE.sub("", name.strip().lower())
 
 
 def _normalize_question_bank(question_bank: Sequence[Mapping[str, str]] | Sequence[str]) -> list[tuple[str | int | None, str]]:
@@ -150,46 +630,22 @@ def _normalize_question_bank(question_bank: Sequence[Mapping[str, str]] | Sequen
     return normalized
 
 
-def _find_best_match(cleaned: str, question_bank: Sequence[tuple[str | int | None, str]]) -> tuple[str | int | None, str | None, float]:
-    best_match = None
-    best_score = 0.0
-    best_id = None
-    for question_id, text in question_bank:
-        normalized_question = _normalize_text(text)
-        score = _similarity_ratio(cleaned, normalized_question)
-        if score > best_score:
-            best_score = score
-            best_match = text
-            best_id = question_id
-    return best_id, best_match, best_score
-
-
-def _levenshtein_distance(a: str, b: str) -> int:
-    if a == b:
-        return 0
-    if not a:
-        return len(b)
-    if not b:
-        return len(a)
-
-    prev_row = list(range(len(b) + 1))
-    for i, char_a in enumerate(a, start=1):
-        curr_row = [i]
-        for j, char_b in enumerate(b, start=1):
-            insertions = prev_row[j] + 1
-            deletions = curr_row[j - 1] + 1
-            substitutions = prev_row[j - 1] + (char_a != char_b)
-            curr_row.append(min(insertions, deletions, substitutions))
-        prev_row = curr_row
-    return prev_row[-1]
-
-
-def _similarity_ratio(a: str, b: str) -> float:
-    if not a and not b:
-        return 1.0
-    distance = _levenshtein_distance(a, b)
-    max_len = max(len(a), len(b))
-    return 1 - (distance / max_len) if max_len else 0.0
+def _bank_match(
+    bank_index: QuestionBankIndex,
+    position: int | None,
+    score: float,
+) -> tuple[str | int | None, str | None, float]:
+    if position is None or position < 0:
+        return None, None, 0.0
+    question_id, text = bank_index.records[position]
+    return question_id, text, score
+
+
+def _fetch_export(url: str, http_cache: CsvExportCache | None) -> str:
+    export_url = _google_sheets_to_csv(url)
+    if http_cache is None:
+        return export_url
+    return str(http_cache.fetch(export_url))
 
 
 def _google_sheets_to_csv(url: str) -> str:
@@ -207,3 +663,4 @@ def _google_sheets_to_csv(url: str) -> str:
             export_url += f"&gid={gid}"
         return export_url
     return url
+
@@ -1,11 +1,14 @@
 """Data access layer for survey storage."""
 
 from .config import StorageConfig
+from .ingest import IngestReport, ResponseFingerprintIndex
 from .models import QuestionBankEntry, ResponseRecord, SurveyInfo
 from .repository import StorageRepository
 
 __all__ = [
+    "IngestReport",
     "QuestionBankEntry",
+    "ResponseFingerprintIndex",
     "ResponseRecord",
     "SurveyInfo",
     "StorageConfig",
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+RESPONSE_KEY_COLUMNS = ("survey_id", "respondent_id", "question_id")
+RESPONSE_VALUE_COLUMN = "answer_value"
+
+
+@dataclass(frozen=True)
+class IngestReport:
+    """Row counts from an idempotent responses ingest."""
+
+    inserted: int
+    updated: int
+    skipped: int
+
+
+def fingerprint_responses(responses: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Return uint64 key and value fingerprints for every response row.
+
+    Keys hash (survey_id, respondent_id, question_id); values hash answer_value.
+    Everything is hashed as canonical_text, so a row read back from a sheet
+    ("" blanks, 5) fingerprints like the uploaded frame it came from (NaN, 5.0).
+    """
+    keys = pd.util.hash_pandas_object(
+        pd.DataFrame({col: canonical_text(responses[col]) for col in RESPONSE_KEY_COLUMNS}),
+        index=False,
+    ).to_numpy(dtype=np.uint64)
+    values = pd.util.hash_pandas_object(
+        canonical_text(responses[RESPONSE_VALUE_COLUMN]),
+        index=False,
+    ).to_numpy(dtype=np.uint64)
+    return keys, values
+
+
+def canonical_text(column: pd.Series) -> pd.Series:
+    """Text form of a column: missing values and blanks become "", integral floats print as ints."""
+    if pd.api.types.is_float_dtype(column.dtype):
+        numbers = column.to_numpy(dtype=np.float64, na_value=np.nan)
+        text = numbers.astype(str).astype(object)
+        integral = np.isfinite(numbers) & (numbers == np.round(numbers)) & (np.abs(numbers) < 2**53)
+        text[integral] = numbers[integral].astype(np.int64).astype(str)
+        text[np.isnan(numbers)] = ""
+        return pd.Series(text, index=column.index, dtype=object)
+    if pd.api.types.is_string_dtype(column.dtype) and not pd.api.types.is_object_dtype(column.dtype):
+        return column.fillna("")
+    if pd.api.types.is_integer_dtype(column.dtype) and not column.hasnans:
+        return column.astype(str)
+    # Mixed columns: canonicalize each distinct value once.
+    codes, uniques = pd.factorize(column)
+    canonical = np.array([_canonical_scalar(value) for value in uniques] + [""], dtype=object)
+    return pd.Series(canonical[codes], index=column.index, dtype=object)
+
+
+def _canonical_scalar(value: object) -> str:
+    if isinstance(value, (float, np.floating)):
+        number = float(value)
+        if number.is_integer() and abs(number) < 2**53:
+            return str(int(number))
+        return "" if np.isnan(number) else str(number)
+    if value is None or value is pd.NA or value is pd.NaT:
+        return ""
+    return str(value)
+
+
+class ResponseFingerprintIndex:
+    """Persistent per-survey index of response key/value fingerprints.
+
+    Each survey is stored as one ``.npz`` file holding sorted key hashes and the
+    matching value hashes, so checking an upload is a hash pass plus a binary
+    search.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def has_survey(self, survey_id: str) -> bool:
+        return self._path(survey_id).exists()
+
+    def load(self, survey_id: str) -> tuple[np.ndarray, np.ndarray]:
+        path = self._path(survey_id)
+        if not path.exists():
+            return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.uint64)
+        with np.load(path) as data:
+            return data["keys"], data["values"]
+
+    def save(self, survey_id: str, keys: np.ndarray, values: np.ndarray) -> None:
+        order = np.argsort(keys, kind="stable")
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".npz")
+        try:
+            with os.fdopen(handle, "wb") as stream:
+                np.savez(stream, keys=keys[order], values=values[order])
+            os.replace(temp_path, self._path(survey_id))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def drop(self, survey_id: str) -> None:
+        self._path(survey_id).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.npz"):
+            path.unlink(missing_ok=True)
+
+    def _path(self, survey_id: str) -> Path:
+        digest = hashlib.sha1(str(survey_id).encode("utf-8")).hexdigest()[:20]
+        return self.directory / f"{digest}.npz"
+
+
+def diff_fingerprints(
+    stored_keys: np.ndarray,
+    stored_values: np.ndarray,
+    keys: np.ndarray,
+    values: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split incoming rows into inserted/updated masks plus their stored positions.
+
+    ``stored_keys`` must be sorted.
+    """
+    positions = np.searchsorted(stored_keys, keys)
+    clipped = np.minimum(positions, max(len(stored_keys) - 1, 0))
+    if len(stored_keys):
+        found = stored_keys[clipped] == keys
+        changed = found & (stored_values[clipped] != values)
+    else:
+        found = np.zeros(len(keys), dtype=bool)
+        changed = found
+    return ~found, changed, clipped
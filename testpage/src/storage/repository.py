@@ -1,11 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
+import numpy as np
 import pandas as pd
 
 from .drivers import StorageTable, TabularDriver
+from .ingest import (
+    RESPONSE_KEY_COLUMNS,
+    IngestReport,
+    ResponseFingerprintIndex,
+    canonical_text,
+    diff_fingerprints,
+    fingerprint_responses,
+)
+
+if TYPE_CHECKING:
+    from ..analytics.aggregates import ResponseAggregateStore
 
 
 QUESTION_BANK_TABLE = StorageTable(
@@ -27,6 +39,8 @@ class StorageRepository:
     """CRUD access layer for survey storage."""
 
     driver: TabularDriver
+    fingerprint_index: ResponseFingerprintIndex | None = None
+    aggregate_store: ResponseAggregateStore | None = None
 
     def list_question_bank(self) -> pd.DataFrame:
         return self.driver.read_table(QUESTION_BANK_TABLE.name, QUESTION_BANK_TABLE.columns)
@@ -56,7 +70,120 @@ class StorageRepository:
     def create_responses(self, rows: Iterable[dict]) -> None:
         df = pd.DataFrame(list(rows))
         self.driver.append_rows(RESPONSES_TABLE.name, RESPONSES_TABLE.columns, df)
+        self._drop_fingerprints(df)
+        self._add_aggregates(df)
+
+    def create_responses_from_chunks(self, chunks: Iterable[pd.DataFrame]) -> int:
+        """Append response chunks one at a time and return the number of rows written."""
+        total = 0
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            self.driver.append_rows(RESPONSES_TABLE.name, RESPONSES_TABLE.columns, chunk)
+            self._drop_fingerprints(chunk)
+            self._add_aggregates(chunk)
+            total += len(chunk)
+        return total
+
+    def ingest_responses(
+        self,
+        rows: pd.DataFrame | Iterable[dict],
+        index: ResponseFingerprintIndex | None = None,
+    ) -> IngestReport:
+        """Append only new or changed responses, keyed by (survey_id, respondent_id, question_id).
+
+        Unchanged rows are skipped by fingerprint. Changed answers trigger one
+        table rewrite because the drivers are append-only otherwise. Surveys
+        missing from the index are bootstrapped from the stored table once.
+        """
+        index = index or self.fingerprint_index
+        if index is None:
+            raise ValueError("A ResponseFingerprintIndex is required for idempotent ingest.")
+        incoming = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+        if incoming.empty:
+            return IngestReport(inserted=0, updated=0, skipped=0)
+        incoming = incoming.reindex(columns=RESPONSES_TABLE.columns)
+        deduplicated = incoming.drop_duplicates(subset=list(RESPONSE_KEY_COLUMNS), keep="last")
+        skipped = len(incoming) - len(deduplicated)
+
+        keys, values = fingerprint_responses(deduplicated)
+        survey_ids = canonical_text(deduplicated["survey_id"]).to_numpy()
+        stored: pd.DataFrame | None = None
+        inserted_mask = np.zeros(len(deduplicated), dtype=bool)
+        updated_mask = np.zeros(len(deduplicated), dtype=bool)
+        pending_index: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+        for survey_id in pd.unique(survey_ids):
+            in_survey = survey_ids == survey_id
+            if index.has_survey(survey_id):
+                stored_keys, stored_values = index.load(survey_id)
+            else:
+                if stored is None:
+                    stored = self.list_responses()
+                existing = stored[canonical_text(stored["survey_id"]).to_numpy() == survey_id]
+                stored_keys, stored_values = fingerprint_responses(existing)
+                order = np.argsort(stored_keys, kind="stable")
+                stored_keys, stored_values = stored_keys[order], stored_values[order]
+
+            survey_keys = keys[in_survey]
+            survey_values = values[in_survey]
+            inserted, updated, positions = diff_fingerprints(stored_keys, stored_values, survey_keys, survey_values)
+            inserted_mask[in_survey] = inserted
+            updated_mask[in_survey] = updated
+            if inserted.any() or updated.any():
+                merged_values = stored_values.copy()
+                merged_values[positions[updated]] = survey_values[updated]
+                pending_index[survey_id] = (
+                    np.concatenate([stored_keys, survey_keys[inserted]]),
+                    np.concatenate([merged_values, survey_values[inserted]]),
+                )
+            elif not index.has_survey(survey_id):
+                pending_index[survey_id] = (stored_keys, stored_values)
+
+        new_rows = deduplicated[inserted_mask]
+        changed_rows = deduplicated[updated_mask]
+        if not changed_rows.empty:
+            if stored is None:
+                stored = self.list_responses()
+            stored_keys, _ = fingerprint_responses(stored)
+            changed_keys, _ = fingerprint_responses(changed_rows)
+            replacement = pd.Series(changed_rows["answer_value"].to_numpy(), index=changed_keys)
+            replacement = replacement[~replacement.index.duplicated(keep="last")]
+            hit = np.isin(stored_keys, changed_keys)
+            rewritten = stored.copy()
+            rewritten.loc[hit, "answer_value"] = replacement.reindex(stored_keys[hit]).to_numpy()
+            rewritten = pd.concat([rewritten, new_rows], ignore_index=True)
+            self.driver.write_table(RESPONSES_TABLE.name, RESPONSES_TABLE.columns, rewritten)
+            if self.aggregate_store is not None:
+                self.aggregate_store.rebuild(rewritten)
+        elif not new_rows.empty:
+            self.driver.append_rows(RESPONSES_TABLE.name, RESPONSES_TABLE.columns, new_rows)
+            self._add_aggregates(new_rows)
+
+        for survey_id, (survey_keys, survey_values) in pending_index.items():
+            index.save(survey_id, survey_keys, survey_values)
+        return IngestReport(
+            inserted=int(inserted_mask.sum()),
+            updated=int(updated_mask.sum()),
+            skipped=skipped + int((~inserted_mask & ~updated_mask).sum()),
+        )
 
     def replace_responses(self, rows: Iterable[dict]) -> None:
         df = pd.DataFrame(list(rows))
         self.driver.write_table(RESPONSES_TABLE.name, RESPONSES_TABLE.columns, df)
+        if self.fingerprint_index is not None:
+            self.fingerprint_index.clear()
+        if self.aggregate_store is not None:
+            self.aggregate_store.rebuild(df)
+
+    def _add_aggregates(self, rows: pd.DataFrame) -> None:
+        if self.aggregate_store is not None:
+            self.aggregate_store.add(rows)
+
+    def _drop_fingerprints(self, rows: pd.DataFrame) -> None:
+        # Rows written outside ingest_responses are not fingerprinted; forget the
+        # affected surveys so the next ingest re-reads them from storage.
+        if self.fingerprint_index is None or "survey_id" not in rows.columns:
+            return
+        for survey_id in pd.unique(canonical_text(rows["survey_id"])):
+            self.fingerprint_index.drop(survey_id)
@@ -0,0 +1,69 @@
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Tests import the app's packages the way app.py does (``src.etl``, ``src.analytics``).
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+class CsvExportServer:
+    """Local stand-in for a CSV export endpoint that honours ETag revalidation."""
+
+    def __init__(self):
+        self.body = b""
+        self.etag = '"v1"'
+        # Validators answered with 304 (just the current ETag by default).
+        self.fresh_etags = None
+        self.delay = 0.0
+        self.requests = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def url(self):
+        return self.url_for("export.csv")
+
+    def url_for(self, name):
+        return f"http://127.0.0.1:{self._server.server_port}/{name}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append(dict(self.headers))
+                time.sleep(server.delay)
+                if self.headers.get("If-None-Match") in (server.fresh_etags or {server.etag}):
+                    self.send_response(304)
+                    self.send_header("ETag", server.etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/csv; charset=utf-8")
+                self.send_header("Content-Length", str(len(server.body)))
+                self.send_header("ETag", server.etag)
+                self.end_headers()
+                self.wfile.write(server.body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def csv_server():
+    with CsvExportServer() as server:
+        yield server
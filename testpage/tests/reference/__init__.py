@@ -0,0 +1 @@
+"""Pre-optimization implementations, kept verbatim as differential-test oracles."""
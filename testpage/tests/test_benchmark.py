@@ -0,0 +1,71 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics import build_benchmark_index
+
+
+def benchmark_for(scores, categories=None):
+    """One survey per course, each answered once with the given score."""
+    surveys = [f"S{position}" for position in range(len(scores))]
+    responses = pd.DataFrame(
+        {
+            "survey_id": surveys,
+            "respondent_id": "R1",
+            "question_id": "Q1",
+            "answer_value": [str(score) for score in scores],
+        }
+    )
+    metadata = pd.DataFrame(
+        {
+            "survey_id": surveys,
+            "course_name": [f"C{position}" for position in range(len(scores))],
+            "instructor_name": "I1",
+            "category": categories or ["리더십"] * len(scores),
+        }
+    )
+    return build_benchmark_index(responses, metadata)
+
+
+def test_best_of_many_is_a_small_top_share():
+    index = benchmark_for(list(range(1, 301)))
+
+    assert index.top_share("course_name", "C299") == pytest.approx(100 / 300)
+    assert index.top_share("course_name", "C0") == 100
+    assert index.top_share("course_name", "C149") == pytest.approx(151 / 300 * 100)
+
+
+def test_sole_entity_is_the_top_100_percent():
+    index = benchmark_for([4])
+
+    assert index.top_share("course_name", "C0") == 100
+    assert index.percentile("course_name", "C0") == 50
+
+
+def test_ties_share_the_top_share():
+    index = benchmark_for([5, 5, 3, 1])
+
+    assert index.top_share("course_name", "C0") == index.top_share("course_name", "C1") == 50
+    assert index.top_share("course_name", "C2") == 75
+
+
+def test_top_share_within_a_category():
+    index = benchmark_for([5, 4, 3, 2], categories=["리더십", "리더십", "DX", "DX"])
+
+    assert index.top_share("course_name", "C0", category="리더십") == 50
+    assert index.top_share("course_name", "C3", category="DX") == 100
+    assert math.isnan(index.top_share("course_name", "C0", category="DX"))
+
+
+def test_top_share_follows_incremental_updates():
+    index = benchmark_for([1, 2, 3])
+    index.update(
+        pd.DataFrame({"survey_id": ["S9"], "respondent_id": "R1", "question_id": "Q1", "answer_value": ["5"]}),
+        pd.DataFrame({"survey_id": ["S9"], "course_name": ["C9"], "instructor_name": ["I2"], "category": ["리더십"]}),
+    )
+
+    assert index.top_share("course_name", "C9") == 25
+    assert index.top_share("course_name", "C2") == 50
+    np.testing.assert_allclose(index.ranking("course_name")["percentile"], [87.5, 62.5, 37.5, 12.5])
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics import bootstrap_confidence_intervals, calculate_nps, calculate_satisfaction
+
+
+@pytest.fixture
+def responses():
+    rng = np.random.default_rng(0)
+    rows = 6_000
+    return pd.DataFrame(
+        {
+            "instructor_name": [f"I{i:03d}" for i in rng.integers(0, 300, rows)],
+            "question_id": np.where(rng.random(rows) < 0.3, "QN", "Q1"),
+            "answer_value": rng.integers(0, 11, rows).astype(str),
+        }
+    )
+
+
+def test_estimates_match_the_point_statistics(responses):
+    group_cols = ["instructor_name"]
+    means = bootstrap_confidence_intervals(responses, group_cols=group_cols, n_resamples=200)
+    nps = bootstrap_confidence_intervals(
+        responses, group_cols=group_cols, statistic="nps", nps_question_ids=["QN"], n_resamples=200
+    )
+
+    satisfaction = calculate_satisfaction(responses, group_cols=group_cols)
+    expected_nps = calculate_nps(responses, group_cols=group_cols, nps_question_ids=["QN"])
+    assert means["instructor_name"].tolist() == satisfaction["instructor_name"].tolist()
+    np.testing.assert_allclose(means["estimate"], satisfaction["mean_score"])
+    assert means["response_count"].tolist() == satisfaction["response_count"].tolist()
+    np.testing.assert_allclose(nps["estimate"], expected_nps["nps"])
+    for intervals in (means, nps):
+        assert (intervals["ci_lower"] <= intervals["estimate"]).all()
+        assert (intervals["estimate"] <= intervals["ci_upper"]).all()
+
+
+def test_results_are_deterministic_with_and_without_a_pool(responses):
+    serial = bootstrap_confidence_intervals(responses, group_cols=["instructor_name"], n_resamples=300, seed=7)
+    again = bootstrap_confidence_intervals(responses, group_cols=["instructor_name"], n_resamples=300, seed=7)
+    pooled = bootstrap_confidence_intervals(
+        responses, group_cols=["instructor_name"], n_resamples=300, seed=7, workers=2
+    )
+
+    pd.testing.assert_frame_equal(serial, again)
+    np.testing.assert_allclose(pooled[["ci_lower", "ci_upper"]], serial[["ci_lower", "ci_upper"]])
+
+
+def test_interval_covers_the_true_mean_at_about_the_nominal_rate():
+    covered = 0
+    trials = 200
+    for seed in range(trials):
+        sample = pd.DataFrame({"answer_value": np.random.default_rng(seed).normal(0, 1, 50)})
+        interval = bootstrap_confidence_intervals(sample, seed=seed, n_resamples=500)
+        covered += bool(interval["ci_lower"][0] <= 0 <= interval["ci_upper"][0])
+
+    assert 0.88 <= covered / trials <= 0.99
+
+
+def test_empty_input_and_invalid_arguments(responses):
+    empty = bootstrap_confidence_intervals(responses.iloc[:0], group_cols=["instructor_name"])
+
+    assert empty.empty
+    assert list(empty.columns) == ["instructor_name", "estimate", "ci_lower", "ci_upper", "response_count"]
+    with pytest.raises(ValueError):
+        bootstrap_confidence_intervals(responses, statistic="median")
+    with pytest.raises(ValueError):
+        bootstrap_confidence_intervals(responses, confidence=1.0)
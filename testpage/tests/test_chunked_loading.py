@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from src.etl import iter_raw_survey_data, load_raw_survey_data, standardize_columns
+from src.etl.survey import _iter_excel_chunks
+
+ROWS = [[f"과정{i % 3}", f"강사{i % 4}", i % 5 + 1] for i in range(10)]
+
+
+@pytest.fixture
+def xlsx_path(tmp_path):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "응답"
+    sheet.append(["과정명", "강사명", "점수"])
+    for position, row in enumerate(ROWS):
+        sheet.append(row)
+        if position == 4:
+            sheet.append([None, None, None])
+    sheet.append(["과정9", "강사9"])
+    path = tmp_path / "survey.xlsx"
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "survey.csv"
+    pd.DataFrame(ROWS, columns=["과정명", "강사명", "점수"]).to_csv(path, index=False)
+    return str(path)
+
+
+def test_excel_chunks_skip_blank_rows_and_pad_short_rows(xlsx_path):
+    chunks = list(_iter_excel_chunks(xlsx_path, 0, chunk_size=4))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 3]
+    frame = pd.concat(chunks)
+    assert list(frame.columns) == ["과정명", "강사명", "점수"]
+    assert frame.index.tolist() == list(range(11))
+    assert frame.values.tolist()[:10] == ROWS
+    assert frame.iloc[10, :2].tolist() == ["과정9", "강사9"]
+    assert pd.isna(frame.iloc[10, 2])
+
+
+def test_excel_chunks_by_sheet_name_match_a_full_read(xlsx_path):
+    streamed = pd.concat(_iter_excel_chunks(xlsx_path, "응답", chunk_size=3))
+    full = pd.read_excel(xlsx_path, sheet_name="응답").dropna(how="all").reset_index(drop=True)
+
+    assert streamed.astype(str).values.tolist() == full.astype(str).values.tolist()
+
+
+@pytest.mark.parametrize("fixture", ["xlsx_path", "csv_path"])
+def test_streamed_chunks_match_the_full_load(request, fixture):
+    path = request.getfixturevalue(fixture)
+    chunks = list(iter_raw_survey_data(path, chunk_size=4))
+
+    assert all(len(chunk) <= 4 for chunk in chunks)
+    streamed = pd.concat(chunks, ignore_index=True)
+    full = standardize_columns(load_raw_survey_data(path)).dropna(how="all").reset_index(drop=True)
+    assert list(streamed.columns) == ["course_name", "instructor_name", "score"]
+    assert list(streamed.columns) == list(full.columns)
+    assert streamed.astype(str).values.tolist() == full.astype(str).values.tolist()
+
+
+def test_standardize_false_keeps_original_headers(csv_path):
+    chunks = list(iter_raw_survey_data(csv_path, chunk_size=100, standardize=False))
+
+    assert len(chunks) == 1
+    assert list(chunks[0].columns) == ["과정명", "강사명", "점수"]
+
+
+def test_dataframe_source_and_invalid_chunk_size():
+    frame = pd.DataFrame(ROWS, columns=["과정명", "강사명", "점수"])
+
+    assert [len(chunk) for chunk in iter_raw_survey_data(frame, chunk_size=6)] == [6, 4]
+    with pytest.raises(ValueError):
+        list(iter_raw_survey_data(frame, chunk_size=0))
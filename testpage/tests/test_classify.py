@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from reference import survey as reference
+from src.etl import classify_questions, matching
+
+ALPHABET = list("강의시간만족하십니까교육내용적절") + [" "]
+
+
+def random_text(rng):
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 14)))
+
+
+def assert_same_decisions(expected, actual):
+    assert len(actual) == len(expected)
+    for left, right in zip(expected, actual):
+        assert (right.status, right.original, right.cleaned) == (left.status, left.original, left.cleaned)
+        # "new" questions may report a different nearest miss once candidates are pruned.
+        if left.status != "new":
+            assert (right.match_id, right.score, right.note) == (left.match_id, pytest.approx(left.score), left.note)
+
+
+@pytest.mark.parametrize("seed", range(2))
+def test_random_questions_match_reference(seed):
+    rng = random.Random(seed)
+    for _ in range(40):
+        bank = [{"id": position, "text": random_text(rng)} for position in range(rng.randint(0, 40))]
+        questions = [random_text(rng) for _ in range(10)]
+        for threshold in (0.0, 0.3, 0.5, 0.8, 0.95):
+            assert_same_decisions(
+                reference.classify_questions(questions, bank, similar_threshold=threshold),
+                classify_questions(questions, bank, similar_threshold=threshold),
+            )
+
+
+def test_masked_names_match_reference():
+    bank = [
+        {"id": "Q1", "text": "{{COURSE}} 과정의 내용에 만족하십니까"},
+        {"id": "Q2", "text": "{{INSTRUCTOR}} 강사의 설명은 명확했습니까"},
+        {"id": "Q3", "text": "교육 시간은 적절했습니까"},
+    ]
+    questions = [
+        "리더십 과정의 내용에 만족하십니까?",
+        "김철수 강사의 설명은 명확했습니까?",
+        "김철수 강사의 설명이 명확했나요?",
+        "교육 시간은 적절했습니까?",
+        "교육 장소는 쾌적했습니까?",
+    ]
+
+    assert_same_decisions(
+        reference.classify_questions(questions, bank, course_name="리더십", instructor_name="김철수"),
+        classify_questions(questions, bank, course_name="리더십", instructor_name="김철수"),
+    )
+
+
+@pytest.mark.parametrize("scorer", ["levenshtein", "tfidf"])
+def test_parallel_workers_match_serial_output(monkeypatch, scorer):
+    rng = random.Random(7)
+    bank = [{"id": position, "text": random_text(rng)} for position in range(60)]
+    questions = [random_text(rng) for _ in range(300)]
+    serial = classify_questions(questions, bank, scorer=scorer)
+
+    # Shard even this small upload across the process pool.
+    monkeypatch.setattr(matching, "PARALLEL_MIN_QUESTIONS", 1)
+    for workers in (2, -1):
+        assert classify_questions(questions, bank, scorer=scorer, workers=workers) == serial
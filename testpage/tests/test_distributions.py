@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics import calculate_distributions
+
+
+def make_frame(rows, seed=0, high=5):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "question_id": [f"Q{i}" for i in rng.integers(0, 4, rows)],
+            "course_name": [f"C{i}" for i in rng.integers(0, 3, rows)],
+            "answer_value": rng.integers(1, high + 1, rows).astype(str),
+        }
+    )
+
+
+def test_quantiles_match_numpy():
+    responses = make_frame(2000)
+    distribution = calculate_distributions(responses, group_cols=["course_name"])
+
+    scores = responses["answer_value"].astype(float)
+    for position, (question, course) in enumerate(distribution.index):
+        values = scores[(responses["question_id"] == question) & (responses["course_name"] == course)]
+        for q in (0.0, 0.25, 0.5, 0.9, 1.0):
+            assert distribution.quantile(q)[position] == pytest.approx(np.quantile(values, q))
+
+
+def test_summary_matches_row_computation():
+    responses = make_frame(1000, seed=1)
+    summary = calculate_distributions(responses).summary()
+
+    scores = responses["answer_value"].astype(float)
+    for row in summary.itertuples():
+        values = scores[responses["question_id"] == row.question_id]
+        assert row.response_count == len(values)
+        assert row.mean_score == pytest.approx(values.mean())
+        assert row.median == pytest.approx(values.median())
+        assert row.top2_box == pytest.approx((values >= 4).mean() * 100)
+        assert row.bottom2_box == pytest.approx((values <= 2).mean() * 100)
+
+
+def test_histogram_counts_every_point_and_skips_non_integers():
+    responses = pd.DataFrame(
+        {
+            "question_id": ["Q1"] * 6,
+            "answer_value": ["1", "1", "3", "5", "좋아요", "2.5"],
+        }
+    )
+    histogram = calculate_distributions(responses).histogram()
+
+    assert list(histogram.columns) == ["question_id", 1, 2, 3, 4, 5]
+    assert histogram.iloc[0, 1:].tolist() == [2, 0, 1, 0, 1]
+
+
+def test_empty_input():
+    responses = pd.DataFrame({"question_id": ["Q1"], "answer_value": ["좋아요"]})
+    distribution = calculate_distributions(responses)
+
+    assert len(distribution.index) == 0
+    assert distribution.summary().empty
+
+
+def test_nps_question_from_bank_keeps_zero_to_ten_scale():
+    # Answers that stop at 5 must not shrink a 0-10 question to a 1-5 scale.
+    responses = pd.DataFrame({"question_id": ["Q1"] * 4, "answer_value": ["2", "3", "5", "5"]})
+    bank = pd.DataFrame({"id": ["Q1"], "category": ["NPS"]})
+
+    summary = calculate_distributions(responses, question_bank=bank).summary()
+
+    assert summary.loc[0, "top2_box"] == 0
+    assert summary.loc[0, "bottom2_box"] == 0
+
+
+def test_explicit_scales_override_the_default():
+    responses = pd.DataFrame({"question_id": ["Q1"] * 4, "answer_value": ["1", "4", "6", "7"]})
+
+    distribution = calculate_distributions(responses, scales={"Q1": (1, 7)})
+    top, bottom = distribution.box_scores()
+
+    assert distribution.scales.tolist() == [[1, 7]]
+    assert top[0] == pytest.approx(50)
+    assert bottom[0] == pytest.approx(25)
+
+
+def test_answers_outside_the_scale_require_explicit_scales():
+    responses = pd.DataFrame({"question_id": ["Q1", "Q2"], "answer_value": ["3", "9"]})
+
+    with pytest.raises(ValueError, match="Q2"):
+        calculate_distributions(responses)
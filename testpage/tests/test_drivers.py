@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics import build_response_matrix, key_driver_analysis
+from src.analytics.drivers import _relative_weights
+
+
+def ols_r_squared(predictors, target):
+    design = np.column_stack([np.ones(len(target)), predictors])
+    coefficients, *_ = np.linalg.lstsq(design, target, rcond=None)
+    residuals = target - design @ coefficients
+    return 1 - residuals.var() / target.var(), coefficients[1:]
+
+
+def make_scores(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size=(rows, 1))
+    predictors = np.clip(np.round(5 + 2 * (base + rng.normal(size=(rows, 4)))), 0, 10)
+    target = np.clip(np.round(predictors @ np.array([0.5, 0.3, 0.1, 0.0]) + rng.normal(size=rows)), 0, 10)
+    return predictors, target
+
+
+def to_long(predictors, target):
+    wide = pd.DataFrame(predictors, columns=["Q1", "Q2", "Q3", "Q4"])
+    wide["NPS"] = target
+    wide["respondent_id"] = [f"R{i}" for i in range(len(wide))]
+    long = wide.melt(id_vars="respondent_id", var_name="question_id", value_name="answer_value")
+    long["survey_id"] = "S1"
+    long["answer_value"] = long["answer_value"].astype(int).astype(str)
+    return long
+
+
+def test_relative_weights_sum_to_the_ols_r_squared():
+    predictors, target = make_scores(2000)
+    correlations = np.corrcoef(np.column_stack([predictors, target]), rowvar=False)
+
+    betas, weights, r_squared = _relative_weights(correlations[:4, :4], correlations[:4, 4])
+
+    expected_r_squared, coefficients = ols_r_squared(predictors, target)
+    assert r_squared == pytest.approx(expected_r_squared)
+    assert weights.sum() == pytest.approx(expected_r_squared)
+    assert (weights >= 0).all()
+    np.testing.assert_allclose(betas, coefficients * predictors.std(axis=0) / target.std())
+
+
+def test_key_driver_analysis_matches_a_full_fit():
+    predictors, target = make_scores(1500, seed=1)
+    bank = pd.DataFrame({"id": ["Q1", "NPS"], "category": ["만족도", "NPS"]})
+
+    analysis = key_driver_analysis(to_long(predictors, target), question_bank=bank)
+
+    expected_r_squared, _ = ols_r_squared(predictors, target)
+    assert analysis.target == "NPS"
+    assert analysis.respondents == 1500
+    assert analysis.r_squared == pytest.approx(expected_r_squared)
+    drivers = analysis.drivers.set_index("question_id")
+    assert drivers["relative_weight"].sum() == pytest.approx(100)
+    assert analysis.drivers["question_id"].iloc[0] == "Q1"
+    for position, question in enumerate(["Q1", "Q2", "Q3", "Q4"]):
+        expected = np.corrcoef(predictors[:, position], target)[0, 1]
+        assert drivers.loc[question, "correlation"] == pytest.approx(expected)
+        assert drivers.loc[question, "response_count"] == 1500
+
+
+def test_missing_target_is_an_error():
+    responses = to_long(*make_scores(20))
+    with pytest.raises(ValueError):
+        key_driver_analysis(responses)
+    with pytest.raises(KeyError):
+        key_driver_analysis(responses, target_question="Q9")
+
+
+def test_response_matrix_pivots_with_missing_answers():
+    responses = pd.DataFrame(
+        {
+            "survey_id": ["S1", "S1", "S1", "S2", "S2", "S1"],
+            "respondent_id": ["R1", "R1", "R2", "R1", "R1", "R1"],
+            "question_id": ["Q1", "Q2", "Q1", "Q2", "Q1", "Q1"],
+            "answer_value": ["5", "3", "좋아요", "4", None, "2"],
+        }
+    )
+    matrix = build_response_matrix(responses)
+
+    # R2's only answer is text, so it never becomes a respondent row.
+    assert matrix.shape == (2, 2)
+    assert matrix.values.dtype == np.int8
+    frame = matrix.to_frame()
+    expected = pd.DataFrame(
+        {"Q1": [2.0, np.nan], "Q2": [3.0, 4.0]},
+        index=pd.MultiIndex.from_tuples([("S1", "R1"), ("S2", "R1")], names=["survey_id", "respondent_id"]),
+    )
+    pd.testing.assert_frame_equal(frame, expected, check_names=False, check_column_type=False)
+    assert matrix.column("Q1").mask.tolist() == [False, True]
+
+
+def test_non_integer_answers_use_float32():
+    responses = pd.DataFrame(
+        {"respondent_id": ["R1", "R2"], "question_id": ["Q1", "Q1"], "answer_value": ["4.5", "3"]}
+    )
+    matrix = build_response_matrix(responses)
+
+    assert matrix.values.dtype == np.float32
+    assert matrix.to_frame()["Q1"].tolist() == [4.5, 3.0]
@@ -0,0 +1,71 @@
+import threading
+import time
+
+from src.etl import CsvExportCache
+
+
+def test_download_then_revalidate_with_304(csv_server, tmp_path):
+    csv_server.body = "과정명,점수\nDX,5\n".encode("utf-8")
+    cache = CsvExportCache(tmp_path, ttl=0)
+
+    first = cache.fetch(csv_server.url)
+    second = cache.fetch(csv_server.url)
+
+    assert first == second
+    assert first.read_text(encoding="utf-8") == "과정명,점수\nDX,5\n"
+    assert (cache.downloads, cache.revalidations, cache.hits) == (1, 1, 0)
+    assert "If-None-Match" not in csv_server.requests[0]
+    assert csv_server.requests[1]["If-None-Match"] == '"v1"'
+
+
+def test_fresh_copy_is_served_without_a_request(csv_server, tmp_path):
+    csv_server.body = b"a,b\n1,2\n"
+    cache = CsvExportCache(tmp_path, ttl=60)
+
+    cache.fetch(csv_server.url)
+    cache.fetch(csv_server.url)
+
+    assert len(csv_server.requests) == 1
+    assert (cache.downloads, cache.hits) == (1, 1)
+
+
+def test_304_refreshes_stored_validators(csv_server, tmp_path):
+    csv_server.body = b"a,b\n1,2\n"
+    cache = CsvExportCache(tmp_path, ttl=0)
+    cache.fetch(csv_server.url)
+
+    csv_server.etag = '"v2"'
+    csv_server.fresh_etags = {'"v1"', '"v2"'}
+    cache.fetch(csv_server.url)
+    cache.fetch(csv_server.url)
+
+    assert [request.get("If-None-Match") for request in csv_server.requests] == [None, '"v1"', '"v2"']
+    assert (cache.downloads, cache.revalidations) == (1, 2)
+
+
+def test_changed_export_is_downloaded_again(csv_server, tmp_path):
+    csv_server.body = b"a\n1\n"
+    cache = CsvExportCache(tmp_path, ttl=0)
+    cache.fetch(csv_server.url)
+
+    csv_server.body, csv_server.etag = b"a\n2\n", '"v2"'
+    path = cache.fetch(csv_server.url)
+
+    assert path.read_bytes() == b"a\n2\n"
+    assert cache.downloads == 2
+
+
+def test_slow_fetches_of_different_exports_do_not_wait_on_each_other(csv_server, tmp_path):
+    csv_server.body = b"a\n1\n"
+    csv_server.delay = 0.5
+    cache = CsvExportCache(tmp_path)
+    threads = [threading.Thread(target=cache.fetch, args=(csv_server.url_for(name),)) for name in ("a.csv", "b.csv")]
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.perf_counter() - started < 0.9
+    assert cache.downloads == 2
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+from src.storage import ResponseFingerprintIndex, StorageRepository
+from src.storage.ingest import fingerprint_responses
+
+
+class SheetLikeDriver:
+    """In-memory driver that stores cells the way a spreadsheet returns them.
+
+    Blanks are written as "" and numbers come back as int when integral, like
+    gspread's ``get_all_records``.
+    """
+
+    def __init__(self):
+        self.tables = {}
+        self.writes = 0
+
+    def read_table(self, table_name, columns):
+        rows = self.tables.get(table_name, [])
+        return pd.DataFrame(rows, columns=list(columns))
+
+    def write_table(self, table_name, columns, data):
+        self.writes += 1
+        self.tables[table_name] = self._cells(data, columns)
+
+    def append_rows(self, table_name, columns, data):
+        self.tables.setdefault(table_name, []).extend(self._cells(data, columns))
+
+    @staticmethod
+    def _cells(data, columns):
+        rows = data.reindex(columns=list(columns)).astype(object).fillna("").values.tolist()
+        return [[int(cell) if isinstance(cell, float) and cell.is_integer() else cell for cell in row] for row in rows]
+
+
+def _upload():
+    return pd.DataFrame(
+        {
+            "survey_id": ["S1", "S1", "S1", "S1"],
+            "respondent_id": ["R-1", "R-1", "R-2", "R-2"],
+            "question_id": ["Q1", "Q2", "Q1", "Q2"],
+            "answer_value": [5.0, np.nan, 4.0, 3.5],
+        }
+    )
+
+
+def test_reingesting_the_same_upload_skips_every_row(tmp_path):
+    driver = SheetLikeDriver()
+    repository = StorageRepository(driver, fingerprint_index=ResponseFingerprintIndex(tmp_path))
+
+    first = repository.ingest_responses(_upload())
+    again = repository.ingest_responses(_upload())
+
+    assert (first.inserted, first.updated, first.skipped) == (4, 0, 0)
+    assert (again.inserted, again.updated, again.skipped) == (0, 0, 4)
+    assert driver.writes == 0
+
+
+def test_bootstrap_from_stored_sheet_rows_matches_the_upload(tmp_path):
+    driver = SheetLikeDriver()
+    StorageRepository(driver).create_responses(_upload().to_dict("records"))
+    repository = StorageRepository(driver, fingerprint_index=ResponseFingerprintIndex(tmp_path))
+
+    report = repository.ingest_responses(_upload())
+
+    assert (report.inserted, report.updated, report.skipped) == (0, 0, 4)
+    assert driver.writes == 0
+
+
+def test_changed_answer_is_still_detected(tmp_path):
+    driver = SheetLikeDriver()
+    repository = StorageRepository(driver, fingerprint_index=ResponseFingerprintIndex(tmp_path))
+    repository.ingest_responses(_upload())
+
+    changed = _upload()
+    changed.loc[0, "answer_value"] = 4.0
+    report = repository.ingest_responses(changed)
+
+    assert (report.inserted, report.updated, report.skipped) == (0, 1, 3)
+    assert repository.list_responses()["answer_value"].tolist() == [4, "", 4, 3.5]
+
+
+def test_fingerprints_ignore_blank_and_integral_float_representations():
+    uploaded = _upload()
+    stored = pd.DataFrame(
+        {
+            "survey_id": ["S1"] * 4,
+            "respondent_id": ["R-1", "R-1", "R-2", "R-2"],
+            "question_id": ["Q1", "Q2", "Q1", "Q2"],
+            "answer_value": ["5", "", 4, "3.5"],
+        }
+    )
+
+    for left, right in zip(fingerprint_responses(uploaded), fingerprint_responses(stored)):
+        np.testing.assert_array_equal(left, right)
@@ -0,0 +1,36 @@
+import pandas as pd
+
+from src.etl import ProperNounMasker, classify_questions
+from src.etl.survey import normalize_series
+
+
+def test_roster_names_with_digits_and_punctuation_are_masked():
+    masker = ProperNounMasker.from_roster(courses=["DX-101 리더십 과정"], instructors=["김철수(PM)"])
+    questions = normalize_series(pd.Series(["DX-101 리더십 과정에 만족하십니까?", "김철수(PM) 강사의 설명은 명확했습니까?"]))
+
+    assert masker.mask_series(questions).tolist() == [
+        "{{COURSE}}에 만족하십니까",
+        "{{INSTRUCTOR}} 강사의 설명은 명확했습니까",
+    ]
+
+
+def test_course_name_with_punctuation_is_masked_before_matching():
+    matches = classify_questions(
+        ["DX-101 과정의 내용에 만족하십니까?"],
+        ["{{COURSE}} 과정의 내용에 만족하십니까"],
+        course_name="DX-101",
+    )
+
+    assert matches[0].cleaned == "{{COURSE}} 과정의 내용에 만족하십니까"
+
+
+def test_mask_series_keeps_index_and_missing_values():
+    masker = ProperNounMasker.from_roster(instructors=["김철수"])
+    series = pd.Series(["김철수 강사", None, "김철수 강사", "기타"], index=[10, 11, 12, 13], name="q")
+
+    masked = masker.mask_series(series)
+
+    assert masked.index.tolist() == [10, 11, 12, 13]
+    assert masked.name == "q"
+    assert masked[[10, 12, 13]].tolist() == ["{{INSTRUCTOR}} 강사", "{{INSTRUCTOR}} 강사", "기타"]
+    assert pd.isna(masked[11])
@@ -0,0 +1,16 @@
+import numpy as np
+
+from src.etl import QuestionMatchCache, classify_questions
+
+
+def test_numpy_bank_ids_are_cached_with_their_python_type():
+    bank = [{"id": np.int64(3), "text": "강의 시간이 적절했나요?"}, {"id": np.str_("Q-9"), "text": "강사는 친절했나요?"}]
+    cache = QuestionMatchCache()
+
+    first = classify_questions(["강의 시간이 적절했나요?", "강사는 친절했나요?"], bank, cache=cache)
+    second = classify_questions(["강의 시간이 적절했나요?", "강사는 친절했나요?"], bank, cache=cache)
+
+    assert [match.match_id for match in first] == [3, "Q-9"]
+    assert [match.match_id for match in second] == [3, "Q-9"]
+    assert type(second[0].match_id) is int and type(second[1].match_id) is str
+    assert len(cache) == 2
@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+
+from src.analytics import ResponseAggregateStore, SnapshotMemo
+from src.analytics.memo import frame_fingerprint
+
+
+@pytest.fixture
+def responses():
+    return pd.DataFrame(
+        {
+            "survey_id": ["S1", "S1", "S2", "S2"],
+            "respondent_id": ["R1", "R2", "R1", "R2"],
+            "question_id": ["Q1", "Q1", "Q1", "Q1"],
+            "answer_value": ["5", "4", "3", "2"],
+        }
+    )
+
+
+def test_identical_frame_is_a_hit(responses):
+    memo = SnapshotMemo()
+
+    first = memo.build_quantitative_snapshot(responses)
+    second = memo.build_quantitative_snapshot(responses.copy())
+
+    assert second is first
+    assert (memo.hits, memo.misses) == (1, 1)
+    assert frame_fingerprint(responses) == frame_fingerprint(responses.copy())
+
+
+def test_changed_content_is_a_miss(responses):
+    memo = SnapshotMemo()
+    changed = responses.copy()
+    changed.loc[0, "answer_value"] = "1"
+
+    first = memo.build_quantitative_snapshot(responses)
+    second = memo.build_quantitative_snapshot(changed)
+
+    assert (memo.hits, memo.misses) == (0, 2)
+    assert frame_fingerprint(changed) != frame_fingerprint(responses)
+    assert first["overall"]["mean_score"][0] == 3.5
+    assert second["overall"]["mean_score"][0] == 2.5
+
+
+def test_aggregate_store_write_is_a_miss(responses):
+    memo = SnapshotMemo()
+    store = ResponseAggregateStore()
+    store.add(responses)
+
+    first = memo.build_quantitative_snapshot(store)
+    assert memo.build_quantitative_snapshot(store) is first
+    store.add(responses.assign(respondent_id="R3", answer_value="1"))
+    second = memo.build_quantitative_snapshot(store)
+
+    assert (memo.hits, memo.misses) == (1, 2)
+    assert second["overall"]["response_count"][0] == 8
+
+
+def test_least_recently_used_entry_is_evicted(responses):
+    memo = SnapshotMemo(max_entries=2)
+    calls = []
+
+    def compute(name):
+        return memo.get_or_compute(memo.key(name, responses), lambda: calls.append(name) or name)
+
+    compute("a")
+    compute("b")
+    compute("a")
+    compute("c")
+    compute("a")
+    compute("b")
+
+    assert calls == ["a", "b", "c", "b"]
+    assert len(memo) == 2
+
+
+def test_each_selected_survey_has_its_own_entry(responses):
+    memo = SnapshotMemo()
+
+    first = memo.build_quantitative_snapshot(responses, survey_id="S1")
+    second = memo.build_quantitative_snapshot(responses, survey_id="S2")
+    again = memo.build_quantitative_snapshot(responses, survey_id="S1")
+    nps = memo.calculate_nps(responses, survey_id="S1")
+
+    assert again is first
+    assert (memo.hits, memo.misses, len(memo)) == (1, 3, 3)
+    assert first["overall"]["mean_score"][0] == 4.5
+    assert second["overall"]["mean_score"][0] == 2.5
+    assert nps["total"][0] == 2
+
+
+def test_invalid_size_is_rejected():
+    with pytest.raises(ValueError):
+        SnapshotMemo(max_entries=0)
@@ -0,0 +1,207 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from reference import quantitative as reference
+from src.analytics import (
+    ResponseAggregateStore,
+    build_quantitative_snapshot,
+    calculate_nps,
+    calculate_satisfaction,
+    prepare_responses,
+)
+
+
+def make_responses(rows, seed=0, surveys=200):
+    rng = np.random.default_rng(seed)
+    answers = rng.integers(0, 11, rows).astype(str).astype(object)
+    answers[rng.random(rows) < 0.05] = "좋아요"
+    responses = pd.DataFrame(
+        {
+            "survey_id": [f"S{i}" for i in rng.integers(0, surveys, rows)],
+            "respondent_id": [f"R{i}" for i in rng.integers(0, 5000, rows)],
+            "question_id": [f"Q{i}" for i in rng.integers(0, 20, rows)],
+            "answer_value": answers,
+        }
+    )
+    metadata = pd.DataFrame(
+        {
+            "survey_id": [f"S{i}" for i in range(surveys)],
+            "course_name": [f"C{i % 30}" if i % 17 else None for i in range(surveys)],
+            "instructor_name": [f"I{i % 13}" for i in range(surveys)],
+            "round": [f"{i % 4 + 1}차" for i in range(surveys)],
+        }
+    )
+    bank = pd.DataFrame(
+        {
+            "id": [f"Q{i}" for i in range(20)],
+            "category": ["NPS" if i in (3, 7) else "만족도" for i in range(20)],
+        }
+    )
+    return responses, metadata, bank
+
+
+def assert_frames_match(expected, actual):
+    assert list(actual.columns) == list(expected.columns)
+    assert len(actual) == len(expected)
+    for column in expected.columns:
+        left, right = expected[column], actual[column]
+        if pd.api.types.is_numeric_dtype(left) and pd.api.types.is_numeric_dtype(right):
+            np.testing.assert_allclose(right.astype(float), left.astype(float), err_msg=column)
+        else:
+            as_text = lambda series: series.astype(object).where(series.notna(), "<NA>").astype(str).tolist()
+            assert as_text(right) == as_text(left), column
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("bank_variant", ["bank", "none", "no_category"])
+def test_snapshot_matches_reference(seed, bank_variant):
+    responses, metadata, bank = make_responses(20_000, seed)
+    bank = {"bank": bank, "none": None, "no_category": bank.drop(columns="category")}[bank_variant]
+
+    expected = reference.build_quantitative_snapshot(responses, question_bank=bank, metadata=metadata)
+    actual = build_quantitative_snapshot(responses, question_bank=bank, metadata=metadata)
+
+    assert list(actual) == list(expected)
+    for name in expected:
+        assert_frames_match(expected[name], actual[name])
+
+
+def test_snapshot_without_metadata_matches_reference():
+    responses, _, bank = make_responses(5_000)
+
+    expected = reference.build_quantitative_snapshot(responses, question_bank=bank)
+    actual = build_quantitative_snapshot(responses, question_bank=bank)
+
+    for name in expected:
+        assert_frames_match(expected[name], actual[name])
+
+
+def test_snapshot_of_prepared_responses_matches_reference():
+    responses, metadata, bank = make_responses(20_000, seed=4)
+    prepared = prepare_responses(responses, question_bank=bank, metadata=metadata)
+
+    expected = reference.build_quantitative_snapshot(responses, question_bank=bank, metadata=metadata)
+    actual = build_quantitative_snapshot(prepared, question_bank=bank)
+
+    for name in expected:
+        assert_frames_match(expected[name], actual[name])
+
+
+def test_empty_snapshot_matches_reference():
+    responses, metadata, bank = make_responses(100)
+
+    expected = reference.build_quantitative_snapshot(responses.iloc[:0], question_bank=bank, metadata=metadata)
+    actual = build_quantitative_snapshot(responses.iloc[:0], question_bank=bank, metadata=metadata)
+
+    for name in expected:
+        assert_frames_match(expected[name], actual[name])
+
+
+@pytest.mark.parametrize("seed", range(2))
+@pytest.mark.parametrize(
+    "group_cols",
+    [[], ["course_name"], ["course_name", "instructor_name", "round"], None],
+)
+@pytest.mark.parametrize("selection", ["bank", "default", "ids", "no_ids"])
+def test_calculate_nps_matches_reference(seed, group_cols, selection):
+    responses, metadata, bank = make_responses(10_000, seed)
+    responses = responses.merge(metadata, on="survey_id", how="left")
+    # Fractional answers fall between the NPS bins.
+    responses.loc[responses.index[::7], "answer_value"] = "8.5"
+    options = {
+        "bank": {"question_bank": bank},
+        "default": {},
+        "ids": {"nps_question_ids": ["Q3"]},
+        "no_ids": {"nps_question_ids": []},
+    }[selection]
+
+    expected = reference.calculate_nps(responses, group_cols=group_cols, **options)
+    actual = calculate_nps(responses, group_cols=group_cols, **options)
+
+    assert_frames_match(expected, actual)
+
+
+@pytest.mark.parametrize("group_cols", [[], ["course_name"], ["course_name", "instructor_name"]])
+def test_prepared_responses_match_reference_on_the_merged_frame(group_cols):
+    responses, metadata, bank = make_responses(20_000, seed=5)
+    merged = responses.merge(metadata, on="survey_id", how="left")
+    before = responses.copy()
+
+    prepared = prepare_responses(responses, question_bank=bank, metadata=metadata)
+
+    assert_frames_match(
+        reference.calculate_satisfaction(merged, group_cols=group_cols),
+        calculate_satisfaction(prepared, group_cols=group_cols),
+    )
+    assert_frames_match(
+        reference.calculate_nps(merged, group_cols=group_cols, question_bank=bank),
+        calculate_nps(prepared, group_cols=group_cols, question_bank=bank),
+    )
+    pd.testing.assert_frame_equal(responses, before)
+    assert prepared.responses is responses
+
+
+def assert_snapshots_match(expected, actual):
+    assert list(actual) == list(expected)
+    for name in expected:
+        assert_frames_match(expected[name], actual[name])
+
+
+def test_aggregate_store_built_in_chunks_matches_the_row_snapshot():
+    responses, metadata, bank = make_responses(20_000, seed=6)
+    store = ResponseAggregateStore()
+    for start in range(0, len(responses), 3_000):
+        store.add(responses.iloc[start : start + 3_000])
+
+    assert_snapshots_match(
+        build_quantitative_snapshot(responses, question_bank=bank, metadata=metadata),
+        build_quantitative_snapshot(store, question_bank=bank, metadata=metadata),
+    )
+
+
+def test_aggregate_store_rebuild_replaces_earlier_writes():
+    responses, metadata, bank = make_responses(10_000, seed=7)
+    store = ResponseAggregateStore()
+    store.add(responses)
+    version = store.version
+
+    store.rebuild(responses.iloc[:4_000])
+
+    assert store.version != version
+    assert_snapshots_match(
+        build_quantitative_snapshot(responses.iloc[:4_000], question_bank=bank, metadata=metadata),
+        build_quantitative_snapshot(store, question_bank=bank, metadata=metadata),
+    )
+
+
+def test_aggregate_store_drop_surveys_matches_the_remaining_rows():
+    responses, metadata, bank = make_responses(10_000, seed=8)
+    store = ResponseAggregateStore()
+    store.add(responses)
+    dropped = [f"S{i}" for i in range(0, 200, 3)]
+
+    store.drop_surveys(dropped)
+
+    remaining = responses[~responses["survey_id"].isin(dropped)]
+    assert set(store.survey_ids) == set(remaining["survey_id"])
+    assert_snapshots_match(
+        build_quantitative_snapshot(remaining, question_bank=bank, metadata=metadata),
+        build_quantitative_snapshot(store, question_bank=bank, metadata=metadata),
+    )
+
+
+def test_aggregate_store_persists_and_reloads(tmp_path):
+    responses, metadata, bank = make_responses(10_000, seed=9)
+    path = tmp_path / "aggregates.csv"
+    store = ResponseAggregateStore(path)
+    store.add(responses.iloc[:6_000])
+    store.add(responses.iloc[6_000:])
+
+    reloaded = ResponseAggregateStore(path)
+
+    assert len(reloaded) == len(store)
+    assert_snapshots_match(
+        build_quantitative_snapshot(responses, question_bank=bank, metadata=metadata),
+        build_quantitative_snapshot(reloaded, question_bank=bank, metadata=metadata),
+    )
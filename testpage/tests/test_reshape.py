@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from src.etl import reshape_wide_responses
+
+BANK = [
+    {"id": "Q1", "text": "교육 내용에 만족하십니까"},
+    {"id": "Q2", "text": "강사의 설명은 명확했습니까"},
+]
+
+
+def test_headers_melt_into_long_rows():
+    wide = pd.DataFrame(
+        {
+            "이름": ["김", "이"],
+            "교육 내용에 만족하십니까": [5, 4],
+            "강사의 설명은 명확했습니까": ["3", "2"],
+            "오늘 점심은 맛있었나요": ["네", "아니오"],
+        }
+    )
+    result = reshape_wide_responses(wide, BANK, survey_id="S1")
+
+    assert result.question_columns == {"교육 내용에 만족하십니까": "Q1", "강사의 설명은 명확했습니까": "Q2"}
+    assert result.unmatched_columns == ["오늘 점심은 맛있었나요"]
+    assert result.responses.to_dict("records") == [
+        {"survey_id": "S1", "respondent_id": "R-000001", "question_id": "Q1", "answer_value": "5"},
+        {"survey_id": "S1", "respondent_id": "R-000001", "question_id": "Q2", "answer_value": "3"},
+        {"survey_id": "S1", "respondent_id": "R-000002", "question_id": "Q1", "answer_value": "4"},
+        {"survey_id": "S1", "respondent_id": "R-000002", "question_id": "Q2", "answer_value": "2"},
+    ]
+
+
+def test_identifier_and_metadata_columns_are_skipped():
+    wide = pd.DataFrame(
+        {
+            "사번": ["E1", "E2"],
+            "부서": ["인사", "재무"],
+            "차수": ["1차", "1차"],
+            "교육 내용에 만족하십니까": [5, 4],
+        }
+    )
+    result = reshape_wide_responses(wide, BANK, survey_id="S1", respondent_col="사번", metadata_cols=["차수"])
+
+    assert result.unmatched_columns == []
+    assert result.responses["respondent_id"].tolist() == ["E1", "E2"]
+    assert result.responses["question_id"].tolist() == ["Q1", "Q1"]
+
+
+def test_blank_answers_are_dropped():
+    wide = pd.DataFrame(
+        {
+            "교육 내용에 만족하십니까": [5, np.nan, 3],
+            "강사의 설명은 명확했습니까": ["좋음", " ", None],
+        }
+    )
+    result = reshape_wide_responses(wide, BANK, survey_id="S1")
+
+    assert result.responses[["respondent_id", "question_id", "answer_value"]].values.tolist() == [
+        ["R-000001", "Q1", "5"],
+        ["R-000001", "Q2", "좋음"],
+        ["R-000003", "Q1", "3"],
+    ]
+
+
+def test_headers_matching_one_question_keep_the_best_score():
+    wide = pd.DataFrame(
+        {
+            "교육 내용에 만족하셨습니까": [1, 2],
+            "교육 내용에 만족하십니까": [5, 4],
+            "교육 내용 만족하십니까": [3, 3],
+        }
+    )
+    result = reshape_wide_responses(wide, BANK, survey_id="S1", accept_similar=True)
+
+    assert result.question_columns == {"교육 내용에 만족하십니까": "Q1"}
+    assert result.unmatched_columns == ["교육 내용에 만족하셨습니까", "교육 내용 만족하십니까"]
+    assert not result.responses.duplicated(["respondent_id", "question_id"]).any()
+    assert result.responses["answer_value"].tolist() == ["5", "4"]
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics import build_quantitative_snapshot
+from src.etl import compact_responses, load_typed_responses
+from test_quantitative import assert_frames_match, make_responses
+
+CSV = (
+    "survey_id,respondent_id,question_id,answer_value\n"
+    "S1,R1,Q1,5\n"
+    "S1,R1,Q2,좋아요\n"
+    "S1,R2,Q1,\n"
+    "S2,R1,Q1,3\n"
+).encode("utf-8")
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_load_typed_responses(engine):
+    responses = load_typed_responses(CSV, engine=engine)
+
+    for column in ("survey_id", "respondent_id", "question_id"):
+        assert isinstance(responses[column].dtype, pd.CategoricalDtype)
+    assert responses["answer_value"].dtype == np.float32
+    np.testing.assert_array_equal(responses["answer_value"], [5, np.nan, np.nan, 3])
+    assert responses["answer_text"].notna().tolist() == [False, True, False, False]
+    assert responses["answer_text"].iloc[1] == "좋아요"
+
+
+def test_non_integer_answers_keep_float64_precision():
+    responses = pd.DataFrame({"question_id": ["Q1", "Q1", "Q2"], "answer_value": ["4.3", "5", " "]})
+    compact = compact_responses(responses)
+
+    assert compact["answer_value"].dtype == np.float64
+    assert compact["answer_value"].iloc[0] == 4.3
+    assert compact["answer_text"].isna().all()
+
+
+@pytest.mark.parametrize("decimals", [False, True])
+def test_snapshot_is_unchanged_by_compaction(decimals):
+    responses, metadata, bank = make_responses(5_000, seed=3, surveys=40)
+    if decimals:
+        # Averaged ratings such as 4.3 would be rounded by float32.
+        rng = np.random.default_rng(3)
+        picked = rng.random(len(responses)) < 0.1
+        responses.loc[picked, "answer_value"] = np.round(rng.uniform(0, 10, int(picked.sum())), 1).astype(str)
+
+    expected = build_quantitative_snapshot(responses, question_bank=bank, metadata=metadata)
+    actual = build_quantitative_snapshot(compact_responses(responses), question_bank=bank, metadata=metadata)
+
+    assert list(actual) == list(expected)
+    for name in expected:
+        assert_frames_match(expected[name], actual[name])
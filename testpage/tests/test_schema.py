@@ -0,0 +1,31 @@
+import pandas as pd
+
+from src.etl import CsvExportCache, infer_survey_schema, load_raw_survey_data
+
+
+def test_schema_sampling_and_load_share_one_download(csv_server, tmp_path):
+    csv_server.body = "설문 결과\n과정명,강사명,점수\nDX 리더십,김철수,5\nDX 리더십,이영희,4\n".encode("utf-8")
+    cache = CsvExportCache(tmp_path)
+
+    schema = infer_survey_schema(csv_server.url, http_cache=cache)
+    frame = load_raw_survey_data(csv_server.url, schema=schema, http_cache=cache)
+
+    assert schema.header_row == 1
+    assert schema.renames == {"과정명": "course_name", "강사명": "instructor_name", "점수": "score"}
+    assert len(frame) == 2
+    assert len(csv_server.requests) == 1
+    assert cache.downloads == 1
+
+
+def test_padded_headers_are_renamed_and_typed(tmp_path):
+    rows = "".join(f"a{i}@example.com,DX 리더십,{i % 5 + 1}\n" for i in range(12))
+    path = tmp_path / "padded.csv"
+    path.write_text(" 이메일 ,과정명  ,점수\n" + rows, encoding="utf-8")
+
+    schema = infer_survey_schema(str(path))
+    frame = load_raw_survey_data(str(path), schema=schema)
+
+    assert schema.columns == [" 이메일 ", "과정명  ", "점수"]
+    assert schema.renames == {" 이메일 ": "user_email", "과정명  ": "course_name", "점수": "score"}
+    assert list(frame.columns) == ["user_email", "course_name", "score"]
+    assert isinstance(frame["course_name"].dtype, pd.CategoricalDtype)
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from src.analytics import adjust_p_values, pairwise_significance
+
+P_VALUES = np.array([0.01, 0.04, np.nan, 0.03, 0.005])
+
+
+@pytest.mark.parametrize(
+    "correction, expected",
+    [
+        ("bonferroni", [0.04, 0.16, np.nan, 0.12, 0.02]),
+        ("holm", [0.03, 0.06, np.nan, 0.06, 0.02]),
+        ("fdr_bh", [0.02, 0.04, np.nan, 0.04, 0.02]),
+        ("none", [0.01, 0.04, np.nan, 0.03, 0.005]),
+    ],
+)
+def test_adjust_p_values_matches_reference_values(correction, expected):
+    np.testing.assert_allclose(adjust_p_values(P_VALUES, correction), expected)
+
+
+def test_adjusted_p_values_are_capped_at_one():
+    assert adjust_p_values(np.array([0.5, 0.6, 0.9]), "bonferroni").tolist() == [1.0, 1.0, 1.0]
+    assert np.isnan(adjust_p_values(np.array([np.nan]), "holm")).all()
+
+
+def make_responses(groups):
+    return pd.DataFrame(
+        {
+            "instructor_name": [name for name, values in groups.items() for _ in values],
+            "answer_value": [str(value) for values in groups.values() for value in values],
+        }
+    )
+
+
+# scipy warns about the constant group D; its Welch test is still well defined.
+@pytest.mark.filterwarnings("ignore:Precision loss")
+def test_welch_p_values_match_scipy():
+    rng = np.random.default_rng(0)
+    groups = {
+        "A": rng.integers(0, 11, 40),
+        "B": rng.integers(3, 11, 25),
+        "C": rng.integers(0, 8, 60),
+        "D": np.full(10, 7),
+    }
+    result = pairwise_significance(make_responses(groups), correction="none")
+
+    for row in result.itertuples():
+        expected = stats.ttest_ind(
+            groups[row.instructor_name_a].astype(float),
+            groups[row.instructor_name_b].astype(float),
+            equal_var=False,
+        )
+        assert row.t_stat == pytest.approx(expected.statistic)
+        assert row.p_value == pytest.approx(expected.pvalue)
+        assert row.mean_diff == pytest.approx(
+            groups[row.instructor_name_a].mean() - groups[row.instructor_name_b].mean()
+        )
+
+
+def test_single_response_and_constant_groups_are_not_tested():
+    groups = {"A": [5, 6, 9], "B": [8], "C": [7, 7], "D": [7, 7, 7]}
+    result = pairwise_significance(make_responses(groups)).set_index(["instructor_name_a", "instructor_name_b"])
+
+    assert result.loc[("A", "B"), ["t_stat", "p_value", "p_adjusted"]].isna().all()
+    assert np.isnan(result.loc[("C", "D"), "p_value"])
+    assert not result.loc[("C", "D"), "significant"]
+    # Only the two testable pairs (A-C, A-D) count toward the Holm correction.
+    tested = result["p_value"].dropna()
+    assert len(tested) == 2
+    np.testing.assert_allclose(result["p_adjusted"].dropna(), adjust_p_values(tested.to_numpy(), "holm"))
+
+
+def test_nps_difference_uses_multinomial_variance():
+    groups = {"A": [10, 10, 9, 8, 3, 0], "B": [9, 7, 6, 5, 1, 2, 10]}
+    row = pairwise_significance(make_responses(groups), correction="none").iloc[0]
+
+    def nps_and_variance(values):
+        values = np.asarray(values)
+        promoters, detractors = (values >= 9).mean(), (values <= 6).mean()
+        spread = promoters + detractors - (promoters - detractors) ** 2
+        return (promoters - detractors) * 100, spread / len(values) * 100**2
+
+    nps_a, var_a = nps_and_variance(groups["A"])
+    nps_b, var_b = nps_and_variance(groups["B"])
+    z = (nps_a - nps_b) / np.sqrt(var_a + var_b)
+    assert row["nps_diff"] == pytest.approx(nps_a - nps_b)
+    assert row["nps_z"] == pytest.approx(z)
+    assert row["nps_p_value"] == pytest.approx(2 * stats.norm.sf(abs(z)))
+
+
+def test_unknown_correction_is_rejected():
+    with pytest.raises(ValueError):
+        pairwise_significance(make_responses({"A": [1, 2], "B": [3, 4]}), correction="sidak")
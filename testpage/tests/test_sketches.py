@@ -0,0 +1,156 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics import GroupedQuantileSketch, QuantileSketch, build_quantile_sketches
+
+QUANTILES = np.linspace(0.01, 0.99, 99)
+
+
+def max_rank_error(sketch, data):
+    """Largest gap between requested and actual rank of the sketch's answers."""
+    ordered = np.sort(data)
+    estimates = sketch.quantile(QUANTILES)
+    below = np.searchsorted(ordered, estimates, side="left") / len(data)
+    through = np.searchsorted(ordered, estimates, side="right") / len(data)
+    return float(np.maximum(0, np.maximum(below - QUANTILES, QUANTILES - through)).max())
+
+
+def sample(seed, rows, discrete):
+    rng = np.random.default_rng(seed)
+    return rng.integers(1, 11, rows).astype(float) if discrete else rng.lognormal(size=rows)
+
+
+@pytest.mark.parametrize("rows", [1, 2, 7, 50, 200])
+def test_small_inputs_are_exact(rows):
+    data = np.random.default_rng(rows).normal(size=rows)
+
+    sketch = QuantileSketch().update(data)
+
+    assert sketch.is_exact
+    np.testing.assert_array_equal(sketch.quantile(QUANTILES), np.quantile(data, QUANTILES, method="inverted_cdf"))
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("discrete", [False, True])
+def test_single_stream_rank_error_is_within_the_bound(seed, discrete):
+    data = sample(seed, 200_000, discrete)
+
+    sketch = QuantileSketch(seed=seed).update(data)
+
+    assert max_rank_error(sketch, data) <= sketch.rank_error
+    assert (sketch.n, sketch.min, sketch.max) == (len(data), data.min(), data.max())
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("chunks", [2, 17, 60])
+def test_merged_rank_error_is_within_the_bound(seed, chunks):
+    data = sample(seed, 150_000, discrete=bool(seed % 2))
+
+    merged = QuantileSketch(seed=seed)
+    for position, part in enumerate(np.array_split(data, chunks)):
+        merged.merge(QuantileSketch(seed=seed * 100 + position).update(part))
+
+    assert max_rank_error(merged, data) <= merged.rank_error
+    assert (merged.n, merged.min, merged.max) == (len(data), data.min(), data.max())
+    # The sketch stays O(k) however many inputs it has seen.
+    assert sum(len(level) for level in merged._levels) < 4 * merged.k
+
+
+def test_rank_error_bound_matches_the_documented_value():
+    assert QuantileSketch(200).rank_error == pytest.approx(0.0165, abs=5e-4)
+
+
+def test_json_round_trip_preserves_quantiles_and_merges():
+    first = QuantileSketch(seed=1).update(sample(1, 50_000, discrete=False))
+    second = QuantileSketch(seed=2).update(sample(2, 50_000, discrete=False))
+
+    restored = QuantileSketch.from_dict(json.loads(json.dumps(first.to_dict())), seed=3)
+
+    np.testing.assert_array_equal(restored.quantile(QUANTILES), first.quantile(QUANTILES))
+    assert (restored.n, restored.min, restored.max) == (first.n, first.min, first.max)
+    restored.merge(second)
+    assert restored.n == 100_000
+    data = np.concatenate([sample(1, 50_000, discrete=False), sample(2, 50_000, discrete=False)])
+    assert max_rank_error(restored, data) <= restored.rank_error
+
+
+def test_unseeded_sketches_are_reproducible():
+    data = sample(4, 50_000, discrete=False)
+
+    first = QuantileSketch().update(data)
+    second = QuantileSketch().update(data)
+
+    assert first.to_dict() == second.to_dict()
+    assert QuantileSketch(seed=5).update(data).to_dict() != first.to_dict()
+
+
+def test_empty_sketch_round_trips():
+    restored = QuantileSketch.from_dict(json.loads(json.dumps(QuantileSketch().to_dict())))
+
+    assert restored.n == 0
+    assert np.isnan(restored.quantile(0.5))
+
+
+@pytest.fixture
+def responses():
+    rng = np.random.default_rng(0)
+    rows = 200_000
+    frame = pd.DataFrame(
+        {
+            "question_id": rng.choice([f"Q{i}" for i in range(5)], rows),
+            "course_name": rng.choice([f"C{i}" for i in range(8)], rows),
+            "answer_value": rng.integers(1, 11, rows).astype(str),
+        }
+    )
+    frame.loc[::97, "answer_value"] = "없음"
+    return frame
+
+
+def test_grouped_sketches_merged_across_chunks_match_numpy(responses):
+    group_cols = ("question_id", "course_name")
+    total = GroupedQuantileSketch(group_cols)
+    for start in range(0, len(responses), 25_000):
+        total.merge(build_quantile_sketches(responses.iloc[start : start + 25_000], group_cols=group_cols))
+
+    scores = pd.to_numeric(responses["answer_value"], errors="coerce")
+    valid = responses.assign(score=scores).dropna(subset=["score"])
+    result = total.quantiles([0.25, 0.5, 0.75])
+
+    assert len(result) == valid.groupby(list(group_cols)).ngroups
+    for row in result.itertuples(index=False):
+        group = valid.loc[(valid["question_id"] == row.question_id) & (valid["course_name"] == row.course_name), "score"]
+        sketch = total.sketches[(row.question_id, row.course_name)]
+        assert row.response_count == len(group)
+        assert max_rank_error(sketch, group.to_numpy()) <= sketch.rank_error
+
+
+def test_grouped_json_round_trip_and_regroup(responses):
+    sketches = build_quantile_sketches(responses, group_cols=("question_id", "course_name"))
+
+    restored = GroupedQuantileSketch.from_json(sketches.to_json())
+
+    pd.testing.assert_frame_equal(restored.quantiles(), sketches.quantiles())
+    by_question = restored.regroup(["question_id"], lambda key: key[:1]).quantiles([0.5])
+    counts = pd.to_numeric(responses["answer_value"], errors="coerce").groupby(responses["question_id"]).count()
+    assert by_question["question_id"].tolist() == counts.index.tolist()
+    assert by_question["response_count"].tolist() == counts.tolist()
+
+
+def test_grouped_sketches_are_reproducible(responses):
+    first = build_quantile_sketches(responses, group_cols=("question_id",), k=16)
+    second = build_quantile_sketches(responses, group_cols=("question_id",), k=16)
+
+    assert first.to_json() == second.to_json()
+
+
+def test_grouped_keys_with_numbers_and_missing_values_round_trip():
+    frame = pd.DataFrame({"round": [1, 2, np.nan, 1] * 5, "answer_value": range(20)})
+
+    sketches = build_quantile_sketches(frame, group_cols=("round",))
+    restored = GroupedQuantileSketch.from_json(sketches.to_json())
+
+    assert sorted(restored.sketches, key=str) == sorted(sketches.sketches, key=str)
+    pd.testing.assert_frame_equal(restored.quantiles([0.5]), sketches.quantiles([0.5]))
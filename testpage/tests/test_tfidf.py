@@ -0,0 +1,89 @@
+import math
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from src.etl import TfidfQuestionScorer, classify_questions
+
+BANK = [
+    "교육 내용에 만족하십니까",
+    "강사의 설명은 명확했습니까",
+    "교육 시간은 적절했습니까",
+    "다른 사람에게 추천하시겠습니까",
+]
+
+
+def ngrams(text, low=2, high=3):
+    padded = f" {text} "
+    return Counter(padded[i : i + n] for n in range(low, high + 1) for i in range(len(padded) - n + 1))
+
+
+def brute_force_scores(bank, query):
+    # Dense smoothed TF-IDF; n-grams unseen in the bank keep the maximum idf
+    # so they still lengthen the query vector.
+    documents = [ngrams(text) for text in bank]
+    frequency = Counter(gram for counts in documents for gram in counts)
+    idf = {gram: math.log((1 + len(bank)) / (1 + count)) + 1 for gram, count in frequency.items()}
+    unseen = math.log(1 + len(bank)) + 1
+
+    def vector(counts):
+        weights = {gram: count * idf.get(gram, unseen) for gram, count in counts.items()}
+        norm = math.sqrt(sum(value * value for value in weights.values()))
+        return {gram: value / norm for gram, value in weights.items() if gram in idf}
+
+    target = vector(ngrams(query))
+    return [sum(value * vector(counts).get(gram, 0.0) for gram, value in target.items()) for counts in documents]
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["교육 내용 만족하십니까", "강사 설명 명확", "추천하시겠습니까", "교육 시간", "전혀 다른 문장"],
+)
+def test_scores_match_brute_force_cosine(query):
+    scorer = TfidfQuestionScorer(BANK)
+    positions, scores = scorer.top_k([query], k=len(BANK))
+
+    expected = brute_force_scores(BANK, query)
+    found = positions[0] >= 0
+    np.testing.assert_allclose(scores[0][found], [expected[position] for position in positions[0][found]])
+    assert sorted(scores[0][found], reverse=True) == scores[0][found].tolist()
+    assert {int(position) for position in positions[0][found]} == {
+        position for position, score in enumerate(expected) if score > 0
+    }
+
+
+def test_identical_text_scores_one_and_ties_prefer_earlier_entries():
+    scorer = TfidfQuestionScorer(["같은 문항", "다른 질문", "같은 문항"])
+    positions, scores = scorer.top_k(["같은 문항"], k=2)
+
+    assert positions[0].tolist() == [0, 2]
+    np.testing.assert_allclose(scores[0], [1.0, 1.0])
+
+
+def test_missing_matches_are_padded():
+    positions, scores = TfidfQuestionScorer(["가나"]).top_k(["다라마", "가나"], k=3)
+
+    assert positions.tolist() == [[-1, -1, -1], [0, -1, -1]]
+    assert scores[1, 1:].tolist() == [0.0, 0.0]
+    empty_positions, _ = TfidfQuestionScorer([]).top_k(["가나"], k=2)
+    assert empty_positions.tolist() == [[-1, -1]]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        TfidfQuestionScorer(BANK, ngram_range=(3, 2))
+    with pytest.raises(ValueError):
+        TfidfQuestionScorer(BANK).top_k(["교육"], k=0)
+
+
+def test_classify_questions_with_tfidf_scorer():
+    bank = [{"id": f"Q{position}", "text": text} for position, text in enumerate(BANK)]
+    matches = classify_questions(
+        ["교육 내용에 만족하십니까", "교육 내용에 만족하셨습니까", "점심 메뉴"],
+        bank,
+        scorer="tfidf",
+    )
+
+    assert [(match.status, match.match_id) for match in matches[:2]] == [("existing", "Q0"), ("similar", "Q0")]
+    assert matches[2].status == "new"
@@ -0,0 +1,79 @@
+import pytest
+from openpyxl import Workbook
+
+from src.etl import (
+    SHEET_ORIGIN_COLUMN,
+    infer_survey_schema,
+    iter_raw_survey_data,
+    iter_survey_workbook,
+    load_survey_workbook,
+)
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    workbook = Workbook()
+    first = workbook.active
+    first.title = "S1"
+    first.append(["2024 만족도 조사"])
+    first.append(["과정명", "강사명", "점수"])
+    first.append(["DX 리더십", "김철수", 5])
+    first.append(["DX 리더십", "이영희", 4])
+    second = workbook.create_sheet("S2")
+    second.append(["과정명", "강사명", "점수"])
+    second.append(["데이터 분석", "박민수", 3])
+    second.append(["데이터 분석", "최지우", 4])
+    path = tmp_path / "survey.xlsx"
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_first_tab_schema_does_not_shift_other_tab_headers(workbook_path, workers):
+    schema = infer_survey_schema(workbook_path)
+
+    frame = load_survey_workbook(workbook_path, None, schema=schema, workers=workers)
+
+    assert schema.header_row == 1
+    assert frame[["course_name", "instructor_name", "score", SHEET_ORIGIN_COLUMN]].values.tolist() == [
+        ["DX 리더십", "김철수", 5, "S1"],
+        ["DX 리더십", "이영희", 4, "S1"],
+        ["데이터 분석", "박민수", 3, "S2"],
+        ["데이터 분석", "최지우", 4, "S2"],
+    ]
+
+
+def test_streamed_tabs_use_their_own_header_rows(workbook_path):
+    schema = infer_survey_schema(workbook_path, "S2")
+
+    chunks = list(iter_survey_workbook(workbook_path, None, schema=schema, workers=1))
+
+    assert [chunk[SHEET_ORIGIN_COLUMN].iloc[0] for chunk in chunks] == ["S1", "S2"]
+    assert all(list(chunk.columns[:3]) == ["course_name", "instructor_name", "score"] for chunk in chunks)
+    assert sum(len(chunk) for chunk in chunks) == 4
+
+
+@pytest.fixture
+def twin_workbook_path(tmp_path):
+    workbook = Workbook()
+    for position, title in enumerate(["S1", "S2"]):
+        sheet = workbook.active if position == 0 else workbook.create_sheet(title)
+        sheet.title = title
+        sheet.append(["과정명", "강사명", "점수"])
+        sheet.append(["DX 리더십", "김철수", 5 - position])
+    path = tmp_path / "twin.xlsx"
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.mark.parametrize("standardize", [True, False])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_one_and_two_sheet_loads_share_columns(twin_workbook_path, standardize, workers):
+    single = list(iter_raw_survey_data(twin_workbook_path, 0, standardize=standardize))
+    both = list(iter_raw_survey_data(twin_workbook_path, ["S1", "S2"], standardize=standardize))
+    loaded = load_survey_workbook(twin_workbook_path, None, workers=workers, standardize=standardize)
+
+    expected = ["course_name", "instructor_name", "score"] if standardize else ["과정명", "강사명", "점수"]
+    assert list(single[0].columns) == expected
+    assert [list(chunk.columns) for chunk in both] == [[*expected, SHEET_ORIGIN_COLUMN]] * 2
+    assert list(loaded.columns) == [*expected, SHEET_ORIGIN_COLUMN]